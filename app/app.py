@@ -1,9 +1,34 @@
-from app.reporter import Reporter
+import argparse
+import asyncio
+from config import config
+
+def run_threaded():
+	from app.reporter import Reporter
 
-def main():
 	reporter = Reporter()
 	slackbot_client = reporter.get_slackbot_client()
 	reporter.begin_slackbot_listen(slackbot_client)
 
+def run_async():
+	from app.async_reporter import AsyncReporter
+
+	reporter = AsyncReporter()
+	asyncio.run(reporter.begin_slackbot_listen())
+
+def main():
+	parser = argparse.ArgumentParser(description="Slack -> Jira feedback bot")
+	parser.add_argument(
+		"--mode",
+		choices=["threaded", "async"],
+		default=config.APP_MODE,
+		help="Event processing engine (default: APP_MODE env var, or threaded)"
+	)
+	args = parser.parse_args()
+
+	if args.mode == "async":
+		run_async()
+	else:
+		run_threaded()
+
 if __name__ == "__main__":
-	main()
\ No newline at end of file
+	main()
@@ -0,0 +1,141 @@
+from helpers.formatter import Formatter
+from slack_sdk.socket_mode.aiohttp import SocketModeClient
+from slack_sdk.socket_mode.response import SocketModeResponse
+from slack_sdk.socket_mode.request import SocketModeRequest
+from integrations.slack.async_slack import AsyncSlackBot
+from integrations.jira.async_jira_handler import AsyncJiraHandler
+from app.models.JiraTicket import JiraTicket
+from app.reporter import TICKET_ASSIGNEES, parse_slack_event
+from app.dedup import EventDeduplicator, event_dedup_keys
+from typing import Dict, Any, Optional
+import asyncio
+import traceback
+from config import config
+from logger import log
+
+class AsyncReporter:
+    """
+    asyncio variant of `Reporter`. Every Slack event becomes a task on a single
+    event loop, so hundreds of tickets can be in flight without a thread each.
+
+    Only the core flow is supported: events are deduplicated, parsed, created in
+    Jira and replied to. The Jira circuit breaker, the event journal (replay after a
+    crash), parking tickets while Jira is down, bulk creation and the paced reply
+    dispatcher are threaded-engine only.
+    """
+
+    def __init__(self, max_in_flight: int = config.ASYNC_MAX_IN_FLIGHT):
+        """
+        Args:
+            max_in_flight (int): Maximum number of Slack events processed concurrently.
+        """
+        self.jh = AsyncJiraHandler()
+        self.formatter = Formatter()
+        self.slackbot = AsyncSlackBot()
+        self.deduplicator = EventDeduplicator()
+        self.max_in_flight = max_in_flight
+        self.in_flight: Optional[asyncio.Semaphore] = None
+        self.tasks = set()
+
+    async def slackbot_listener(self, client: SocketModeClient, req: SocketModeRequest) -> None:
+        """
+        Acknowledges incoming Slack events and schedules their processing as a task.
+        Args:
+            client (SocketModeClient): asyncio Slack client instance.
+            req (SocketModeRequest): Incoming Slack event payload.
+        """
+
+        # Responds to Slack
+        response = SocketModeResponse(envelope_id=req.envelope_id)
+        await client.send_socket_mode_response(response)
+
+        if self.deduplicator.is_duplicate(event_dedup_keys(req.payload)):
+            log.log(f"Duplicate Slack event dropped (retry attempt {req.retry_attempt}, reason {req.retry_reason})")
+            return
+
+        task = asyncio.create_task(self.process_slack_event(req.payload))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def process_slack_event(self, slack_event: Dict[str, Any]) -> None:
+        async with self.in_flight:
+            try:
+                await self._process_slack_event(slack_event)
+            except Exception:
+                log.log(f"UNHANDLED ERROR PROCESSING EVENT: {traceback.format_exc()}", "error")
+
+    async def _process_slack_event(self, slack_event: Dict[str, Any]) -> None:
+
+        event = parse_slack_event(self.formatter, slack_event)
+        if event is None: return
+
+        event_channel = event['channel']
+        message_timestamp = event['ts']
+        feedback_message_content = event['content']
+        feedback_ticket_type = feedback_message_content.get('ticket_type', None)
+
+        if feedback_ticket_type in TICKET_ASSIGNEES:
+            ticket_assignee = TICKET_ASSIGNEES[feedback_ticket_type]
+
+            jira_issue_key, assigned = await self.submit_jira_ticket(
+                payload=feedback_message_content,
+                assignee_id=config.JIRA_ASSIGNEE_ID_DICT[ticket_assignee]
+            )
+            if jira_issue_key:
+                log.log(f"Jira issue {jira_issue_key} created and assigned to {ticket_assignee}: {assigned}")
+                reply_content = "Jira Issue Key: " + jira_issue_key
+                if assigned:
+                    reply_content += f"\nJira issue assigned to {ticket_assignee}."
+                else:
+                    reply_content += f"\nThere was an error assigning the Jira ticket to {ticket_assignee}."
+            else:
+                reply_content = "There was an error submitting the Jira ticket."
+                log.log("ERROR SUBMITTING JIRA TICKET")
+
+        else:
+            reply_content = "No Jira ticket created for this feedback message."
+            log.log(reply_content)
+
+        await self.slackbot.reply_to_alert(channel=event_channel, ts=message_timestamp, content=reply_content)
+
+    async def submit_jira_ticket(self, payload, assignee_id=None):
+        """
+        asyncio counterpart of `Reporter.submit_jira_ticket`: creates the ticket with its
+        create-time fields, assigning separately only if Jira rejected the assignee.
+
+        Returns:
+            tuple: The issue key (None if creation failed) and whether the ticket is assigned.
+        """
+        ticket_payload, ticket_url = JiraTicket.format_ser_jira_ticket(
+            assignee_id=assignee_id,
+            sprint_id=config.JIRA_CREATE_SPRINT_ID,
+            labels=config.JIRA_TICKET_LABELS,
+            **payload
+        )
+        issue_key, rejected_fields = await self.jh.create_jira_ticket(ticket_payload, ticket_url)
+        if not issue_key:
+            return None, False
+
+        assigned = bool(assignee_id)
+        if "assignee" in rejected_fields:
+            log.log(f"Assignee rejected at create time. Assigning {issue_key} separately.")
+            assigned = await self.jh.assign_ticket(issue_key, assignee_id)
+        if config.JIRA_SPRINT_FIELD_ID in rejected_fields:
+            log.log(f"Sprint rejected at create time. {issue_key} was created outside sprint {config.JIRA_CREATE_SPRINT_ID}.", "warning")
+
+        return issue_key, assigned
+
+    async def begin_slackbot_listen(self) -> None:
+        self.in_flight = asyncio.Semaphore(self.max_in_flight)
+        client = self.slackbot.client
+        client.socket_mode_request_listeners.append(self.slackbot_listener)
+        await client.connect()
+
+        log.log("BOT IS LISTENING! (asyncio mode)")
+        log.log("asyncio mode does not use the Jira circuit breaker, event journal, ticket parking, bulk creation or reply dispatcher", "warning")
+
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await client.close()
+            await self.jh.close()
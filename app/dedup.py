@@ -0,0 +1,139 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Any, List, Optional
+import sqlite3
+import time
+from config import config
+
+def event_dedup_keys(slack_event: Dict[str, Any]) -> List[str]:
+    """
+    Lists the identities of a Socket Mode events_api payload. Redelivered envelopes
+    carry the same `event_id`; the channel + message `ts` pair also catches the same
+    message arriving under a new event id.
+
+    Args:
+        slack_event (Dict[str, Any]): The Socket Mode payload.
+
+    Returns:
+        List[str]: Dedup keys for the event (empty if it has no usable identity).
+    """
+    keys = []
+    event_id = slack_event.get('event_id')
+    if event_id:
+        keys.append(f"event:{event_id}")
+
+    payload_event = slack_event.get('event') or {}
+    channel, ts = payload_event.get('channel'), payload_event.get('ts')
+    if channel and ts:
+        keys.append(f"message:{channel}:{ts}")
+
+    return keys
+
+class EventDeduplicator:
+    """
+    Bounded TTL/LRU set of recently seen Slack events, so a redelivered envelope is
+    dropped before it is parsed or turned into a second Jira issue. Optionally
+    persisted to SQLite so the cache survives a restart (which is exactly when
+    Socket Mode redelivers).
+    """
+
+    def __init__(
+        self,
+        ttl: float = config.EVENT_DEDUP_TTL,
+        max_size: int = config.EVENT_DEDUP_MAX_SIZE,
+        filepath: Optional[str] = config.EVENT_DEDUP_FILEPATH
+    ) -> None:
+        """
+        Args:
+            ttl (float): Seconds an event is remembered.
+            max_size (int): Maximum number of remembered keys; the least recently seen are evicted first.
+            filepath (Optional[str]): SQLite file to persist seen keys in, or None for memory only.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.seen: "OrderedDict[str, float]" = OrderedDict()
+        self.lock = Lock()
+        self.connection = None
+        self.writes_since_prune = 0
+
+        if filepath:
+            self.connection = sqlite3.connect(filepath, check_same_thread=False, isolation_level=None)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS seen_events (key TEXT PRIMARY KEY, seen_at REAL NOT NULL)")
+            self._load()
+
+    def is_duplicate(self, keys: List[str]) -> bool:
+        """
+        Checks the event's keys and remembers them in one atomic step.
+
+        Args:
+            keys (List[str]): Dedup keys from `event_dedup_keys`.
+
+        Returns:
+            bool: True if any key was seen within the TTL.
+        """
+        if not keys:
+            return False
+
+        now = time.time()
+        with self.lock:
+            self._evict(now)
+            duplicate = any(key in self.seen for key in keys)
+            for key in keys:
+                self.seen[key] = now
+                self.seen.move_to_end(key)
+            while len(self.seen) > self.max_size:
+                self.seen.popitem(last=False)
+
+            if self.connection is not None:
+                self._persist(keys, now)
+
+        return duplicate
+
+    def was_seen(self, keys: List[str]) -> bool:
+        """
+        Checks the event's keys without remembering them.
+
+        Args:
+            keys (List[str]): Dedup keys from `event_dedup_keys`.
+
+        Returns:
+            bool: True if any key was seen within the TTL.
+        """
+        if not keys:
+            return False
+
+        with self.lock:
+            self._evict(time.time())
+            return any(key in self.seen for key in keys)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.seen)
+
+    def _evict(self, now: float) -> None:
+        # Entries are kept in the order they were last seen, so expired ones are at the front
+        while self.seen:
+            key, seen_at = next(iter(self.seen.items()))
+            if now - seen_at < self.ttl:
+                break
+            del self.seen[key]
+
+    def _load(self) -> None:
+        cutoff = time.time() - self.ttl
+        rows = self.connection.execute(
+            "SELECT key, seen_at FROM seen_events WHERE seen_at > ? ORDER BY seen_at DESC LIMIT ?",
+            (cutoff, self.max_size)
+        ).fetchall()
+        for key, seen_at in reversed(rows):
+            self.seen[key] = seen_at
+
+    def _persist(self, keys: List[str], now: float) -> None:
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO seen_events (key, seen_at) VALUES (?, ?)",
+            [(key, now) for key in keys]
+        )
+        self.writes_since_prune += 1
+        if self.writes_since_prune >= 1000:
+            self.connection.execute("DELETE FROM seen_events WHERE seen_at <= ?", (now - self.ttl,))
+            self.writes_since_prune = 0
@@ -0,0 +1,101 @@
+from threading import Lock
+from typing import Dict, Any, List, Optional
+import json
+import sqlite3
+import time
+from config import config
+
+class DeferredTicketQueue:
+    """
+    Durable FIFO of tickets that could not be created because Jira was down.
+    Backed by SQLite so parked tickets survive a restart; each entry keeps the
+    Slack thread it came from so the eventual reply lands in the right place.
+    """
+
+    def __init__(self, filepath: str = config.DEFERRED_TICKETS_FILEPATH) -> None:
+        """
+        Args:
+            filepath (str): Path of the SQLite database file.
+        """
+        self.lock = Lock()
+        self.connection = sqlite3.connect(filepath, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=FULL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS deferred_tickets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                channel TEXT NOT NULL,
+                ts TEXT NOT NULL,
+                ticket_assignee TEXT,
+                payload TEXT NOT NULL,
+                parked_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+
+    def park(self, channel: str, ts: str, payload: Dict[str, Any], ticket_assignee: Optional[str] = None) -> int:
+        """
+        Stores a ticket until Jira is reachable again.
+
+        Args:
+            channel (str): The Slack channel of the original message.
+            ts (str): The Slack thread timestamp to reply to.
+            payload (Dict[str, Any]): The feedback fields parsed from the Slack payload.
+            ticket_assignee (Optional[str]): Key into `config.JIRA_ASSIGNEE_ID_DICT`.
+
+        Returns:
+            int: The id of the parked ticket.
+        """
+        with self.lock:
+            cursor = self.connection.execute(
+                "INSERT INTO deferred_tickets (channel, ts, ticket_assignee, payload, parked_at) VALUES (?, ?, ?, ?, ?)",
+                (channel, ts, ticket_assignee, json.dumps(payload), time.time())
+            )
+            return cursor.lastrowid
+
+    def peek(self, limit: int = 1) -> List[Dict[str, Any]]:
+        """
+        Returns the oldest parked tickets without removing them.
+
+        Args:
+            limit (int): Maximum number of tickets to return.
+
+        Returns:
+            List[Dict[str, Any]]: Parked tickets, oldest first.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT id, channel, ts, ticket_assignee, payload, parked_at, attempts FROM deferred_tickets ORDER BY id LIMIT ?",
+                (limit,)
+            ).fetchall()
+
+        return [
+            {
+                "id": row[0],
+                "channel": row[1],
+                "ts": row[2],
+                "ticket_assignee": row[3],
+                "payload": json.loads(row[4]),
+                "parked_at": row[5],
+                "attempts": row[6]
+            }
+            for row in rows
+        ]
+
+    def record_attempt(self, ticket_id: int) -> None:
+        with self.lock:
+            self.connection.execute("UPDATE deferred_tickets SET attempts = attempts + 1 WHERE id = ?", (ticket_id,))
+
+    def remove(self, ticket_id: int) -> None:
+        with self.lock:
+            self.connection.execute("DELETE FROM deferred_tickets WHERE id = ?", (ticket_id,))
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM deferred_tickets").fetchone()[0]
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
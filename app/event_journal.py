@@ -0,0 +1,257 @@
+from threading import Thread, Condition
+from typing import Dict, Any, List, Optional
+import copy
+import json
+import os
+import time
+import traceback
+from app.dedup import event_dedup_keys
+from config import config
+from logger import log
+
+class EventJournalError(Exception):
+    """Raised to a durable writer when its record could not be fsynced in time."""
+
+def event_journal_id(slack_event: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns the id an event is journaled under: its primary dedup key.
+
+    Args:
+        slack_event (Dict[str, Any]): The Socket Mode payload.
+
+    Returns:
+        Optional[str]: The journal id, or None if the event has no usable identity.
+    """
+    keys = event_dedup_keys(slack_event)
+    return keys[0] if keys else None
+
+class EventJournal:
+    """
+    Append-only, write-ahead journal of Slack events. An event is journaled before
+    it is acknowledged, and each step of its processing (parsed, jira_created,
+    assigned, replied) is recorded as it completes, so after a crash only the
+    incomplete steps are redone.
+
+    Records are JSON lines written by a single background thread that fsyncs a
+    whole group of records at once (group commit), so concurrent writers share
+    one fsync. Completed events are dropped when the journal is compacted. Records
+    whose write fails are kept and retried in order; durable writers waiting on them
+    get an `EventJournalError` instead of blocking.
+    """
+
+    STATES = ["received", "parsed", "jira_created", "assigned", "replied"]
+    TERMINAL_STATES = {"replied", "done", "failed"}
+
+    def __init__(
+        self,
+        filepath: str = config.EVENT_JOURNAL_FILEPATH,
+        commit_interval: float = config.EVENT_JOURNAL_COMMIT_INTERVAL,
+        compact_bytes: int = config.EVENT_JOURNAL_COMPACT_BYTES,
+        durable_timeout: float = config.EVENT_JOURNAL_DURABLE_TIMEOUT
+    ) -> None:
+        """
+        Args:
+            filepath (str): Path of the JSONL journal file.
+            commit_interval (float): Extra seconds the writer waits for more records to
+                join a group before fsyncing. 0 only groups records that arrive during
+                the previous fsync.
+            compact_bytes (int): Bytes appended since the last rewrite that trigger a new
+                rewrite keeping only incomplete events.
+            durable_timeout (float): Seconds a durable `record` waits for its fsync.
+        """
+        self.filepath = filepath
+        self.commit_interval = commit_interval
+        self.compact_bytes = compact_bytes
+        self.durable_timeout = durable_timeout
+        self.condition = Condition()
+        self.buffer: List[str] = []
+        self.appended = 0
+        self.committed = 0
+        self.failed_through = 0
+        self.write_error: Optional[BaseException] = None
+        self.open_events = self._replay()
+        self._rewrite_journal()
+        self.journal_file = open(self.filepath, 'a', encoding='utf-8')
+        self.journal_bytes = self.snapshot_bytes = self.journal_file.tell()
+        self.thread = Thread(target=self._run, name="event-journal", daemon=True)
+
+    def start(self) -> None:
+        """Starts the background writer thread."""
+        self.thread.start()
+
+    def record(
+        self,
+        event_id: str,
+        state: str,
+        payload: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        durable: bool = False
+    ) -> None:
+        """
+        Appends a state change for an event.
+
+        Args:
+            event_id (str): The event's journal id (see `event_journal_id`).
+            state (str): One of `STATES`, "done" for events that need no further work, or
+                "failed" for events whose processing raised and must not be replayed.
+            payload (Optional[Dict[str, Any]]): The Slack payload, recorded with "received".
+            data (Optional[Dict[str, Any]]): Step results to keep (e.g. the issue key).
+            durable (bool): Wait until the record has been fsynced.
+
+        Raises:
+            EventJournalError: If `durable` and the record could not be fsynced, or was not
+                fsynced within `durable_timeout`. The record is still retried in the background.
+        """
+        record = {"id": event_id, "state": state, "at": time.time()}
+        if payload is not None:
+            record["payload"] = payload
+        if data:
+            record["data"] = data
+        line = json.dumps(record, separators=(',', ':'))
+
+        with self.condition:
+            self._apply(self.open_events, record)
+            self.buffer.append(line)
+            self.appended += 1
+            sequence = self.appended
+            self.condition.notify_all()
+
+            if durable:
+                deadline = time.monotonic() + self.durable_timeout
+                while self.committed < sequence:
+                    if sequence <= self.failed_through:
+                        raise EventJournalError(f"Failed to write the event journal: {self.write_error}")
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise EventJournalError(f"Event journal write not fsynced within {self.durable_timeout}s")
+                    self.condition.wait(remaining)
+
+    def get(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the folded state of an incomplete event.
+
+        Returns:
+            Optional[Dict[str, Any]]: The event's id, state, payload and step data, or
+            None if the event is unknown or complete.
+        """
+        with self.condition:
+            event = self.open_events.get(event_id)
+            return copy.deepcopy(event) if event else None
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """
+        Lists the events a previous run acknowledged but did not finish, oldest first.
+
+        Returns:
+            List[Dict[str, Any]]: Folded events that still have a payload to replay.
+        """
+        with self.condition:
+            return [copy.deepcopy(event) for event in self.open_events.values() if event["payload"] is not None]
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.buffer:
+                    self.condition.wait()
+
+            if self.commit_interval > 0:
+                time.sleep(self.commit_interval)
+
+            try:
+                self._commit()
+            except Exception:
+                log.log(f"UNHANDLED ERROR WRITING EVENT JOURNAL: {traceback.format_exc()}", "error")
+                time.sleep(1)
+
+    def _commit(self) -> None:
+        with self.condition:
+            lines, self.buffer = self.buffer, []
+            sequence = self.appended
+
+        data = '\n'.join(lines) + '\n'
+        try:
+            self.journal_file.write(data)
+            self.journal_file.flush()
+            os.fsync(self.journal_file.fileno())
+        except Exception as e:
+            self._reopen_after_failed_write()
+            with self.condition:
+                # Put the records back ahead of newer ones, so they are retried in order
+                self.buffer = lines + self.buffer
+                self.failed_through = sequence
+                self.write_error = e
+                self.condition.notify_all()
+            raise
+        self.journal_bytes += len(data.encode('utf-8'))
+
+        with self.condition:
+            self.committed = sequence
+            self.write_error = None
+            self.condition.notify_all()
+
+            if self.journal_bytes - self.snapshot_bytes >= self.compact_bytes:
+                # Appenders are held off while the journal is swapped; buffered records are
+                # already folded into open_events, so the snapshot covers them too
+                self.journal_file.close()
+                try:
+                    self._rewrite_journal()
+                except Exception:
+                    # The old journal is intact, so keep appending to it
+                    self.journal_file = open(self.filepath, 'a', encoding='utf-8')
+                    raise
+                self.buffer = []
+                self.committed = self.appended
+                self.journal_file = open(self.filepath, 'a', encoding='utf-8')
+                self.journal_bytes = self.snapshot_bytes = self.journal_file.tell()
+                self.condition.notify_all()
+                log.log(f"Event journal compacted to {len(self.open_events)} incomplete events")
+
+    def _reopen_after_failed_write(self) -> None:
+        # Drop whatever part of the failed write reached the file, so the retry does not
+        # leave a torn line in the middle of the journal
+        try:
+            self.journal_file.close()
+        except Exception:
+            pass
+        try:
+            os.truncate(self.filepath, self.journal_bytes)
+        except OSError:
+            pass
+        self.journal_file = open(self.filepath, 'a', encoding='utf-8')
+
+    def _replay(self) -> Dict[str, Dict[str, Any]]:
+        events = {}
+        if not os.path.exists(self.filepath):
+            return events
+
+        with open(self.filepath, 'r', encoding='utf-8') as journal_file:
+            for line in journal_file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write
+                    log.log(f"Skipping unreadable event journal line: {line!r}", "warning")
+                    continue
+                self._apply(events, record)
+
+        return events
+
+    def _apply(self, events: Dict[str, Dict[str, Any]], record: Dict[str, Any]) -> None:
+        if record["state"] in self.TERMINAL_STATES:
+            events.pop(record["id"], None)
+            return
+
+        event = events.setdefault(record["id"], {"id": record["id"], "state": None, "payload": None, "data": {}})
+        event["state"] = record["state"]
+        if "payload" in record:
+            event["payload"] = record["payload"]
+        event["data"].update(record.get("data", {}))
+
+    def _rewrite_journal(self) -> None:
+        temp_filepath = self.filepath + '.tmp'
+        with open(temp_filepath, 'w', encoding='utf-8') as journal_file:
+            for event in self.open_events.values():
+                journal_file.write(json.dumps(event, separators=(',', ':')) + '\n')
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        os.replace(temp_filepath, self.filepath)
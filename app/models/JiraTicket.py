@@ -5,7 +5,22 @@ class JiraTicket:
         pass
     
     @staticmethod
-    def format_ser_jira_ticket(**details):
+    def format_ser_jira_ticket(assignee_id=None, sprint_id=None, labels=None, **details):
+        """
+        Builds the Jira create-issue payload for a parsed feedback message.
+
+        The assignee, sprint and labels are set at create time when given, so the
+        ticket does not need follow-up requests for them.
+
+        Args:
+            assignee_id (str, optional): Jira account ID to assign the issue to.
+            sprint_id (str, optional): Sprint to create the issue in.
+            labels (list, optional): Labels to add to the issue.
+            **details: The fields parsed from the Slack payload.
+
+        Returns:
+            tuple: The payload and the create-issue URL.
+        """
         url = f"{config.JIRA_BASE_URL}/rest/api/3/issue"
                 
         if details['click_type'] == 'thumbsdown':
@@ -59,6 +74,13 @@ class JiraTicket:
             }
         }
         
+        if assignee_id:
+            payload["fields"]["assignee"] = {"id": assignee_id}
+        if sprint_id:
+            payload["fields"][config.JIRA_SPRINT_FIELD_ID] = int(sprint_id)
+        if labels:
+            payload["fields"]["labels"] = list(labels)
+        
         # # TEST DATA
         # payload = {
 		# 	"fields": {
@@ -95,6 +117,22 @@ class JiraTicket:
         
         return payload, url
     
+    @staticmethod
+    def optional_create_fields():
+        """
+        Fields set by `format_ser_jira_ticket` that the issue can be created without,
+        if Jira rejects them (e.g. the assignee is not assignable in the project).
+        """
+        return ["assignee", "labels", config.JIRA_SPRINT_FIELD_ID]
+    
+    @staticmethod
+    def without_fields(payload, field_names):
+        """
+        Returns a copy of a create-issue payload with the given fields removed.
+        """
+        fields = {name: value for name, value in payload["fields"].items() if name not in field_names}
+        return {**payload, "fields": fields}
+    
 # Payload to be sent to Jira.
 # payload = {
 # 			"fields": {
@@ -0,0 +1,140 @@
+from queue import Queue, Full, Empty
+from threading import Thread, Lock, Event
+from typing import Callable, Dict, Any
+import time
+import traceback
+from config import config
+from logger import log
+
+class EventPipeline:
+    """
+    Bounded work queue plus a pool of worker threads. Decouples acknowledging a
+    Slack envelope from the (slow) parsing / Jira / reply work done for it.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], None],
+        worker_count: int = config.EVENT_WORKER_COUNT,
+        max_queue_size: int = config.EVENT_QUEUE_MAXSIZE,
+        enqueue_timeout: float = config.EVENT_ENQUEUE_TIMEOUT
+    ) -> None:
+        """
+        Args:
+            handler (Callable): Function called with each queued Slack event.
+            worker_count (int): Number of worker threads processing events.
+            max_queue_size (int): Maximum number of events waiting to be processed.
+            enqueue_timeout (float): Seconds `submit` waits for room in a full queue
+                before the event is rejected.
+        """
+        self.handler = handler
+        self.worker_count = worker_count
+        self.enqueue_timeout = enqueue_timeout
+        self.queue = Queue(maxsize=max_queue_size)
+        self.workers = []
+        self.stopped = Event()
+
+        self.metrics_lock = Lock()
+        self.metrics = {
+            "submitted": 0,
+            "rejected": 0,
+            "processed": 0,
+            "failed": 0,
+            "max_queue_depth": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "total_processing_time": 0.0,
+            "max_processing_time": 0.0
+        }
+
+    def start(self) -> None:
+        """Starts the worker threads."""
+        self.stopped.clear()
+        for i in range(self.worker_count):
+            worker = Thread(target=self._work, name=f"event-worker-{i}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+        log.log(f"Event pipeline started with {self.worker_count} workers")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stops the workers once the queue has been drained or the timeout expires.
+
+        Args:
+            timeout (float): Seconds to wait for each worker to finish.
+        """
+        self.stopped.set()
+        for worker in self.workers:
+            worker.join(timeout)
+        self.workers = []
+
+    def submit(self, event: Dict[str, Any], wait: bool = False) -> bool:
+        """
+        Queues an event for processing, waiting up to `enqueue_timeout` if the queue is full.
+
+        Args:
+            event (Dict[str, Any]): The Slack event payload.
+            wait (bool): Wait for room however long it takes instead (e.g. when replaying a backlog).
+
+        Returns:
+            bool: True if the event was queued, False if it was rejected due to backpressure.
+        """
+        try:
+            self.queue.put((time.monotonic(), event), timeout=None if wait else self.enqueue_timeout)
+        except Full:
+            with self.metrics_lock:
+                self.metrics["rejected"] += 1
+            log.log(f"Event queue full ({self.queue.maxsize}). Dropping event.", "warning")
+            return False
+
+        with self.metrics_lock:
+            self.metrics["submitted"] += 1
+            self.metrics["max_queue_depth"] = max(self.metrics["max_queue_depth"], self.queue.qsize())
+        return True
+
+    def _work(self) -> None:
+        while not (self.stopped.is_set() and self.queue.empty()):
+            try:
+                enqueued_at, event = self.queue.get(timeout=0.5)
+            except Empty:
+                continue
+
+            started_at = time.monotonic()
+            failed = False
+            try:
+                self.handler(event)
+            except Exception:
+                failed = True
+                log.log(f"UNHANDLED ERROR PROCESSING EVENT: {traceback.format_exc()}", "error")
+            finally:
+                finished_at = time.monotonic()
+                self.queue.task_done()
+                self._record(started_at - enqueued_at, finished_at - started_at, failed)
+
+    def _record(self, wait_time: float, processing_time: float, failed: bool) -> None:
+        with self.metrics_lock:
+            self.metrics["processed"] += 1
+            if failed:
+                self.metrics["failed"] += 1
+            self.metrics["total_wait_time"] += wait_time
+            self.metrics["max_wait_time"] = max(self.metrics["max_wait_time"], wait_time)
+            self.metrics["total_processing_time"] += processing_time
+            self.metrics["max_processing_time"] = max(self.metrics["max_processing_time"], processing_time)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the backpressure metrics.
+
+        Returns:
+            Dict[str, Any]: Current queue depth, counters, and average / max wait and
+            processing times in seconds.
+        """
+        with self.metrics_lock:
+            snapshot = dict(self.metrics)
+
+        processed = snapshot["processed"]
+        snapshot["queue_depth"] = self.queue.qsize()
+        snapshot["avg_wait_time"] = snapshot["total_wait_time"] / processed if processed else 0.0
+        snapshot["avg_processing_time"] = snapshot["total_processing_time"] / processed if processed else 0.0
+        return snapshot
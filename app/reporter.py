@@ -1,4 +1,4 @@
-from helpers.formatter import Formatter
+from helpers.formatter import Formatter, SlackPayloadParseError
 from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.web import WebClient
 from slack_sdk.socket_mode.response import SocketModeResponse
@@ -6,112 +6,287 @@ from slack_sdk.socket_mode.request import SocketModeRequest
 from threading import Event, Thread
 from integrations.slack.slack import SlackBot
 from integrations.google.google import Google_handler
+from integrations.google.gmail_batcher import GmailBatcher
+from integrations.google.sheets_appender import SheetsAppender
 from integrations.google.templates.mail import customer_issue_template
 from pprint import pprint
 from integrations.jira.jira_handler import Jira_Handler
+from integrations.jira.bulk_creator import JiraBulkIssueCreator
+from integrations.jira.circuit_breaker import JiraUnavailableError
 from app.models.JiraTicket import JiraTicket
-from typing import List, Dict, Any
+from app.pipeline import EventPipeline
+from app.deferred_tickets import DeferredTicketQueue
+from app.dedup import EventDeduplicator, event_dedup_keys
+from app.event_journal import EventJournal, EventJournalError, event_journal_id
+from typing import List, Dict, Any, Optional
+import time
 import traceback
 from config import config
 from logger import log
 
+TICKET_ASSIGNEES = {
+    'Bug': 'QA Team',
+    'Task': 'Project Manager'
+}
+
+def parse_slack_event(formatter: Formatter, slack_event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Filters a Slack event down to the monitoring bot messages we act on and parses
+    its feedback content. Shared by the threaded and asyncio reporters.
+
+    Args:
+        formatter (Formatter): Formatter used to parse the payload.
+        slack_event (Dict[str, Any]): The Socket Mode payload.
+
+    Returns:
+        Optional[Dict[str, Any]]: The event channel, message timestamp and parsed content,
+        or None if the event should not be processed.
+    """
+    log.log("Slack event...")
+    payload_event = slack_event['event']
+    event_bot_id = payload_event.get('bot_id', '')
+    if config.BOT_ID_DICT.get(event_bot_id) == "SERVE_AI_SUPPORT_BOT_ID": return # Skip processing for support bot events
+    event_channel = config.CHANNEL_ID_DICT.get(payload_event.get('channel', ''))
+    if event_channel is None:
+        log.log(f"Slack event from unknown channel {payload_event.get('channel')}. Not processing.")
+        return
+    message_timestamp = payload_event['ts']
+    if event_bot_id: log.log(f"EVENT BOT ID: {event_bot_id}", "debug")
+    if event_bot_id in config.BOT_ID_DICT.keys():
+        log.log(f"Incoming event from {event_channel}. Processing...")
+        log.log(lambda: f"EVENT PAYLOAD: {slack_event}", "debug")
+
+        try:
+            feedback_message_content = formatter.parse_slack_payload(event_channel, slack_event)
+            log.log(f'FEEDBACK MESSAGE CONTENT: {feedback_message_content}')
+
+        except SlackPayloadParseError as e:
+            log.log(f"Slack payload could not be parsed, likely not a feedback message: {e}")
+            return
+
+        except Exception as e:
+            log.log(f"UNHANDLED ERROR WHEN PARSING SLACK PAYLOAD: {traceback.format_exc()})")
+            return
+
+        if not isinstance(feedback_message_content, dict):
+            log.log("Slack payload did not produce feedback content. Not processing.")
+            return
+        
+    else:
+        log.log("Slack event not generated by monitoring bot. Not processing.")
+        if event_channel == "bot-testing":
+            log.log("Event from bot-testing channel")
+        log.log(lambda: f"EVENT PAYLOAD: {slack_event}", "debug")
+        return
+
+    return {
+        'channel': event_channel,
+        'ts': message_timestamp,
+        'content': feedback_message_content
+    }
+
 class Reporter:
     
     def __init__(self):
         self.gh = Google_handler()
         self.jh = Jira_Handler()
+        if config.TRACE_INDEX_ENABLED:
+            self.jh.get_trace_index()
         self.formatter = Formatter()
         self.slackbot = SlackBot()
+        self.pipeline = EventPipeline(handler=self.process_slack_event)
+        self.deduplicator = EventDeduplicator()
+        self.journal = EventJournal()
+        self.journal.start()
+        self.email_batcher = GmailBatcher(self.gh)
+        self.email_batcher.start()
+        self.sheets_appender = SheetsAppender(self.gh)
+        self.sheets_appender.start()
+        self.bulk_creator = None
+        if config.JIRA_BULK_CREATE_ENABLED:
+            self.bulk_creator = JiraBulkIssueCreator(self.jh)
+            self.bulk_creator.start()
+        self.deferred_tickets = DeferredTicketQueue()
 
     def slackbot_listener(self, client: SocketModeClient, req: SocketModeRequest) -> None:
         """
-        Handles incoming Slack events and determines if they should be queued for processing.
-        Filters out events not sent by the designated monitoring bot.
+        Acknowledges incoming Slack events and queues them on the event pipeline,
+        where worker threads run `process_slack_event`. Redelivered events are
+        dropped before they are queued; new ones are written to the event journal
+        before they are acknowledged or remembered as seen. An event that cannot be
+        journaled is left unacknowledged, so Slack delivers it again.
         Args:
             client (SocketModeClient): Slack client instance.
             req (SocketModeRequest): Incoming Slack event payload.
         """
 
+        dedup_keys = event_dedup_keys(req.payload)
+        if dedup_keys and not self.deduplicator.was_seen(dedup_keys):
+            try:
+                self.journal.record(event_journal_id(req.payload), "received", payload=req.payload, durable=True)
+            except EventJournalError as e:
+                log.log(f"EVENT NOT JOURNALED, LEFT UNACKNOWLEDGED: {e}", "error")
+                return
+        duplicate = self.deduplicator.is_duplicate(dedup_keys)
+
         # Responds to Slack
         response = SocketModeResponse(envelope_id=req.envelope_id)
         client.send_socket_mode_response(response)
 
-        self.process_slack_event(req.payload) 
-
-    def process_slack_event(self, slack_event) -> None:
+        if duplicate:
+            log.log(f"Duplicate Slack event dropped (retry attempt {req.retry_attempt}, reason {req.retry_reason})")
+            return
 
-        log.log("Slack event...")
-        payload_event = slack_event['event']
-        event_bot_id = payload_event.get('bot_id', '')
-        if config.BOT_ID_DICT[event_bot_id] == "SERVE_AI_SUPPORT_BOT_ID": return # Skip processing for support bot events
-        event_channel = config.CHANNEL_ID_DICT[payload_event.get('channel', '')]
-        message_timestamp = payload_event['ts']
-        if event_bot_id: print("EVENT BOT ID:", event_bot_id)
-        if event_bot_id in config.BOT_ID_DICT.keys():
-            log.log(f"Incoming event from {event_channel}. Processing...")
-            log.log(f"EVENT PAYLOAD: {slack_event}")
+        self.pipeline.submit(req.payload)
 
-            try:
-                feedback_message_content = self.formatter.parse_slack_payload(event_channel, slack_event)
-                feedback_ticket_type = feedback_message_content.get('ticket_type', None)
-                log.log(f'FEEDBACK MESSAGE CONTENT: {feedback_message_content}')
+    def process_slack_event(self, slack_event) -> None:
+        """
+        Processes one Slack event on a pipeline worker. If processing raises, the
+        event is journaled as "failed" so it is not replayed on every restart.
+        """
+        journal_id = event_journal_id(slack_event)
+        try:
+            self._process_slack_event(slack_event, journal_id)
+        except Exception:
+            if journal_id: self.journal.record(journal_id, "failed")
+            raise
 
-            except Exception as e:
-                log.log(f"UNHANDLED ERROR WHEN PARSING SLACK PAYLOAD: {traceback.format_exc()})")
-                return
-            
-        else:
-            log.log("Slack event not generated by monitoring bot. Not processing.")
-            if event_channel == "bot-testing":
-                log.log("Event from bot-testing channel")
-            log.log(f"EVENT PAYLOAD: {slack_event}")
+    def _process_slack_event(self, slack_event, journal_id) -> None:
+        event = parse_slack_event(self.formatter, slack_event)
+        if event is None:
+            if journal_id: self.journal.record(journal_id, "done")
             return
+        if journal_id and self._journal_state(journal_id) in (None, "received"):
+            # A replayed event keeps the later state it reached before the restart
+            self.journal.record(journal_id, "parsed")
 
+        event_channel = event['channel']
+        message_timestamp = event['ts']
+        feedback_message_content = event['content']
+        feedback_ticket_type = feedback_message_content.get('ticket_type', None)
 
-        if feedback_ticket_type in ['Bug', 'Task']:
-
-            if feedback_ticket_type == 'Bug':
-                ticket_assignee = 'QA Team'
-            elif feedback_ticket_type == 'Task':
-                ticket_assignee = 'Project Manager'
+        if feedback_ticket_type in TICKET_ASSIGNEES:
+            ticket_assignee = TICKET_ASSIGNEES[feedback_ticket_type]
 
             try:
-                jira_issue_key = self.submit_jira_ticket(payload=feedback_message_content)
-                log.log(f"Jira issue created with key: {jira_issue_key}")
-                reply_content = "Jira Issue Key: " + jira_issue_key
+                reply_content = self.create_ticket(feedback_message_content, ticket_assignee, journal_id)
+            except JiraUnavailableError as e:
+                self.deferred_tickets.park(event_channel, message_timestamp, feedback_message_content, ticket_assignee)
+                reply_content = "Jira is unavailable right now. The ticket has been queued and will be created once Jira recovers."
+                log.log(f"JIRA UNAVAILABLE, TICKET PARKED: {e}", "warning")
             except Exception as e:
                 reply_content = "There was an error submitting the Jira ticket."
                 log.log(f"ERROR SUBMITTING JIRA TICKET: {traceback.format_exc()}")
 
-            try:
-                log.log(f"Assigning Jira issue {jira_issue_key} assigned to {ticket_assignee}")
-                self.jh.assign_ticket(jira_issue_key, config.JIRA_ASSIGNEE_ID_DICT[ticket_assignee])
-                reply_content += f"\nJira issue assigned to {ticket_assignee}."
-            except Exception as e:
-                reply_content += f"\nThere was an error assigning the Jira ticket to {ticket_assignee}."
-                log.log(f"ERROR ASSIGNING JIRA TICKET: {traceback.format_exc()}")
-
         else:
             reply_content = "No Jira ticket created for this feedback message."
             log.log(reply_content)
         
-        if not event_bot_id or config.BOT_ID_DICT[event_bot_id] != "SERVE_AI_SUPPORT_BOT_ID":
-            self.slackbot.reply_to_alert(channel=event_channel,ts=message_timestamp, content=reply_content)  
+        on_sent = None
+        if journal_id:
+            on_sent = lambda sent: self.journal.record(journal_id, "replied", data={"sent": sent})
+        self.slackbot.reply_to_alert(channel=event_channel,ts=message_timestamp, content=reply_content, on_sent=on_sent)
                                 
+    def _journal_state(self, journal_id):
+        journaled = self.journal.get(journal_id)
+        return journaled["state"] if journaled else None
+
+    def create_ticket(self, payload, ticket_assignee, journal_id=None) -> str:
+        """
+        Creates and assigns the Jira ticket for a parsed feedback message.
+
+        Args:
+            payload (dict): The fields parsed from the Slack payload.
+            ticket_assignee (str): Key into `config.JIRA_ASSIGNEE_ID_DICT`, or a Jira display name.
+            journal_id (str, optional): Event journal id to record progress under.
+
+        Returns:
+            str: The reply to post in the originating Slack thread.
+
+        Raises:
+            JiraUnavailableError: If Jira is down and the ticket should be parked.
+        """
+        jira_issue_key, assigned = self.submit_jira_ticket(
+            payload=payload,
+            assignee_id=self.jh.get_assignee_id(ticket_assignee),
+            journal_id=journal_id
+        )
+        if jira_issue_key:
+            log.log(f"Jira issue {jira_issue_key} created and assigned to {ticket_assignee}: {assigned}")
+            reply_content = "Jira Issue Key: " + jira_issue_key
+            if assigned:
+                reply_content += f"\nJira issue assigned to {ticket_assignee}."
+            else:
+                reply_content += f"\nThere was an error assigning the Jira ticket to {ticket_assignee}."
+        else:
+            reply_content = "There was an error submitting the Jira ticket."
+            log.log("ERROR SUBMITTING JIRA TICKET: no issue key returned")
+
+        return reply_content
+
+    def drain_deferred_tickets(self) -> None:
+        """
+        Background loop creating the tickets parked while Jira was down, oldest first
+        and at most `DEFERRED_TICKETS_DRAIN_RATE` per second, then replying in each
+        ticket's original Slack thread. While Jira is still unavailable it waits
+        `DEFERRED_TICKETS_POLL_INTERVAL` between attempts.
+        """
+        while True:
+            tickets = self.deferred_tickets.peek()
+            if not tickets:
+                time.sleep(config.DEFERRED_TICKETS_POLL_INTERVAL)
+                continue
+
+            ticket = tickets[0]
+            try:
+                reply_content = self.create_ticket(ticket['payload'], ticket['ticket_assignee'])
+            except JiraUnavailableError:
+                self.deferred_tickets.record_attempt(ticket['id'])
+                time.sleep(config.DEFERRED_TICKETS_POLL_INTERVAL)
+                continue
+            except Exception:
+                reply_content = "There was an error submitting the Jira ticket."
+                log.log(f"ERROR SUBMITTING DEFERRED JIRA TICKET: {traceback.format_exc()}")
+
+            self.deferred_tickets.remove(ticket['id'])
+            log.log(f"Deferred ticket {ticket['id']} processed after {ticket['attempts']} failed attempts. {len(self.deferred_tickets)} left.")
+            self.slackbot.reply_to_alert(channel=ticket['channel'], ts=ticket['ts'], content=reply_content)
+            time.sleep(1 / config.DEFERRED_TICKETS_DRAIN_RATE)
+
+    def replay_event_journal(self) -> None:
+        """
+        Re-queues the events a previous run acknowledged but did not finish. Their
+        journaled progress is picked up by `process_slack_event`, so only the
+        incomplete steps are redone.
+        """
+        pending_events = self.journal.pending()
+        if not pending_events:
+            return
+
+        log.log(f"Replaying {len(pending_events)} incomplete events from the event journal")
+        for pending_event in pending_events:
+            # A Slack redelivery of a replayed event must not be processed a second time
+            self.deduplicator.is_duplicate(event_dedup_keys(pending_event["payload"]))
+            self.pipeline.submit(pending_event["payload"], wait=True)
+
     def get_slackbot_client(self):
         return self.slackbot.client
         
     def begin_slackbot_listen(self, client):
+        self.pipeline.start()
+        Thread(target=self.replay_event_journal, name="journal-replay", daemon=True).start()
+        Thread(target=self.drain_deferred_tickets, name="deferred-tickets", daemon=True).start()
         client.socket_mode_request_listeners.append(self.slackbot_listener)
         client.connect()
 
         log.log("BOT IS LISTENING!")
 
-        Event().wait()
+        while not Event().wait(config.EVENT_METRICS_LOG_INTERVAL):
+            log.log(f"EVENT PIPELINE METRICS: {self.pipeline.get_metrics()}")
+            log.log(f"DEFERRED TICKETS: {len(self.deferred_tickets)}")
         
         
     def email_issue(self, recipient_name, recipient_email, body, subject="Issue received by Genetica", sender_alias="support@getgenetica.com"):
-        service = self.gh.gmail_authenticate()
         message_text = customer_issue_template.format(recipient_name=recipient_name, body=body)
         sender_alias = 'support@getgenetica.com'  # must be an alias of authenticated account
         # recipient = 'client@example.com'
@@ -120,17 +295,70 @@ class Reporter:
         # print(f"Recipient email before creating message: {recipient_email}")
 
         message = self.gh.create_gmail_message(sender_alias=sender_alias, to=recipient_email, subject=subject, message_text=message_text)
-        self.gh.send_gmail(service, 'me', message)
+        return self.email_batcher.submit(message)
         
     def add_to_google_sheets(self, name, email, organization, issue, status="New"):
-        service = self.gh.google_sheets_authenticate()
-        sheet = service.open("Tickets").sheet1
-        sheet.append_row([organization, name, email, issue, status])
+        self.sheets_appender.append([organization, name, email, issue, status])
         
-    def submit_jira_ticket(self, payload):
-        ticket_payload, ticket_url = JiraTicket.format_ser_jira_ticket(**payload)
-        # print("TICKET PAYLOAD")
-        # pprint(ticket_payload)
-        issue_key = self.jh.post_jira_ticket(ticket_payload, ticket_url)
-        return issue_key
-    
+    def submit_jira_ticket(self, payload, assignee_id=None, journal_id=None):
+        """
+        Creates the Jira ticket for a parsed feedback message in a single request,
+        with the assignee, sprint and labels set at create time. Only if Jira rejects
+        one of those fields is it set with a follow-up request.
+
+        Args:
+            payload (dict): The fields parsed from the Slack payload.
+            assignee_id (str, optional): Jira account ID to assign the ticket to.
+            journal_id (str, optional): Event journal id. Steps already journaled for it
+                (before a restart) are not repeated.
+
+        Returns:
+            tuple: The issue key (None if creation failed) and whether the ticket is assigned.
+        """
+        journaled = self.journal.get(journal_id) if journal_id else None
+        journaled_data = journaled["data"] if journaled else {}
+        if "assigned" in journaled_data:
+            return journaled_data["issue_key"], journaled_data["assigned"]
+
+        if "issue_key" in journaled_data:
+            # Created before a restart; only the follow-up requests are redone
+            issue_key, rejected_fields = journaled_data["issue_key"], journaled_data["rejected_fields"]
+            log.log(f"Resuming journaled Jira issue {issue_key}")
+        else:
+            ticket_payload, ticket_url = JiraTicket.format_ser_jira_ticket(
+                assignee_id=assignee_id,
+                sprint_id=config.JIRA_CREATE_SPRINT_ID,
+                labels=config.JIRA_TICKET_LABELS,
+                **payload
+            )
+            # print("TICKET PAYLOAD")
+            # pprint(ticket_payload)
+            if self.bulk_creator:
+                # Blocks this worker until the batch it joined has been created
+                issue_key, rejected_fields = self.bulk_creator.submit(ticket_payload, ticket_url).result()
+            else:
+                issue_key, rejected_fields = self.jh.create_jira_ticket(ticket_payload, ticket_url)
+            if not issue_key:
+                return None, False
+            if journal_id:
+                self.journal.record(
+                    journal_id, "jira_created",
+                    data={"issue_key": issue_key, "rejected_fields": rejected_fields},
+                    durable=True
+                )
+
+        assigned = bool(assignee_id)
+        try:
+            if "assignee" in rejected_fields:
+                log.log(f"Assignee rejected at create time. Assigning {issue_key} separately.")
+                assigned = self.jh.assign_ticket(issue_key, assignee_id)
+            if config.JIRA_SPRINT_FIELD_ID in rejected_fields:
+                self.jh.add_jira_issue_to_sprint(config.JIRA_CREATE_SPRINT_ID, issue_key)
+        except JiraUnavailableError as e:
+            # The ticket exists, so it must not be parked and created a second time
+            log.log(f"Jira became unavailable while finishing {issue_key}: {e}", "warning")
+            assigned = assigned and "assignee" not in rejected_fields
+
+        if journal_id:
+            self.journal.record(journal_id, "assigned", data={"assigned": assigned})
+        return issue_key, assigned
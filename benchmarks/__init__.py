@@ -0,0 +1 @@
+# This indicates that /benchmarks is a module.
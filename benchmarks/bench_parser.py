@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the Slack event hot path.
+
+Replays the recorded Slack payloads in `benchmarks/corpus/` through
+`Formatter.parse_slack_payload` for each channel, and through
+`JiraTicket.format_ser_jira_ticket` for the channels that create tickets.
+Reports events/sec, p50/p99 latency and per-event allocations, and can
+compare against a saved baseline to catch regressions before deploy.
+
+Usage:
+    python -m benchmarks.bench_parser
+    python -m benchmarks.bench_parser --save baseline.json
+    python -m benchmarks.bench_parser --compare baseline.json --max-regression 0.2
+
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import contextlib
+import tracemalloc
+
+# `config` refuses to import without these. The benchmark never talks to any service,
+# so placeholders are enough when no .env is present.
+for _name in [
+    "SLACK_BOT_TOKEN", "SLACK_APP_TOKEN", "SLACK_CHANNEL_ID", "BOT_TESTING_SLACK_CHANNEL_ID",
+    "JIRA_EMAIL", "JIRA_API_TOKEN", "JIRA_BASE_URL", "JIRA_SERVE_PROJECT_KEY",
+    "OPEN_AI_API_KEY", "LANGWATCH_API_KEY", "QDRANT_API_KEY", "QDRANT_CLUSTER_URL"
+]:
+    os.environ.setdefault(_name, "benchmark")
+
+from helpers.formatter import Formatter
+from app.models.JiraTicket import JiraTicket
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+CHANNELS = ["serve-ai-idea", "serve-ai-issue", "serve-ai-thumbs-up-down", "bot-testing"]
+
+def load_corpus(channel):
+    """
+    Load the recorded payloads for a channel.
+
+    Args:
+        channel (str): Channel name, matching a file in the corpus directory.
+
+    Returns:
+        list: The recorded Socket Mode payloads.
+    """
+    with open(os.path.join(CORPUS_DIR, f"{channel}.json"), "r") as corpus_file:
+        return json.load(corpus_file)
+
+def parse_only(channel, payload):
+    return Formatter.parse_slack_payload(channel, payload)
+
+def parse_and_format(channel, payload):
+    content = Formatter.parse_slack_payload(channel, payload)
+    if isinstance(content, dict) and content.get("ticket_type"):
+        return JiraTicket.format_ser_jira_ticket(**content)
+    return content
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def measure(function, channel, payloads, iterations):
+    """
+    Time `function(channel, payload)` over the corpus, then measure its allocations.
+
+    Args:
+        function (callable): The code path under test.
+        channel (str): Channel the payloads belong to.
+        payloads (list): Recorded payloads, replayed round-robin.
+        iterations (int): Number of timed events.
+
+    Returns:
+        dict: events/sec, p50/p99 latency in microseconds and allocation stats.
+    """
+    latencies = []
+    # Some code paths print; keep the console out of the measurement.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for payload in payloads:
+            function(channel, payload)  # Warm up
+
+        started = time.perf_counter()
+        for i in range(iterations):
+            payload = payloads[i % len(payloads)]
+            event_started = time.perf_counter_ns()
+            function(channel, payload)
+            latencies.append(time.perf_counter_ns() - event_started)
+        elapsed = time.perf_counter() - started
+
+        tracemalloc.start()
+        peaks = []
+        blocks_before = sys.getallocatedblocks()
+        for payload in payloads:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            function(channel, payload)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+        retained_blocks = sys.getallocatedblocks() - blocks_before
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "events_per_sec": round(iterations / elapsed, 1),
+        "p50_us": round(percentile(latencies, 0.50) / 1000, 2),
+        "p99_us": round(percentile(latencies, 0.99) / 1000, 2),
+        "peak_alloc_bytes": max(peaks),
+        "avg_alloc_bytes": round(sum(peaks) / len(peaks), 1),
+        "retained_blocks": retained_blocks
+    }
+
+def run(channels, iterations):
+    results = {}
+    for channel in channels:
+        payloads = load_corpus(channel)
+        results[f"parse:{channel}"] = measure(parse_only, channel, payloads, iterations)
+        if channel != "bot-testing":
+            results[f"parse+format:{channel}"] = measure(parse_and_format, channel, payloads, iterations)
+    return results
+
+def print_results(results):
+    print(f"{'benchmark':<40}{'events/s':>12}{'p50 us':>10}{'p99 us':>10}{'peak B':>10}{'avg B':>10}")
+    for name, stats in results.items():
+        print(
+            f"{name:<40}{stats['events_per_sec']:>12}{stats['p50_us']:>10}{stats['p99_us']:>10}"
+            f"{stats['peak_alloc_bytes']:>10}{stats['avg_alloc_bytes']:>10}"
+        )
+
+def compare(results, baseline, max_regression):
+    """
+    Compare p50 latency against a saved baseline.
+
+    Returns:
+        list: Descriptions of benchmarks slower than the baseline by more than max_regression.
+    """
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["p50_us"]
+        if before and (stats["p50_us"] - before) / before > max_regression:
+            regressions.append(f"{name}: p50 {before}us -> {stats['p50_us']}us")
+    return regressions
+
+def main():
+    """Main function to run the parser benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark Slack payload parsing and Jira ticket formatting")
+    parser.add_argument("--channel", choices=CHANNELS, action="append", help="Channel to benchmark (default: all)")
+    parser.add_argument("--iterations", type=int, default=20000, help="Timed events per benchmark (default: 20000)")
+    parser.add_argument("--save", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare p50 latency against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed p50 slowdown vs. baseline (default: 0.2)")
+    args = parser.parse_args()
+
+    results = run(args.channel or CHANNELS, args.iterations)
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w") as results_file:
+            json.dump(results, results_file, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r") as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.max_regression)
+        if regressions:
+            print("\n❌ Regressions found:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\n✅ No regressions against baseline.")
+
+if __name__ == "__main__":
+    main()
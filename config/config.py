@@ -40,6 +40,9 @@ assert QDRANT_CLUSTER_URL, "QDRANT_CLUSTER_URL is missing!"
 QDRANT_COLLECTION_NAME = "llm_analysis_seeds"
 
 TRACE_DICT_FILEPATH = './trace_dict.p'
+TRACE_INDEX_ENABLED = os.getenv("TRACE_INDEX_ENABLED", "true").lower() == "true"
+TRACE_INDEX_FILEPATH = os.getenv("TRACE_INDEX_FILEPATH", "./trace_index.json")
+TRACE_INDEX_REFRESH_INTERVAL = float(os.getenv("TRACE_INDEX_REFRESH_INTERVAL", "60"))
 LLM_ANALYSIS_RECORDS_FILEPPATH = "./llm_analysis_records.txt"
 QDRANT_ANALYSIS_RECORDS_FILEPPATH = "./qdrant_analysis_records.txt"
 
@@ -74,3 +77,84 @@ BUG_TRIAGE_SPRINT_ID = "103"
 BUG_INTAKE_SPRINT_ID = "102"
 
 API_RETRIES = 3
+
+# Shared HTTP connection pool used for every Jira request
+JIRA_POOL_CONNECTIONS = int(os.getenv("JIRA_POOL_CONNECTIONS", "4"))
+JIRA_POOL_MAXSIZE = int(os.getenv("JIRA_POOL_MAXSIZE", "16"))
+JIRA_POOL_BLOCK = os.getenv("JIRA_POOL_BLOCK", "false").lower() == "true"
+JIRA_REQUEST_TIMEOUT = float(os.getenv("JIRA_REQUEST_TIMEOUT", "30"))
+JIRA_PAGINATION_CONCURRENCY = int(os.getenv("JIRA_PAGINATION_CONCURRENCY", "4"))
+JIRA_TRANSITION_CONCURRENCY = int(os.getenv("JIRA_TRANSITION_CONCURRENCY", "8"))
+JIRA_COMMENT_CONCURRENCY = int(os.getenv("JIRA_COMMENT_CONCURRENCY", "8"))
+
+# Retry/backoff and client-side rate limiting for Jira requests (attempts: API_RETRIES)
+JIRA_BACKOFF_BASE = float(os.getenv("JIRA_BACKOFF_BASE", "0.5"))
+JIRA_BACKOFF_MAX = float(os.getenv("JIRA_BACKOFF_MAX", "30"))
+JIRA_RATE_LIMIT = float(os.getenv("JIRA_RATE_LIMIT", "10"))
+JIRA_RATE_BURST = int(os.getenv("JIRA_RATE_BURST", "20"))
+
+# Circuit breaker for Jira outages, and the queue tickets are parked in meanwhile
+JIRA_BREAKER_FAILURE_THRESHOLD = int(os.getenv("JIRA_BREAKER_FAILURE_THRESHOLD", "5"))
+JIRA_BREAKER_RESET_TIMEOUT = float(os.getenv("JIRA_BREAKER_RESET_TIMEOUT", "30"))
+DEFERRED_TICKETS_FILEPATH = os.getenv("DEFERRED_TICKETS_FILEPATH", "./deferred_tickets.db")
+DEFERRED_TICKETS_DRAIN_RATE = float(os.getenv("DEFERRED_TICKETS_DRAIN_RATE", "1"))
+DEFERRED_TICKETS_POLL_INTERVAL = float(os.getenv("DEFERRED_TICKETS_POLL_INTERVAL", "10"))
+
+# Slack event processing pipeline
+EVENT_WORKER_COUNT = int(os.getenv("EVENT_WORKER_COUNT", "4"))
+EVENT_QUEUE_MAXSIZE = int(os.getenv("EVENT_QUEUE_MAXSIZE", "500"))
+EVENT_ENQUEUE_TIMEOUT = float(os.getenv("EVENT_ENQUEUE_TIMEOUT", "2"))
+EVENT_METRICS_LOG_INTERVAL = float(os.getenv("EVENT_METRICS_LOG_INTERVAL", "300"))
+
+# Deduplication of redelivered Slack events (unset EVENT_DEDUP_FILEPATH: memory only)
+EVENT_DEDUP_TTL = float(os.getenv("EVENT_DEDUP_TTL", "3600"))
+EVENT_DEDUP_MAX_SIZE = int(os.getenv("EVENT_DEDUP_MAX_SIZE", "10000"))
+EVENT_DEDUP_FILEPATH = os.getenv("EVENT_DEDUP_FILEPATH")
+
+# Write-ahead journal of acknowledged Slack events
+EVENT_JOURNAL_FILEPATH = os.getenv("EVENT_JOURNAL_FILEPATH", "./event_journal.jsonl")
+EVENT_JOURNAL_COMMIT_INTERVAL = float(os.getenv("EVENT_JOURNAL_COMMIT_INTERVAL", "0"))
+EVENT_JOURNAL_COMPACT_BYTES = int(os.getenv("EVENT_JOURNAL_COMPACT_BYTES", str(16 * 1024 * 1024)))
+EVENT_JOURNAL_DURABLE_TIMEOUT = float(os.getenv("EVENT_JOURNAL_DURABLE_TIMEOUT", "2"))
+
+# Event processing engine: "threaded" (worker pool) or "async" (asyncio; core flow only, see README)
+APP_MODE = os.getenv("APP_MODE", "threaded")
+ASYNC_MAX_IN_FLIGHT = int(os.getenv("ASYNC_MAX_IN_FLIGHT", "200"))
+
+# Slack thread replies
+SLACK_REPLY_COALESCE_WINDOW = float(os.getenv("SLACK_REPLY_COALESCE_WINDOW", "0.5"))
+SLACK_REPLY_MAX_RETRIES = int(os.getenv("SLACK_REPLY_MAX_RETRIES", "3"))
+SLACK_REPLY_COALESCE_PERIOD = float(os.getenv("SLACK_REPLY_COALESCE_PERIOD", "60"))
+
+# Google API clients
+GOOGLE_TOKEN_REFRESH_MARGIN = int(os.getenv("GOOGLE_TOKEN_REFRESH_MARGIN", "300"))
+GOOGLE_STATIC_DISCOVERY = os.getenv("GOOGLE_STATIC_DISCOVERY", "true").lower() == "true"
+
+# Outbound Gmail batching
+GMAIL_BATCH_SIZE = int(os.getenv("GMAIL_BATCH_SIZE", "50"))
+GMAIL_BATCH_INTERVAL = float(os.getenv("GMAIL_BATCH_INTERVAL", "1"))
+GMAIL_BATCH_MAX_RETRIES = int(os.getenv("GMAIL_BATCH_MAX_RETRIES", "3"))
+
+# Buffered Google Sheets appends
+SHEETS_SPREADSHEET_NAME = os.getenv("SHEETS_SPREADSHEET_NAME", "Tickets")
+SHEETS_SPREADSHEET_KEY = os.getenv("SHEETS_SPREADSHEET_KEY")
+SHEETS_FLUSH_ROWS = int(os.getenv("SHEETS_FLUSH_ROWS", "50"))
+SHEETS_FLUSH_INTERVAL = float(os.getenv("SHEETS_FLUSH_INTERVAL", "10"))
+SHEETS_SPILL_FILEPATH = os.getenv("SHEETS_SPILL_FILEPATH", "./sheets_spill.jsonl")
+
+# Create-time ticket fields (assignee comes from JIRA_ASSIGNEE_ID_DICT)
+JIRA_SPRINT_FIELD_ID = os.getenv("JIRA_SPRINT_FIELD_ID", "customfield_10020")
+JIRA_CREATE_SPRINT_ID = os.getenv("JIRA_CREATE_SPRINT_ID")
+JIRA_TICKET_LABELS = [label for label in os.getenv("JIRA_TICKET_LABELS", "").split(",") if label]
+
+# Bulk issue creation
+JIRA_BULK_CREATE_ENABLED = os.getenv("JIRA_BULK_CREATE_ENABLED", "false").lower() == "true"
+JIRA_BULK_CREATE_WINDOW = float(os.getenv("JIRA_BULK_CREATE_WINDOW", "0.2"))
+JIRA_BULK_CREATE_MAX_ISSUES = int(os.getenv("JIRA_BULK_CREATE_MAX_ISSUES", "50"))
+
+# Local cache for incremental comment_hunter scans
+JIRA_ISSUE_CACHE_FILEPATH = os.getenv("JIRA_ISSUE_CACHE_FILEPATH", "./jira_issue_cache.db")
+
+# Cached Jira metadata (transitions, boards, sprints, assignable users)
+JIRA_METADATA_TTL = float(os.getenv("JIRA_METADATA_TTL", "3600"))
+JIRA_METADATA_CACHE_FILEPATH = os.getenv("JIRA_METADATA_CACHE_FILEPATH", "./jira_metadata.json")
@@ -1,108 +1,179 @@
+from logger import log
+
+# Per-channel extractors for the feedback fields of a Slack payload. Each reads (and
+# splits) every payload block once, and tracks the field being extracted so a
+# failure raises SlackPayloadParseError naming it.
+PARSE_ERRORS = (KeyError, IndexError, TypeError, AttributeError, ValueError)
+
+class SlackPayloadParseError(ValueError):
+    """
+    Raised when a Slack payload does not match its channel's extraction schema.
+    Records which field could not be extracted.
+    """
+
+    def __init__(self, channel, field, cause):
+        self.channel = channel
+        self.field = field
+        self.cause = cause
+        super().__init__(f"Could not extract '{field}' from {channel} payload: {cause!r}")
+
+def extract_submitter_fields(channel, origin_lines):
+    """
+    Extracts the submitter block shared by the idea and issue channels.
+
+    Args:
+        channel (str): Channel name, used in error reports.
+        origin_lines (list): The submitter block, split on newlines.
+
+    Returns:
+        dict: name, email, organization, user_id and timestamp.
+    """
+    field = 'name'
+    try:
+        name = origin_lines[0].replace('*Submitted by:* ', '')
+        field = 'email'
+        email = origin_lines[1].replace('*Email:* <mailto:', '')[:-2].split('|')[0]
+        field = 'organization'
+        organization = origin_lines[2].replace('*Organization:* ', '')
+        field = 'user_id'
+        user_id = origin_lines[3].replace('*User ID:* ', '')
+        field = 'timestamp'
+        timestamp = origin_lines[4].replace('*Timestamp:* ', '')
+    except PARSE_ERRORS as e:
+        raise SlackPayloadParseError(channel, field, e) from e
+
+    return {'name': name, 'email': email, 'organization': organization, 'user_id': user_id, 'timestamp': timestamp}
+
+def extract_idea_fields(payload):
+    channel = 'serve-ai-idea'
+    field = 'name'
+    try:
+        origin_lines = payload['event']['blocks'][1]['text']['text'].split('\n')
+    except PARSE_ERRORS as e:
+        raise SlackPayloadParseError(channel, field, e) from e
+
+    fields = extract_submitter_fields(channel, origin_lines)
+    field = 'text'
+    try:
+        fields['text'] = payload['event']['text'].replace(f"New idea from {fields['name']}: ", '')
+    except PARSE_ERRORS as e:
+        raise SlackPayloadParseError(channel, field, e) from e
+
+    fields['click_type'] = 'idea'
+    fields['ticket_type'] = 'Task'
+    return fields
+
+def extract_issue_fields(payload):
+    channel = 'serve-ai-issue'
+    field = 'name'
+    try:
+        blocks = payload['event']['attachments'][0]['blocks']
+        origin_lines = blocks[1]['text']['text'].split('\n')
+    except PARSE_ERRORS as e:
+        raise SlackPayloadParseError(channel, field, e) from e
+
+    fields = extract_submitter_fields(channel, origin_lines)
+    try:
+        field = 'issue_type'
+        fields['issue_type'] = blocks[3]['text']['text'].split('\n')[1].split(' ')[1]
+        field = 'issue_urgency'
+        fields['issue_urgency'] = blocks[4]['text']['text'].split('\n')[1].split(' ')[1]
+        field = 'issue_description'
+        fields['issue_description'] = blocks[5]['text']['text'].split('```\n')[1][:-4]
+        field = 'issue_id'
+        fields['issue_id'] = blocks[7]['elements'][0]['text'].rsplit(' ', 1)[-1][1:-1]
+    except PARSE_ERRORS as e:
+        raise SlackPayloadParseError(channel, field, e) from e
+
+    fields['click_type'] = 'issue'
+    fields['ticket_type'] = 'Bug'
+    return fields
+
+def extract_thumbs_fields(payload):
+    channel = 'serve-ai-thumbs-up-down'
+    field = 'name'
+    try:
+        blocks = payload['event']['blocks']
+        source_block = blocks[1]['text']['text']
+        source_lines = source_block.split('\n')
+        name = source_block.split('*', 3)[2][1:-1]
+        field = 'email'
+        email = source_lines[1].split('*')[2].split('|')[1][:-1]
+        field = 'organization'
+        organization = source_lines[2].split('*')[2][1:]
+        field = 'request'
+        request = payload['event']['text'].split(name)[1][2:]
+        field = 'feedback'
+        feedback = blocks[4]['text']['text'].split('```')[1][1:-1]
+        field = 'origin'
+        origin = source_lines[4].split('*')[2][1:]
+        field = 'issue_type'
+        issue_type = blocks[0]['text']['text']
+        field = 'timestamp'
+        timestamp = source_lines[5].split('*')[2][1:]
+        field = 'ticket_type'
+        ticket_type = 'Bug' if 'thumbsdown' in issue_type.lower() else None
+    except PARSE_ERRORS as e:
+        raise SlackPayloadParseError(channel, field, e) from e
+
+    return {
+        'name': name,
+        'email': email,
+        'organization': organization,
+        'request': request,
+        'feedback': feedback,
+        'origin': origin,
+        'issue_type': issue_type,
+        'timestamp': timestamp,
+        'click_type': 'thumbsdown',
+        'ticket_type': ticket_type
+    }
+
+CHANNEL_EXTRACTORS = {
+    'serve-ai-idea': extract_idea_fields,
+    'serve-ai-issue': extract_issue_fields,
+    'serve-ai-thumbs-up-down': extract_thumbs_fields
+}
+
 class Formatter:
 
     @staticmethod
     def sanitize_string(string):
-        print("SANITIZING STRING...")
+        log.log("SANITIZING STRING...", "debug")
         return string.replace("“", "\"").replace("”", "\"")
 
     @staticmethod
     def extract_email_from_slack_payload(payload):
-        print("EXTRACTING EMAIL...")
+        log.log("EXTRACTING EMAIL...", "debug")
         for element in payload['event']['blocks'][0]['elements'][0]['elements']:
             # print("ELEMENT:", element)
             if element['type'] == "link":
                 return element['text']
 
-    @staticmethod 
+    @staticmethod
     def parse_slack_payload(channel, payload):
-        print('CHANNEL:', channel)
-        if channel == 'serve-ai-idea':
-            payload_origin = payload['event']['blocks'][1]['text']['text']
-            payload_origin_array = payload_origin.split('\n')
-            name = payload_origin_array[0].replace("*Submitted by:* ", '')
-            email = payload_origin_array[1].replace("*Email:* <mailto:", '')[:-2].split('|')[0]
-            organization = payload_origin_array[2].replace("*Organization:* ", '')
-            user_id = payload_origin_array[3].replace("*User ID:* ", '')
-            timestamp = payload_origin_array[4].replace("*Timestamp:* ", '')
-            event_text = payload['event']['text'].replace(f'New idea from {name}: ', '')
-            payload_dict = {
-                'name': name,
-                'email': email,
-                'organization': organization,
-                'user_id': user_id,
-                'timestamp': timestamp,
-                'text': event_text,
-                'click_type': 'idea',
-                'ticket_type': 'Task'
-            }
-
-        if channel == 'serve-ai-issue':
-            feedback_origin = payload['event']['attachments'][0]['blocks'][1]['text']['text']
-            feedback_origin_array = feedback_origin.split('\n')
-            name = feedback_origin_array[0].replace("*Submitted by:* ", '')
-            email = feedback_origin_array[1].replace("*Email:* <mailto:", '')[:-2].split('|')[0]
-            organization = feedback_origin_array[2].replace("*Organization:* ", '')
-            user_id = feedback_origin_array[3].replace("*User ID:* ", '')
-            timestamp = feedback_origin_array[4].replace("*Timestamp:* ", '')
-            issue_type = payload['event']['attachments'][0]['blocks'][3]['text']['text'].split('\n')[1].split(' ')[1]
-            issue_urgency = payload['event']['attachments'][0]['blocks'][4]['text']['text'].split('\n')[1].split(' ')[1:][0]
-            issue_description = payload['event']['attachments'][0]['blocks'][5]['text']['text'].split('```\n')[1][:-4]
-            issue_id = payload['event']['attachments'][0]['blocks'][7]['elements'][0]['text'].split(' ')[-1][1:-1]
-
-            payload_dict = {
-                'name': name,
-                'email': email,
-                'organization': organization,
-                'user_id': user_id,
-                'timestamp': timestamp,
-                'issue_type': issue_type,
-                'issue_urgency': issue_urgency,
-                'issue_description': issue_description,
-                'issue_id': issue_id,
-                'click_type': 'issue',
-                'ticket_type': 'Bug'
-            }
-
-        if channel == 'serve-ai-thumbs-up-down':
-            try:
-                feedback_pos_neg = payload['event']['blocks'][0]['text']['text']
-                feedback_source = payload['event']['blocks'][1]['text']['text']
-                feedback_name = feedback_source.split('*')[2][1:-1]
-                feedback_email = feedback_source.split('\n')[1].split('*')[2].split('|')[1][:-1]
-                feedback_organization = feedback_source.split('\n')[2].split('*')[2][1:]
-                feedback_origin = feedback_source.split('\n')[4].split('*')[2][1:]
-                feedback_timestamp = feedback_source.split('\n')[5].split('*')[2][1:]
-                feedback_request = payload['event']['text'].split(feedback_name)[1][2:]
-                feedback_message = payload['event']['blocks'][4]['text']['text'].split('```')[1][1:-1]
-
-            except Exception as e:
-                print("ERROR PARSING FEEDBACK PAYLOAD:", e.__str__())
-                print("PAYLOAD:", payload)
-                print("Message could not be parsed. Likely not a feedback message.")
-                return
-            
-            payload_dict = {
-                'name': feedback_name,
-                'email': feedback_email,
-                'organization': feedback_organization,
-                'request': feedback_request,
-                'feedback': feedback_message,
-                'origin': feedback_origin,
-                'issue_type': feedback_pos_neg,
-                'timestamp': feedback_timestamp,
-                'click_type': 'thumbsdown',
-                'ticket_type': 'Bug' if 'thumbsdown' in feedback_pos_neg.lower() else None
-            }
-
-
-        elif channel == 'bot-testing':
-            print(payload)
+        """
+        Extracts the feedback fields from a Slack payload using the channel's
+        extractor (see `CHANNEL_EXTRACTORS`).
+
+        Args:
+            channel (str): Name of the channel the event came from.
+            payload (dict): The Socket Mode payload.
+
+        Returns:
+            dict: The extracted fields. For bot-testing, an acknowledgement string.
+            None for channels without a schema.
+
+        Raises:
+            SlackPayloadParseError: If a field cannot be extracted. `field` names the failing field.
+        """
+        if channel == 'bot-testing':
+            log.log(lambda: f"BOT-TESTING PAYLOAD: {payload}", "debug")
             return f"Message successfully received from bot-testing: {payload['event']['text']}"
 
-        try:
-            return payload_dict
-        except NameError as e:
-            print("ERROR: No payload_dict found!")
+        extractor = CHANNEL_EXTRACTORS.get(channel)
+        if extractor is None:
+            log.log(f"No extractor for channel {channel}", "error")
             return
-	
-    
\ No newline at end of file
+
+        return extractor(payload)
@@ -0,0 +1,144 @@
+from concurrent.futures import Future
+from queue import Queue, Empty
+from threading import Thread
+from typing import Dict, Any, List, Tuple
+from googleapiclient.errors import HttpError
+import itertools
+import time
+import traceback
+from logger import log
+from config import config
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class GmailBatcher:
+    """
+    Aggregates outbound Gmail messages and sends them through the Gmail batch
+    HTTP endpoint. Each submitted message gets a Future resolved with its own
+    send result; only the messages that failed with a transient error are retried.
+    """
+
+    def __init__(
+        self,
+        google_handler,
+        sender: str = 'me',
+        max_batch_size: int = config.GMAIL_BATCH_SIZE,
+        flush_interval: float = config.GMAIL_BATCH_INTERVAL,
+        max_retries: int = config.GMAIL_BATCH_MAX_RETRIES
+    ) -> None:
+        """
+        Args:
+            google_handler (Google_handler): Handler used to authenticate and send batches.
+            sender (str): Gmail user id messages are sent as.
+            max_batch_size (int): Messages per batch request (Gmail allows at most 100).
+            flush_interval (float): Seconds the first queued message waits for others to join its batch.
+            max_retries (int): Times a transiently failed message is retried.
+        """
+        self.gh = google_handler
+        self.sender = sender
+        self.max_batch_size = min(max_batch_size, 100)
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.queue = Queue()
+        self.request_ids = itertools.count()
+        self.thread = Thread(target=self._run, name="gmail-batcher", daemon=True)
+
+    def start(self) -> None:
+        """Starts the background flushing thread."""
+        self.thread.start()
+
+    def submit(self, message_body: Dict[str, str]) -> Future:
+        """
+        Queues a message built by `Google_handler.create_gmail_message`.
+
+        Args:
+            message_body (Dict[str, str]): The raw Gmail message body.
+
+        Returns:
+            Future: Resolves to the sent message resource, or to None if sending failed.
+        """
+        future = Future()
+        self.queue.put((message_body, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except Empty:
+                    break
+
+            try:
+                self.send(batch)
+            except Exception:
+                log.log(f"UNHANDLED ERROR SENDING GMAIL BATCH: {traceback.format_exc()}", "error")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+
+    def send(self, batch: List[Tuple[Dict[str, str], Future]]) -> None:
+        """
+        Sends a batch, resolving each message's Future and retrying transient failures.
+
+        Args:
+            batch (List[Tuple[Dict[str, str], Future]]): Message bodies with their Futures.
+        """
+        pending = {str(next(self.request_ids)): item for item in batch}
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(2 ** (attempt - 1))
+                log.log(f"Retrying {len(pending)} failed Gmail messages (attempt {attempt})", "warning")
+
+            try:
+                service = self.gh.gmail_authenticate()
+                results = self.gh.send_gmail_batch(
+                    service,
+                    self.sender,
+                    {request_id: body for request_id, (body, _) in pending.items()}
+                )
+            except Exception as e:
+                log.log(f"Gmail batch request failed: {e}", "error")
+                continue
+
+            retry = {}
+            for request_id, (body, future) in pending.items():
+                response, exception = results.get(request_id, (None, None))
+                if exception is None and response is not None:
+                    future.set_result(response)
+                elif is_retryable(exception):
+                    retry[request_id] = (body, future)
+                else:
+                    log.log(f"Gmail message could not be sent: {exception}", "error")
+                    future.set_result(None)
+
+            log.log(f"Gmail batch sent: {len(pending) - len(retry)} done, {len(retry)} to retry")
+            pending = retry
+            if not pending:
+                return
+
+        for _, future in pending.values():
+            future.set_result(None)
+        log.log(f"Giving up on {len(pending)} Gmail messages after {self.max_retries} retries", "error")
+
+def is_retryable(exception: Any) -> bool:
+    """
+    Checks whether a per-message batch error is worth retrying.
+
+    Args:
+        exception (Any): The exception reported for the message, if any.
+
+    Returns:
+        bool: True for missing responses, rate limits and server errors.
+    """
+    if exception is None:
+        return True
+    if isinstance(exception, HttpError):
+        return exception.resp.status in RETRYABLE_STATUS_CODES
+    return False
@@ -1,6 +1,7 @@
 import os
 import gspread
 import base64
+import threading
 from email.mime.text import MIMEText
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
@@ -8,6 +9,7 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from oauth2client.service_account import ServiceAccountCredentials
 from integrations.google.token_manager import TokenManager
 from logger import log
+from config import config
 
 class Google_handler:
 
@@ -15,6 +17,8 @@ class Google_handler:
         self.gmail_credentials_filepath = self.concatenate_file_path("gmail_credentials.json")
         self.gsheets_credentials_filepath = self.concatenate_file_path("gsheets_credentials.json")
         self.token_manager = TokenManager(self.gmail_credentials_filepath)
+        # googleapiclient services are not thread-safe, so each thread keeps its own
+        self._gmail_services = threading.local()
         
     
     def concatenate_file_path(self, filename):
@@ -35,6 +39,9 @@ class Google_handler:
         """
         Authenticate with Gmail API using stored tokens.
         
+        The service is built once per thread from the bundled static discovery
+        document and reused for as long as the cached credentials stay the same.
+        
         Returns:
             service: Authenticated Gmail API service
             
@@ -49,8 +56,17 @@ class Google_handler:
             scopes = ['https://www.googleapis.com/auth/gmail.send']
             creds = self.token_manager.get_credentials(scopes)
             
-            # Build and return the Gmail service
-            return build('gmail', 'v1', credentials=creds)
+            cached = self._gmail_services
+            if getattr(cached, "credentials", None) is not creds:
+                cached.service = build(
+                    'gmail', 'v1',
+                    credentials=creds,
+                    static_discovery=config.GOOGLE_STATIC_DISCOVERY,
+                    cache_discovery=False
+                )
+                cached.credentials = creds
+            
+            return cached.service
         except Exception as e:
             log.log(f"Gmail authentication failed: {str(e)}")
             raise Exception(f"Failed to authenticate with Gmail: {str(e)}")
@@ -67,8 +83,33 @@ class Google_handler:
     def send_gmail(self, service, sender, message_body):
         try:
             sent_message = service.users().messages().send(userId=sender, body=message_body).execute()
-            print(f'Message Id: {sent_message["id"]}')
+            log.log(f'Message Id: {sent_message["id"]}', "debug")
             return sent_message
         except Exception as error:
-            print(f'An error occurred: {error}')
-            return None
\ No newline at end of file
+            log.log(f'An error occurred: {error}', "error")
+            return None
+
+    def send_gmail_batch(self, service, sender, message_bodies):
+        """
+        Sends several messages in a single Gmail batch HTTP request.
+
+        Args:
+            service: Authenticated Gmail API service
+            sender (str): Gmail user id to send as (e.g. 'me')
+            message_bodies (dict): Message bodies keyed by a caller-chosen request id
+
+        Returns:
+            dict: (response, exception) tuple per request id. Ids missing from the
+            result received no response.
+        """
+        results = {}
+
+        def record_result(request_id, response, exception):
+            results[request_id] = (response, exception)
+
+        batch = service.new_batch_http_request(callback=record_result)
+        for request_id, message_body in message_bodies.items():
+            batch.add(service.users().messages().send(userId=sender, body=message_body), request_id=request_id)
+
+        batch.execute()
+        return results
@@ -0,0 +1,156 @@
+import os
+import json
+import threading
+import traceback
+from logger import log
+from config import config
+
+class SheetsAppender:
+    """
+    Buffers rows destined for a Google Sheets worksheet and appends them in bulk
+    with `append_rows`, on a size or time threshold. Every buffered row is also
+    written to a local spill file first, so rows survive a crash and are replayed
+    on the next start.
+    """
+
+    def __init__(
+        self,
+        google_handler,
+        spreadsheet_name=config.SHEETS_SPREADSHEET_NAME,
+        spreadsheet_key=config.SHEETS_SPREADSHEET_KEY,
+        flush_rows=config.SHEETS_FLUSH_ROWS,
+        flush_interval=config.SHEETS_FLUSH_INTERVAL,
+        spill_filepath=config.SHEETS_SPILL_FILEPATH
+    ):
+        """
+        Args:
+            google_handler (Google_handler): Handler used to authorize gspread.
+            spreadsheet_name (str): Spreadsheet title, used when no key is configured.
+            spreadsheet_key (str, optional): Spreadsheet key. Opening by key skips the Drive search.
+            flush_rows (int): Buffered rows that trigger an immediate flush.
+            flush_interval (float): Maximum seconds a row waits in the buffer.
+            spill_filepath (str): Local JSON-lines file holding rows not yet appended.
+        """
+        self.gh = google_handler
+        self.spreadsheet_name = spreadsheet_name
+        self.spreadsheet_key = spreadsheet_key
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.spill_filepath = spill_filepath
+        self.worksheet = None
+        self.buffer, torn = self._load_spill_file()
+        if torn:
+            # Drop the torn line now, or the next append would be written onto the end of it
+            self._rewrite_spill_file()
+        self.condition = threading.Condition()
+        self.flush_lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="sheets-appender", daemon=True)
+
+        if self.buffer:
+            log.log(f"Recovered {len(self.buffer)} unsent Google Sheets rows from {self.spill_filepath}")
+
+    def start(self):
+        """Starts the background flushing thread."""
+        self.thread.start()
+
+    def stop(self):
+        """Stops the background thread and flushes whatever is still buffered."""
+        self.stopped.set()
+        with self.condition:
+            self.condition.notify()
+        self.thread.join(self.flush_interval)
+        self.flush()
+
+    def append(self, row):
+        """
+        Buffers a row. The row is persisted to the spill file before this returns.
+
+        Args:
+            row (list): Cell values for the new row.
+        """
+        with self.condition:
+            with open(self.spill_filepath, 'a') as spill_file:
+                spill_file.write(json.dumps(row) + '\n')
+                spill_file.flush()
+                os.fsync(spill_file.fileno())
+
+            self.buffer.append(row)
+            if len(self.buffer) >= self.flush_rows:
+                self.condition.notify()
+
+    def flush(self):
+        """
+        Appends every buffered row to the worksheet in a single request.
+
+        Returns:
+            bool: True if the buffer is empty afterwards, False if the append failed.
+        """
+        with self.flush_lock:
+            with self.condition:
+                rows = list(self.buffer)
+            if not rows:
+                return True
+
+            try:
+                self._get_worksheet().append_rows(rows)
+            except Exception:
+                # Drop the cached handle in case the failure was an expired authorization
+                self.worksheet = None
+                log.log(f"Failed to append {len(rows)} rows to Google Sheets: {traceback.format_exc()}", "error")
+                return False
+
+            with self.condition:
+                self.buffer = self.buffer[len(rows):]
+                self._rewrite_spill_file()
+
+            log.log(f"Appended {len(rows)} rows to Google Sheets")
+            return True
+
+    def _run(self):
+        while not self.stopped.is_set():
+            with self.condition:
+                if len(self.buffer) < self.flush_rows:
+                    self.condition.wait(self.flush_interval)
+            if not self.flush():
+                # Back off instead of hammering Sheets while it is failing
+                self.stopped.wait(self.flush_interval)
+
+    def _get_worksheet(self):
+        if self.worksheet is None:
+            client = self.gh.google_sheets_authenticate()
+            if self.spreadsheet_key:
+                spreadsheet = client.open_by_key(self.spreadsheet_key)
+            else:
+                spreadsheet = client.open(self.spreadsheet_name)
+            self.worksheet = spreadsheet.sheet1
+
+        return self.worksheet
+
+    def _load_spill_file(self):
+        # Returns the readable rows and whether any line had to be skipped
+        if not os.path.exists(self.spill_filepath):
+            return [], False
+
+        rows = []
+        torn = False
+        with open(self.spill_filepath, 'r') as spill_file:
+            for line in spill_file:
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write
+                    log.log(f"Skipping unreadable spill file line: {line!r}", "warning")
+                    torn = True
+        return rows, torn
+
+    def _rewrite_spill_file(self):
+        temp_filepath = self.spill_filepath + '.tmp'
+        with open(temp_filepath, 'w') as spill_file:
+            for row in self.buffer:
+                spill_file.write(json.dumps(row) + '\n')
+            spill_file.flush()
+            os.fsync(spill_file.fileno())
+        os.replace(temp_filepath, self.spill_filepath)
@@ -1,24 +1,31 @@
 import os
 import json
 import datetime
+from threading import Lock
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from logger import log
+from config import config
 
 class TokenManager:
     """
     Manages OAuth2 tokens for Google APIs, including storage, validation, and refresh.
     """
     
-    def __init__(self, credentials_path):
+    def __init__(self, credentials_path, refresh_margin=config.GOOGLE_TOKEN_REFRESH_MARGIN):
         """
         Initialize the TokenManager with the path to the credentials file.
         
         Args:
             credentials_path (str): Path to the credentials JSON file
+            refresh_margin (int, optional): Seconds before expiry at which cached
+                credentials are proactively refreshed.
         """
         self.credentials_path = credentials_path
+        self.refresh_margin = datetime.timedelta(seconds=refresh_margin)
+        self._credentials = None
+        self._credentials_lock = Lock()
         self.token_dir = self._get_token_dir()
         self.token_path = self._get_token_path()
         
@@ -80,8 +87,10 @@ class TokenManager:
         """
         Get valid credentials for Google API access.
         
-        This method checks for existing tokens, validates them, and refreshes if necessary.
-        If no valid token exists, it raises an exception indicating setup is required.
+        Credentials are loaded from disk once and kept in memory. They are only
+        refreshed (and re-saved) when they are expired or within `refresh_margin`
+        of expiring. If no valid token exists, it raises an exception indicating
+        setup is required.
         
         Args:
             scopes (list, optional): List of scopes required. Defaults to None.
@@ -92,41 +101,55 @@ class TokenManager:
         Raises:
             Exception: If no valid token exists and setup is required
         """
-        token_data = self.load_token()
-        
-        if not token_data:
-            raise Exception(
-                "No token found. Please run the setup script to authenticate: "
-                "python -m integrations.google.setup_auth"
-            )
-        
-        # Create credentials from token data
-        creds = Credentials.from_authorized_user_info(token_data)
-        
-        # Check if token is expired and can be refreshed
-        if creds.expired and creds.refresh_token:
-            try:
-                log.log("Token expired. Refreshing...")
-                creds.refresh(Request())
+        with self._credentials_lock:
+            if self._credentials is None:
+                token_data = self.load_token()
+                
+                if not token_data:
+                    raise Exception(
+                        "No token found. Please run the setup script to authenticate: "
+                        "python -m integrations.google.setup_auth"
+                    )
                 
-                # Save the refreshed token
-                token_data = {
-                    'token': creds.token,
-                    'refresh_token': creds.refresh_token,
-                    'token_uri': creds.token_uri,
-                    'client_id': creds.client_id,
-                    'client_secret': creds.client_secret,
-                    'scopes': creds.scopes,
-                    'expiry': creds.expiry.isoformat()
-                }
-                self.save_token(token_data)
-                log.log("Token refreshed successfully")
-            except Exception as e:
-                log.log(f"Error refreshing token: {str(e)}")
-                raise Exception(f"Failed to refresh token: {str(e)}")
+                # Create credentials from token data
+                self._credentials = Credentials.from_authorized_user_info(token_data)
+            
+            creds = self._credentials
+            
+            # Check if token is (nearly) expired and can be refreshed
+            if self._needs_refresh(creds) and creds.refresh_token:
+                try:
+                    log.log("Token expired or expiring soon. Refreshing...")
+                    creds.refresh(Request())
+                    
+                    # Save the refreshed token
+                    token_data = {
+                        'token': creds.token,
+                        'refresh_token': creds.refresh_token,
+                        'token_uri': creds.token_uri,
+                        'client_id': creds.client_id,
+                        'client_secret': creds.client_secret,
+                        'scopes': creds.scopes,
+                        'expiry': creds.expiry.isoformat()
+                    }
+                    self.save_token(token_data)
+                    log.log("Token refreshed successfully")
+                except Exception as e:
+                    log.log(f"Error refreshing token: {str(e)}")
+                    raise Exception(f"Failed to refresh token: {str(e)}")
         
         return creds
     
+    def _needs_refresh(self, creds):
+        """Check whether credentials are expired or within the refresh margin of expiring."""
+        if creds.expired or not creds.token:
+            return True
+        if creds.expiry is None:
+            return False
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        return now + self.refresh_margin >= creds.expiry
+    
     def save_credentials(self, credentials):
         """
         Save credentials obtained from OAuth2 flow.
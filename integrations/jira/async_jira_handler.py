@@ -0,0 +1,191 @@
+from typing import Optional, Dict, Any, List, Tuple
+from app.models.JiraTicket import JiraTicket
+from integrations.jira.retry import RetryPolicy, TokenBucket, IDEMPOTENT_METHODS
+from logger import log
+from config import config
+import asyncio
+import aiohttp
+
+class AsyncJiraHandler:
+    """
+    asyncio counterpart of `Jira_Handler` for the calls on the Slack event hot path.
+    All requests share one pooled `aiohttp.ClientSession` and the same retry
+    policy and rate limiting as `JiraSession`.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the handler with the same Jira configuration as `Jira_Handler`.
+        The HTTP session is created lazily inside the running event loop.
+        """
+        self.jira_domain = config.JIRA_BASE_URL
+        self.project_key = config.JIRA_SERVE_PROJECT_KEY
+        self.auth = aiohttp.BasicAuth(config.JIRA_EMAIL, config.JIRA_API_TOKEN)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.retry_policy = RetryPolicy()
+        self.rate_limiter = TokenBucket()
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared client session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: Keep-alive session with a bounded connection pool.
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                auth=self.auth,
+                connector=aiohttp.TCPConnector(limit_per_host=config.JIRA_POOL_MAXSIZE),
+                timeout=aiohttp.ClientTimeout(total=config.JIRA_REQUEST_TIMEOUT)
+            )
+
+        return self.session
+
+    async def close(self) -> None:
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def request(self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs: Any) -> aiohttp.ClientResponse:
+        """
+        Sends a request through the shared session, applying the rate limiter and
+        the retry policy. The body is read before returning, so `json()` and
+        `text()` can be awaited on the released response.
+
+        Args:
+            method (str): HTTP method (e.g. "GET", "POST").
+            url (str): The full Jira API URL.
+            idempotent (Optional[bool]): Whether the request is safe to repeat after it may
+                have reached Jira (default: true for every method but POST).
+            **kwargs: Any keyword accepted by `aiohttp.ClientSession.request`.
+
+        Returns:
+            aiohttp.ClientResponse: The last Jira response.
+
+        Raises:
+            aiohttp.ClientError: If the last attempt failed to connect.
+            asyncio.TimeoutError: If the last attempt timed out.
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            await asyncio.sleep(self.rate_limiter.reserve())
+            try:
+                async with self.get_session().request(method, url, **kwargs) as response:
+                    await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # A connector error means the request was never sent
+                if not self.retry_policy.should_retry(attempt, idempotent=idempotent or isinstance(e, aiohttp.ClientConnectorError)):
+                    raise
+                delay = self.retry_policy.get_delay(attempt)
+                log.log(f"Jira {method} {url} failed ({e!r}). Retrying in {delay:.2f}s", "warning")
+            else:
+                if not self.retry_policy.should_retry(attempt, response.status, idempotent):
+                    return response
+                delay = self.retry_policy.get_delay(attempt, response.status, response.headers)
+                log.log(f"Jira {method} {url} returned {response.status}. Retrying in {delay:.2f}s", "warning")
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def post_jira_ticket(
+        self,
+        payload: Dict[str, Any],
+        url: str,
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+    ) -> Optional[str]:
+        """
+        Attempts to create a Jira issue using the provided payload and URL.
+        Transient failures are retried by `request`.
+
+        Args:
+            payload (Dict[str, Any]): The issue data to be sent to Jira.
+            url (str): The API endpoint for issue creation.
+            headers (Dict[str, str], optional): HTTP headers for the request.
+
+        Returns:
+            Optional[str]: The key of the created issue if successful, otherwise None.
+        """
+        try:
+            response = await self.request("POST", url, json=payload, headers=headers)
+            if response.status == 201:
+                issue_key = (await response.json()).get("key")
+                log.log(f"Jira issue created: {issue_key}")
+                return issue_key
+            else:
+                log.log(f"Jira issue creation failed: {await response.text()}")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.log(f"Jira API error while creating issue: {e!r}", "error")
+
+        return None
+
+    async def create_jira_ticket(
+        self,
+        payload: Dict[str, Any],
+        url: str,
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        Creates a Jira issue whose payload may carry create-time fields (assignee,
+        sprint, labels), retrying without any of those Jira rejects.
+        See `Jira_Handler.create_jira_ticket`.
+
+        Returns:
+            Tuple[Optional[str], List[str]]: The created issue key (None on failure) and
+            the create-time fields that were dropped.
+        """
+        try:
+            response = await self.request("POST", url, json=payload, headers=headers)
+            if response.status == 201:
+                issue_key = (await response.json()).get("key")
+                log.log(f"Jira issue created: {issue_key}")
+                return issue_key, []
+
+            log.log(f"Jira issue creation failed: {await response.text()}")
+            if not 400 <= response.status < 500:
+                return None, []
+
+            try:
+                errors = (await response.json(content_type=None)).get("errors", {})
+            except ValueError:
+                errors = {}
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.log(f"Jira API error while creating issue: {e!r}", "error")
+            return None, []
+
+        rejected_fields = [field for field in JiraTicket.optional_create_fields() if field in errors]
+        if not rejected_fields:
+            return None, []
+
+        log.log(f"Retrying issue creation without rejected fields: {rejected_fields}")
+        fallback_payload = JiraTicket.without_fields(payload, rejected_fields)
+        return await self.post_jira_ticket(fallback_payload, url, headers), rejected_fields
+
+    async def assign_ticket(self, issue_key: str, assignee: str) -> bool:
+        """
+        Assigns a Jira issue to the given account.
+
+        Args:
+            issue_key (str): The key of the issue (e.g., "SER-123").
+            assignee (str): The Jira account ID of the assignee.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        url = f"{self.jira_domain}/rest/api/3/issue/{issue_key}/assignee"
+        payload = {"accountId": assignee}
+
+        try:
+            response = await self.request("PUT", url, json=payload, headers={"Content-Type": "application/json"})
+            if response.status == 204:
+                log.log(f"Successfully assigned {issue_key} to {assignee}")
+                return True
+            else:
+                log.log(f"Failed to assign ticket: {response.status} - {await response.text()}")
+                return False
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.log(f"Error assigning ticket: {e!r}", "error")
+            return False
@@ -0,0 +1,174 @@
+from concurrent.futures import Future
+from queue import Queue, Empty
+from threading import Thread
+from typing import Dict, Any, List, Tuple
+import time
+import traceback
+import requests
+from integrations.jira.circuit_breaker import JiraUnavailableError
+from integrations.jira.retry import request_was_sent
+from logger import log
+from config import config
+
+class JiraBulkIssueCreator:
+    """
+    Micro-batches issue creation. Payloads submitted within a short window are
+    created together through Jira's bulk create endpoint; each submitter gets a
+    Future resolving to the same (issue_key, rejected_fields) result as
+    `Jira_Handler.create_jira_ticket`, or raising `JiraUnavailableError` if the
+    request certainly did not create anything. Issues that fail inside a bulk
+    request are retried individually; a bulk request that may have created some
+    of its issues (timeout, 5xx) is reported as failed and never retried.
+
+    Submitters block on their Future, so at most `max_waiters` payloads can ever
+    be queued at once. A batch is sent as soon as it holds that many, instead of
+    lingering for the rest of the window.
+    """
+
+    def __init__(
+        self,
+        jira_handler,
+        window: float = config.JIRA_BULK_CREATE_WINDOW,
+        max_issues: int = config.JIRA_BULK_CREATE_MAX_ISSUES,
+        max_waiters: int = config.EVENT_WORKER_COUNT
+    ) -> None:
+        """
+        Args:
+            jira_handler (Jira_Handler): Handler whose session and single-issue create are used.
+            window (float): Seconds the first queued payload waits for others to join its batch.
+            max_issues (int): Issues per bulk request (Jira allows at most 50).
+            max_waiters (int): Threads that submit and wait on the result (the event workers).
+        """
+        self.jh = jira_handler
+        self.window = window
+        self.max_issues = min(max_issues, 50)
+        self.batch_size = max(min(self.max_issues, max_waiters), 1)
+        self.bulk_url = f"{config.JIRA_BASE_URL}/rest/api/3/issue/bulk"
+        self.queue = Queue()
+        self.thread = Thread(target=self._run, name="jira-bulk-create", daemon=True)
+
+    def start(self) -> None:
+        """Starts the background batching thread."""
+        self.thread.start()
+
+    def submit(self, payload: Dict[str, Any], url: str) -> Future:
+        """
+        Queues an issue for creation.
+
+        Args:
+            payload (Dict[str, Any]): Create-issue payload from `JiraTicket.format_ser_jira_ticket`.
+            url (str): Single-issue create URL, used when the issue has to be created on its own.
+
+        Returns:
+            Future: Resolves to (issue_key, rejected_fields).
+        """
+        future = Future()
+        self.queue.put((payload, url, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except Empty:
+                    break
+
+            try:
+                self.create(batch)
+            except Exception:
+                log.log(f"UNHANDLED ERROR IN BULK ISSUE CREATION: {traceback.format_exc()}", "error")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result((None, []))
+
+    def create(self, batch: List[Tuple[Dict[str, Any], str, Future]]) -> None:
+        """
+        Creates a batch of issues, resolving each Future with its own result.
+
+        Args:
+            batch (List[Tuple[Dict[str, Any], str, Future]]): Payloads, create URLs and Futures.
+        """
+        if len(batch) == 1:
+            self._create_one(*batch[0])
+            return
+
+        failed_indexes = set(range(len(batch)))
+        try:
+            response = self.jh.session.post(
+                self.bulk_url,
+                json={"issueUpdates": [payload for payload, _, _ in batch]},
+                headers={"Content-Type": "application/json"}
+            )
+            if response.status_code == 429:
+                raise JiraUnavailableError("Jira rate limited bulk issue creation")
+            if response.status_code >= 500:
+                log.log(f"Bulk issue creation failed: {response.status_code} - {response.text}", "error")
+                self._resolve_unknown(batch)
+                return
+            if response.status_code in (201, 400):
+                failed_indexes = self._resolve_bulk_response(batch, response.json())
+            else:
+                log.log(f"Bulk issue creation failed: {response.status_code} - {response.text}")
+
+        except JiraUnavailableError as e:
+            # Certainly not created, so the tickets can be parked
+            log.log(f"Jira unavailable during bulk issue creation: {e}", "error")
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        except requests.exceptions.RequestException as e:
+            log.log(f"Jira API error during bulk issue creation: {e}", "error")
+            if not request_was_sent(e):
+                error = JiraUnavailableError(str(e))
+                for _, _, future in batch:
+                    future.set_exception(error)
+                return
+            self._resolve_unknown(batch)
+            return
+
+        except ValueError as e:
+            log.log(f"Unreadable bulk issue creation response: {e}", "error")
+            self._resolve_unknown(batch)
+            return
+
+        if failed_indexes:
+            log.log(f"Retrying {len(failed_indexes)} of {len(batch)} issues individually")
+        for index in sorted(failed_indexes):
+            self._create_one(*batch[index])
+
+    def _create_one(self, payload: Dict[str, Any], url: str, future: Future) -> None:
+        try:
+            future.set_result(self.jh.create_jira_ticket(payload, url))
+        except JiraUnavailableError as e:
+            future.set_exception(e)
+
+    def _resolve_unknown(self, batch) -> None:
+        # Jira may have created some of the issues, so none are retried or parked
+        for _, _, future in batch:
+            future.set_result((None, []))
+
+    def _resolve_bulk_response(self, batch, body: Dict[str, Any]) -> set:
+        # Created issues are listed in request order, skipping the failed elements
+        failed_indexes = {error.get("failedElementNumber") for error in body.get("errors", [])}
+        failed_indexes.discard(None)
+        created = iter(body.get("issues", []))
+
+        for index, (_, _, future) in enumerate(batch):
+            if index in failed_indexes:
+                continue
+            issue = next(created, None)
+            if issue is None:
+                failed_indexes.add(index)
+                continue
+            log.log(f"Jira issue created: {issue['key']}")
+            future.set_result((issue["key"], []))
+
+        log.log(f"Bulk created {len(batch) - len(failed_indexes)} of {len(batch)} Jira issues")
+        return failed_indexes
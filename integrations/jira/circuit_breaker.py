@@ -0,0 +1,74 @@
+from threading import Lock
+from config import config
+import requests
+import time
+
+class JiraUnavailableError(requests.exceptions.RequestException):
+    """
+    Raised when Jira is down or the circuit breaker is open, so the caller can defer
+    the work. It is a `RequestException`, so callers that already handle failed
+    requests treat an open breaker the same way.
+    """
+
+class CircuitBreaker:
+    """
+    Fails Jira calls fast while Jira is down. After `failure_threshold` consecutive
+    failures (connection errors, timeouts or 5xx) the breaker opens and every call
+    raises `JiraUnavailableError` without touching the network. Once `reset_timeout`
+    has passed a single probe request is let through: success closes the breaker,
+    failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = config.JIRA_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = config.JIRA_BREAKER_RESET_TIMEOUT
+    ) -> None:
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds the breaker stays open before a probe is allowed.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.lock = Lock()
+
+    def before_request(self) -> None:
+        """
+        Checks whether a request may be sent.
+
+        Raises:
+            JiraUnavailableError: If the breaker is open, or half-open with a probe already in flight.
+        """
+        with self.lock:
+            if self.state == self.CLOSED:
+                return
+
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return
+
+            raise JiraUnavailableError(f"Jira circuit breaker is {self.state}")
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def is_closed(self) -> bool:
+        with self.lock:
+            return self.state == self.CLOSED
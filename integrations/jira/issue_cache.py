@@ -0,0 +1,104 @@
+from threading import Lock
+from typing import Dict, Any, List, Optional, Tuple
+import json
+import sqlite3
+from config import config
+
+class IssueCache:
+    """
+    Local SQLite cache of the per-issue results of `Jira_Handler.comment_hunter`,
+    keyed on issue key and Jira's `updated` timestamp, plus the time each sprint
+    was last scanned. Lets repeated scans fetch and parse only the issues that
+    changed since the previous run.
+    """
+
+    def __init__(self, filepath: str = config.JIRA_ISSUE_CACHE_FILEPATH) -> None:
+        """
+        Args:
+            filepath (str): Path of the SQLite database file.
+        """
+        self.lock = Lock()
+        self.connection = sqlite3.connect(filepath, check_same_thread=False)
+        with self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS issues (
+                    key TEXT NOT NULL,
+                    sprint_id TEXT NOT NULL,
+                    updated TEXT,
+                    issue_obj TEXT NOT NULL,
+                    categories TEXT NOT NULL,
+                    PRIMARY KEY (sprint_id, key)
+                )
+                """
+            )
+            self.connection.execute("CREATE TABLE IF NOT EXISTS scans (sprint_id TEXT PRIMARY KEY, last_run REAL NOT NULL)")
+
+    def get_last_run(self, sprint_id) -> Optional[float]:
+        """
+        Returns:
+            Optional[float]: Epoch seconds the sprint's last scan started at, or None if never scanned.
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT last_run FROM scans WHERE sprint_id = ?", (str(sprint_id),)).fetchone()
+        return row[0] if row else None
+
+    def get_updated(self, sprint_id) -> Dict[str, str]:
+        """
+        Returns:
+            Dict[str, str]: The cached `updated` timestamp of every issue of the sprint, by key.
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT key, updated FROM issues WHERE sprint_id = ?", (str(sprint_id),)).fetchall()
+        return dict(rows)
+
+    def get_issues(self, sprint_id) -> List[Tuple[Dict[str, Any], List[str]]]:
+        """
+        Returns:
+            List[Tuple[Dict[str, Any], List[str]]]: Each cached issue object with the
+            comment_hunter categories it was filed under.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT issue_obj, categories FROM issues WHERE sprint_id = ? ORDER BY rowid",
+                (str(sprint_id),)
+            ).fetchall()
+        return [(json.loads(issue_obj), json.loads(categories)) for issue_obj, categories in rows]
+
+    def save_scan(
+        self,
+        sprint_id,
+        last_run: float,
+        upserts: List[Tuple[str, Optional[str], Dict[str, Any], List[str]]],
+        removed_keys: List[str],
+        replace: bool = False
+    ) -> None:
+        """
+        Applies the result of a scan in one transaction.
+
+        Args:
+            sprint_id: The scanned sprint.
+            last_run (float): Epoch seconds the scan started at.
+            upserts (List[Tuple[str, Optional[str], Dict[str, Any], List[str]]]): Changed issues
+                as (key, updated, issue_obj, categories).
+            removed_keys (List[str]): Keys no longer in the sprint.
+            replace (bool): Drop every cached issue of the sprint first (full scan).
+        """
+        sprint_id = str(sprint_id)
+        with self.lock, self.connection:
+            if replace:
+                self.connection.execute("DELETE FROM issues WHERE sprint_id = ?", (sprint_id,))
+            self.connection.executemany(
+                "DELETE FROM issues WHERE sprint_id = ? AND key = ?",
+                [(sprint_id, key) for key in removed_keys]
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO issues (key, sprint_id, updated, issue_obj, categories) VALUES (?, ?, ?, ?, ?)",
+                [(key, sprint_id, updated, json.dumps(issue_obj), json.dumps(categories)) for key, updated, issue_obj, categories in upserts]
+            )
+            self.connection.execute("INSERT OR REPLACE INTO scans (sprint_id, last_run) VALUES (?, ?)", (sprint_id, last_run))
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
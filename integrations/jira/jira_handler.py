@@ -1,11 +1,76 @@
-from typing import Optional, Dict, Any
-# from app.models.JiraTicket import JiraTicket
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from app.models.JiraTicket import JiraTicket
 from logger import log
 import requests
 from config import config
+from integrations.jira.session import get_jira_session
+from integrations.jira.paginator import iter_paginated
+from integrations.jira.issue_cache import IssueCache
+from integrations.jira.trace_index import TraceIndex
+from integrations.jira.metadata_cache import get_jira_metadata
+from integrations.jira.circuit_breaker import JiraUnavailableError
+from integrations.jira.retry import request_was_sent
 import json
+import math
+import time
 import re
 
+# The only issue fields comment_hunter reads
+COMMENT_HUNTER_FIELDS = ["summary", "description", "comment"]
+
+# Comments whose extracted JSON is remembered per handler
+COMMENT_JSON_CACHE_SIZE = 10000
+
+_json_decoder = json.JSONDecoder()
+
+def extract_json_objects(text: str) -> List[dict]:
+    """
+    Finds every JSON object embedded in free text (e.g. an automatic Jira comment)
+    in a single left-to-right scan, decoding from each `{` that does not sit inside
+    an object already found.
+
+    Args:
+        text (str): The text to scan.
+
+    Returns:
+        List[dict]: The embedded JSON objects, in order of appearance.
+    """
+    # Jira comment bodies escape braces and wrap long JSON over several lines
+    text = text.replace("pertnent", "pertinent").replace('\n', '').replace('\t', '').replace('\\{', '{')
+
+    json_objects = []
+    start = text.find('{')
+    while start != -1:
+        try:
+            parsed, end = _json_decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            start = text.find('{', start + 1)
+            continue
+
+        json_objects.append(parsed)
+        start = text.find('{', end)
+
+    return json_objects
+
+def rejected_create_fields(response: requests.Response) -> List[str]:
+    """
+    Lists the optional create-time fields a failed create-issue response complains about.
+
+    Args:
+        response (requests.Response): The 4xx response from the create-issue endpoint.
+
+    Returns:
+        List[str]: Rejected fields that the issue can be created without.
+    """
+    try:
+        errors = response.json().get("errors", {})
+    except ValueError:
+        return []
+
+    return [field for field in JiraTicket.optional_create_fields() if field in errors]
+
 class Jira_Handler:
     
     def __init__(self) -> None:
@@ -18,6 +83,11 @@ class Jira_Handler:
         self.jira_api_token = config.JIRA_API_TOKEN
         self.project_key = config.JIRA_SERVE_PROJECT_KEY 
         self.auth = (self.jira_email, self.jira_api_token)
+        self.session = get_jira_session()
+        self.metadata = get_jira_metadata(self.session)
+        self.comment_json_cache: "OrderedDict[str, Optional[dict]]" = OrderedDict()
+        self.issue_cache: Optional[IssueCache] = None
+        self.trace_index: Optional[TraceIndex] = None
         
     def post_jira_ticket(
         self,
@@ -27,7 +97,7 @@ class Jira_Handler:
     ) -> Optional[str]:
         """
         Attempts to create a Jira issue using the provided payload and URL.
-        Retries the request if it fails.
+        Transient failures are retried by the session's `RetryPolicy`.
 
         Args:
             payload (Dict[str, Any]): The issue data to be sent to Jira.
@@ -37,23 +107,77 @@ class Jira_Handler:
         Returns:
             Optional[str]: The key of the created issue if successful, otherwise None.
         """
-        
-        issue_key = None
-        for retries in range(config.API_RETRIES):
-            try:
-                response = requests.post(url, json=payload, headers=headers, auth=self.auth)
+        try:
+            response = self.session.post(url, json=payload, headers=headers)
 
-                if response.status_code == 201:
-                    issue_key = response.json().get("key")
-                    print(f"Jira issue created: {issue_key}")
-                    break
-                else:
-                    print(f"Jira issue creation failed: {response.text}")
+            if response.status_code == 201:
+                issue_key = response.json().get("key")
+                log.log(f"Jira issue created: {issue_key}")
+                return issue_key
+            else:
+                log.log(f"Jira issue creation failed: {response.text}")
 
-            except requests.exceptions.RequestException as e:
-                    print(f"Jira API error while creating issue: {e}", "error")
-        
-        return issue_key
+        except requests.exceptions.RequestException as e:
+            log.log(f"Jira API error while creating issue: {e}", "error")
+
+        return None
+
+    def create_jira_ticket(
+        self,
+        payload: Dict[str, Any],
+        url: str,
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        Creates a Jira issue whose payload may carry create-time fields (assignee,
+        sprint, labels). If Jira rejects any of those fields, the issue is created
+        without them and the rejected fields are reported so the caller can set
+        them with a follow-up request.
+
+        Args:
+            payload (Dict[str, Any]): The issue data to be sent to Jira.
+            url (str): The API endpoint for issue creation.
+            headers (Dict[str, str], optional): HTTP headers for the request.
+
+        Returns:
+            Tuple[Optional[str], List[str]]: The created issue key (None on failure) and
+            the create-time fields that were dropped.
+
+        Raises:
+            JiraUnavailableError: If the issue was certainly not created (an open circuit
+                breaker, a connection that was never established, or a 429 after retries),
+                so the caller can park the ticket. A timeout or 5xx after the request was
+                sent may have created the issue, so it is reported as a failed create
+                instead of being parked and created a second time.
+        """
+        try:
+            response = self.session.post(url, json=payload, headers=headers)
+            if response.status_code == 201:
+                issue_key = response.json().get("key")
+                log.log(f"Jira issue created: {issue_key}")
+                return issue_key, []
+
+            log.log(f"Jira issue creation failed: {response.status_code} - {response.text}")
+            if response.status_code == 429:
+                raise JiraUnavailableError("Jira rate limited issue creation")
+            if response.status_code >= 500:
+                return None, []
+
+            rejected_fields = rejected_create_fields(response) if 400 <= response.status_code < 500 else []
+            if not rejected_fields:
+                return None, []
+
+        except JiraUnavailableError:
+            raise
+        except requests.exceptions.RequestException as e:
+            log.log(f"Jira API error while creating issue: {e}", "error")
+            if not request_was_sent(e):
+                raise JiraUnavailableError(f"Jira API error while creating issue: {e}") from e
+            return None, []
+
+        log.log(f"Retrying issue creation without rejected fields: {rejected_fields}")
+        fallback_payload = JiraTicket.without_fields(payload, rejected_fields)
+        return self.post_jira_ticket(fallback_payload, url, headers), rejected_fields
 
     def add_jira_issue_to_sprint(self, sprint_id: int, issue_key: str) -> None:
         """
@@ -63,14 +187,41 @@ class Jira_Handler:
             sprint_id (int): The ID of the sprint.
             issue_key (str): The Jira issue key (e.g., "BUG-123").
         """
+        self.add_jira_issues_to_sprint(sprint_id, [issue_key])
+
+    def add_jira_issues_to_sprint(self, sprint_id: int, issue_keys: List[str], chunk_size: int = 50) -> Dict[str, bool]:
+        """
+        Adds many Jira issues to a sprint, moving them out of any other sprint. The
+        Agile API takes up to 50 issues per request, so one request is sent per chunk.
+
+        Args:
+            sprint_id (int): The ID of the sprint.
+            issue_keys (List[str]): The Jira issue keys.
+            chunk_size (int): Issues per request (Jira's limit is 50).
+
+        Returns:
+            Dict[str, bool]: Whether each issue was added.
+        """
         sprint_url = f"{config.JIRA_BASE_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
-        sprint_payload = {"issues": [issue_key]}
-        sprint_response = requests.post(sprint_url, json=sprint_payload, auth=self.auth)
-        
-        if sprint_response.status_code == 204:
-            log(f"Added issue {issue_key} to Sprint {sprint_id}")
-        else:
-            log(f"Failed to add issue to Sprint: {sprint_response.text}")
+        results = {}
+        for i in range(0, len(issue_keys), chunk_size):
+            chunk = issue_keys[i:i + chunk_size]
+            try:
+                # Moving an issue into the sprint it is already in is a no-op, so this POST may be retried
+                sprint_response = self.session.post(sprint_url, idempotent=True, json={"issues": chunk})
+            except requests.exceptions.RequestException as e:
+                log.log(f"Failed to add {len(chunk)} issues to Sprint {sprint_id}: {e}", "error")
+                results.update((issue_key, False) for issue_key in chunk)
+                continue
+
+            added = sprint_response.status_code == 204
+            if added:
+                log.log(f"Added {len(chunk)} issues to Sprint {sprint_id}")
+            else:
+                log.log(f"Failed to add {len(chunk)} issues to Sprint {sprint_id}: {sprint_response.status_code} - {sprint_response.text}", "error")
+            results.update((issue_key, added) for issue_key in chunk)
+
+        return results
 
     def post_jira_comment(
         self,
@@ -93,64 +244,19 @@ class Jira_Handler:
         # print("URL:", url)
         # print("PAYLOAD:", payload)
 
-        response = requests.post(url, headers=headers, auth=self.auth, data=json.dumps(payload))
+        response = self.session.post(url, headers=headers, data=json.dumps(payload))
 
         if response.status_code == 201:
-            log("Jira comment added successfully!")
+            log.log("Jira comment added successfully!")
             return True
         else:
-            log(f"Failed to add Jira comment: {response.status_code} - {response.text}")
+            log.log(f"Failed to add Jira comment: {response.status_code} - {response.text}", "error")
             return False
 
-    def get_sprint_issues(self, sprint_id: int) -> list:
-        """
-        Fetches all issues for a given sprint using pagination.
-
-        Args:
-            sprint_id (int): The sprint ID to query.
-
-        Returns:
-            list: A list of issue objects returned by Jira.
-        """
-        url = f"{config.JIRA_BASE_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
-        response = requests.get(url, auth=(config.JIRA_EMAIL, config.JIRA_API_TOKEN))
-        
-        return response.json()["issues"]
-
-
-    def extract_json_from_automatic_jira_comment(self, jira_comment_string: str) -> Optional[dict]:
-        """
-        Attempts to extract a JSON object from a Jira comment string.
-
-        Args:
-            jira_comment_string (str): The raw comment string.
-
-        Returns:
-            Optional[dict]: The extracted JSON dictionary if found, otherwise None.
-        """
-        log("Searching for JSON in comment...")
-        curr_char = jira_comment_string[0]
-        while curr_char != '{':
-            try:
-                jira_comment_string = jira_comment_string[1:]
-                curr_char = jira_comment_string[0]
-            except IndexError:
-                log("No JSON found")
-                return None
-        
-        jira_comment_string = jira_comment_string.replace('\n', '').replace('\t', '')
-        try:
-            parsed = json.loads(jira_comment_string)
-        #	log(parsed["trace_id"])  # Or anything else you want to access
-        except json.JSONDecodeError as e:
-            # print("JSON parsing failed:", e)
-            return None
-        
-        return(parsed)
-    
     def search_jira_backlog(self, search_term: str) -> Optional[str]:
         """
         Searches Jira backlog issues by a trace ID or keyword in the summary.
+        For trace IDs, prefer `get_trace_index().lookup`, which only searches on a miss.
 
         Args:
             search_term (str): The term to search for in issue summaries.
@@ -168,124 +274,229 @@ class Jira_Handler:
             "fields": "summary,status"
         }
 
-        response = requests.get(
+        response = self.session.get(
             url,
             params=params,
-            auth=self.auth,
             headers={"Accept": "application/json"}
         )
 
-        log(f"Searching for Jira ticket for trace {search_term}")
+        log.log(f"Searching for Jira ticket for trace {search_term}")
         
         try:
             if response.status_code == 200:
                 issues = response.json().get("issues", [])
                 return issues[0]["key"]
             else:
-                log("Error searching for matches:", response.status_code, response.text)
+                log.log(f"Error searching for matches: {response.status_code} - {response.text}", "error")
                 return None
             
         except IndexError:
-            log(f"No Jira matches found for {search_term}")
+            log.log(f"No Jira matches found for {search_term}")
             return None
         
         except KeyError:
-            log(f"No Jira matches found for {search_term}")
+            log.log(f"No Jira matches found for {search_term}")
             return None
         
-    def get_sprint_issues(self, sprint_id):
-        issues = []
-        start = 0
-        max_results = 100
-        while True:
-            url = f"{config.JIRA_BASE_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
-            params = {"startAt": start, "maxResults": max_results}
-            response = requests.get(url, auth=(config.JIRA_EMAIL, config.JIRA_API_TOKEN), params=params)
-        
-            if response.status_code != 200:
-                log.error(f"Failed to get issues for sprint {sprint_id}: {response.text}")
-                break
-        
-            page = response.json()
-            issues.extend(page.get("issues", []))
-        
-            if start + max_results >= page.get("total", 0):
-                break
-        
-            start += max_results
-        
-        return issues
+    def get_trace_index(self) -> TraceIndex:
+        """
+        Returns the handler's trace-to-issue index, creating it on first use and warming it
+        in the background. `Reporter` calls this at startup when `TRACE_INDEX_ENABLED` is set.
 
+        Returns:
+            TraceIndex: Index with O(1) `lookup` and batched `lookup_many`.
+        """
+        if self.trace_index is None:
+            self.trace_index = TraceIndex(self)
+            self.trace_index.start()
 
-    def extract_json_from_automatic_jira_comment(self, jira_comment_string):
-        jira_comment_string = jira_comment_string.replace("pertnent", "pertinent").replace('\n', '').replace('\t', '').replace('\\{', '{')
-        curr_char = jira_comment_string[0]
-        while curr_char != '{':
-            try:
-                jira_comment_string = jira_comment_string[1:]
-                curr_char = jira_comment_string[0]
-            except IndexError:
-                # print("No JSON found")
-                return None
-        
-        curr_char = jira_comment_string[-1]
-        while curr_char != '}':
-            try:
-                jira_comment_string = jira_comment_string[:-1]
-                curr_char = jira_comment_string[-1]
-            except IndexError:
-                # print("No JSON found")
-                return None
-        
-        
-        try:
-            parsed = json.loads(jira_comment_string)
-        except json.JSONDecodeError as e:
-            # log("No JSON Found:", e)
-            return None
-        
-        return(parsed)
+        return self.trace_index
+
+    def iter_sprint_issues(self, sprint_id: int, fields: Optional[List[str]] = None, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the issues of a sprint page by page. Pages after the first are
+        fetched concurrently (see `iter_paginated`) while earlier ones are consumed.
+
+        Args:
+            sprint_id (int): The sprint ID to query.
+            fields (Optional[List[str]]): Issue fields to request (e.g. ["summary", "comment"]).
+                All fields are returned if omitted.
+            page_size (int): Issues requested per page.
+
+        Yields:
+            Dict[str, Any]: Issue objects, in Jira's order.
+
+        Raises:
+            requests.exceptions.RequestException: If a page could not be fetched.
+        """
+        url = f"{config.JIRA_BASE_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
+        params = {"fields": ",".join(fields)} if fields else {}
+        return iter_paginated(self.session, url, "issues", params, page_size)
+
+    def iter_search_issues(self, jql: str, fields: Optional[List[str]] = None, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Streams every issue matching a JQL query, fetching pages concurrently.
+
+        Args:
+            jql (str): The JQL query.
+            fields (Optional[List[str]]): Issue fields to request. All navigable fields if omitted.
+            page_size (int): Issues requested per page.
+
+        Yields:
+            Dict[str, Any]: Matching issue objects, in the query's order.
+
+        Raises:
+            requests.exceptions.RequestException: If a page could not be fetched.
+        """
+        params = {"jql": jql}
+        if fields:
+            params["fields"] = ",".join(fields)
+        return iter_paginated(self.session, f"{self.jira_domain}/rest/api/2/search", "issues", params, page_size)
 
-    def comment_hunter(self, sprint_id: int) -> Dict[str, list]:
+    def get_sprint_issues(self, sprint_id: int, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetches all issues for a given sprint using pagination.
+        Prefer `iter_sprint_issues` for large sprints.
+
+        Args:
+            sprint_id (int): The sprint ID to query.
+            fields (Optional[List[str]]): Issue fields to request. All fields if omitted.
+
+        Returns:
+            List[Dict[str, Any]]: A list of issue objects returned by Jira.
+        """
+        return list(self.iter_sprint_issues(sprint_id, fields=fields))
+
+
+    def extract_json_from_automatic_jira_comment(self, jira_comment_string: str, comment_id: Optional[str] = None) -> Optional[dict]:
+        """
+        Extracts the first JSON object embedded in a Jira comment string.
+        Results are memoized by comment id, so re-scanning a sprint does not parse
+        the same comments again.
+
+        Args:
+            jira_comment_string (str): The raw comment string.
+            comment_id (Optional[str]): Identity of the comment (e.g. its id and updated
+                timestamp). Results are only memoized when given.
+
+        Returns:
+            Optional[dict]: The extracted JSON dictionary if found, otherwise None.
+        """
+        if comment_id is not None and comment_id in self.comment_json_cache:
+            self.comment_json_cache.move_to_end(comment_id)
+            return self.comment_json_cache[comment_id]
+
+        json_objects = extract_json_objects(jira_comment_string)
+        parsed = json_objects[0] if json_objects else None
+
+        if comment_id is not None:
+            self.comment_json_cache[comment_id] = parsed
+            if len(self.comment_json_cache) > COMMENT_JSON_CACHE_SIZE:
+                self.comment_json_cache.popitem(last=False)
+
+        return parsed
+
+    def comment_hunter(self, sprint_id: int, incremental: bool = False) -> Dict[str, list]:
         """
         Collects comments from all issues in a sprint and classifies them by whether
         JSON was found in the comments.
 
         Args:
             sprint_id (int): The sprint ID to scan.
+            incremental (bool): Only fetch and parse issues updated since the previous
+                incremental scan of this sprint, reusing cached results for the rest.
 
         Returns:
             Dict[str, list]: A dictionary with keys "json_found", "no_json_found", and "no_comment_found".
-        """
-        jira_issues = self.get_sprint_issues(sprint_id)
 
+        Raises:
+            requests.exceptions.RequestException: If a page of issues could not be fetched.
+                An incremental scan is then not recorded, so the next one covers the same window.
+        """
         issue_types = {
             "json_found": [],
             "no_json_found": [],
             "no_comment_found": []
         }
 
-        for issue in jira_issues:
-            issue_obj = {
-                'key': issue["key"], 
-                'trace': re.search("trace_.{12}", issue["fields"]["summary"])[0], 
-                "description": issue["fields"]["description"], 
-                'comments': [], 
-                'json_obj': None }
-            
-            if issue["fields"]["comment"]['comments']:
-                for comment in issue["fields"]["comment"]['comments']:
-                    issue_obj['comments'].append(comment)
-                    if self.extract_json_from_automatic_jira_comment(str(comment['body'])):
-                        issue_obj['json_obj'] = self.extract_json_from_automatic_jira_comment(str(comment['body']))
-                        issue_types["json_found"].append(issue_obj)
-                    else:
-                        issue_types["no_json_found"].append(issue_obj)
-            else:
-                issue_types["no_comment_found"].append(issue_obj)
-                
+        if incremental:
+            classified_issues = self._scan_sprint_incrementally(sprint_id)
+        else:
+            jira_issues = self.iter_sprint_issues(sprint_id, fields=COMMENT_HUNTER_FIELDS)
+            classified_issues = (self._classify_issue(issue) for issue in jira_issues)
+
+        for issue_obj, categories in classified_issues:
+            for category in categories:
+                issue_types[category].append(issue_obj)
+
         return issue_types
-        
+
+    def _classify_issue(self, issue: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        issue_obj = {
+            'key': issue["key"], 
+            'trace': re.search("trace_.{12}", issue["fields"]["summary"])[0], 
+            "description": issue["fields"]["description"], 
+            'comments': [], 
+            'json_obj': None }
+
+        # One category per comment, as an issue is listed once for each of its comments
+        categories = []
+        if issue["fields"]["comment"]['comments']:
+            for comment in issue["fields"]["comment"]['comments']:
+                issue_obj['comments'].append(comment)
+                json_obj = self.extract_json_from_automatic_jira_comment(
+                    str(comment['body']),
+                    comment_id=f"{comment.get('id')}@{comment.get('updated')}" if comment.get('id') else None
+                )
+                if json_obj:
+                    issue_obj['json_obj'] = json_obj
+                    categories.append("json_found")
+                else:
+                    categories.append("no_json_found")
+        else:
+            categories.append("no_comment_found")
+
+        return issue_obj, categories
+
+    def _scan_sprint_incrementally(self, sprint_id: int) -> List[Tuple[Dict[str, Any], List[str]]]:
+        if self.issue_cache is None:
+            self.issue_cache = IssueCache()
+
+        scan_started = time.time()
+        last_run = self.issue_cache.get_last_run(sprint_id)
+        fields = COMMENT_HUNTER_FIELDS + ["updated"]
+
+        if last_run is None:
+            log.log(f"No cached scan of sprint {sprint_id}. Scanning it in full.")
+            upserts = [
+                (issue["key"], issue["fields"].get("updated"), *self._classify_issue(issue))
+                for issue in self.iter_sprint_issues(sprint_id, fields=fields)
+            ]
+            self.issue_cache.save_scan(sprint_id, scan_started, upserts, [], replace=True)
+            return self.issue_cache.get_issues(sprint_id)
+
+        # Relative JQL dates sidestep the Jira user's timezone; one extra minute covers rounding
+        since = f"-{math.ceil((scan_started - last_run) / 60) + 1}m"
+        cached_updated = self.issue_cache.get_updated(sprint_id)
+
+        upserts = []
+        for issue in self.iter_search_issues(f"sprint = {sprint_id} AND updated >= {since}", fields=fields):
+            updated = issue["fields"].get("updated")
+            if cached_updated.get(issue["key"]) != updated:
+                upserts.append((issue["key"], updated, *self._classify_issue(issue)))
+
+        # Issues moved out of the sprint were updated too, but no longer match `sprint = X`
+        removed_keys = []
+        projects = sorted({key.rsplit("-", 1)[0] for key in cached_updated})
+        if projects:
+            jql = f'project in ({", ".join(projects)}) AND updated >= {since} AND (sprint != {sprint_id} OR sprint is EMPTY)'
+            removed_keys = [issue["key"] for issue in self.iter_search_issues(jql, fields=["updated"]) if issue["key"] in cached_updated]
+
+        # A failed page raises before this point, so the watermark only advances after a complete scan
+        self.issue_cache.save_scan(sprint_id, scan_started, upserts, removed_keys)
+        log.log(f"Incremental scan of sprint {sprint_id}: {len(upserts)} changed, {len(removed_keys)} removed")
+        return self.issue_cache.get_issues(sprint_id)
+
     def output_comment_hunter(self, issues_objects: dict) -> None:
         """
         Placeholder for a function that would process or output the structured result
@@ -308,55 +519,259 @@ class Jira_Handler:
             bool: True if deletion was successful, False otherwise.
         """
         url = f"{self.jira_domain}/rest/api/3/issue/{issue_key}/comment/{comment_id}"
-        response = requests.delete(url=url, auth=self.auth)
+        response = self.session.delete(url)
         
         if response.status_code == 204:
-            log("Comment deleted successfully.")
+            log.log("Comment deleted successfully.")
             return True
         else:
-            log(f"Failed to delete comment: {response.status_code} - {response.text}")
+            log.log(f"Failed to delete comment: {response.status_code} - {response.text}", "error")
             return False
+
+    def post_jira_comments(
+        self,
+        comments: List[Tuple[str, Dict[str, Any]]],
+        dry_run: bool = False,
+        max_workers: int = config.JIRA_COMMENT_CONCURRENCY
+    ) -> List[Optional[bool]]:
+        """
+        Posts many comments concurrently, at most `max_workers` at a time. Requests
+        still go through the session's rate limiter and retries.
+
+        Args:
+            comments (List[Tuple[str, Dict[str, Any]]]): (issue key, comment payload) pairs.
+            dry_run (bool): Only log the comments that would be posted.
+            max_workers (int): Maximum number of requests in flight.
+
+        Returns:
+            List[Optional[bool]]: Whether each comment was posted, in input order (None on a dry run).
+        """
+        def post(comment: Tuple[str, Dict[str, Any]]) -> bool:
+            issue_key, payload = comment
+            return self.post_jira_comment(payload, f"{self.jira_domain}/rest/api/3/issue/{issue_key}/comment")
+
+        return self._run_comment_batch("post", comments, post, dry_run, max_workers)
+
+    def delete_jira_comments(
+        self,
+        comments: List[Tuple[str, str]],
+        dry_run: bool = False,
+        max_workers: int = config.JIRA_COMMENT_CONCURRENCY
+    ) -> List[Optional[bool]]:
+        """
+        Deletes many comments concurrently, at most `max_workers` at a time. Requests
+        still go through the session's rate limiter and retries.
+
+        Args:
+            comments (List[Tuple[str, str]]): (issue key, comment id) pairs, e.g. from `find_automatic_comments`.
+            dry_run (bool): Only log the comments that would be deleted.
+            max_workers (int): Maximum number of requests in flight.
+
+        Returns:
+            List[Optional[bool]]: Whether each comment was deleted, in input order (None on a dry run).
+        """
+        return self._run_comment_batch("delete", comments, lambda comment: self.delete_jira_comment(*comment), dry_run, max_workers)
+
+    def find_automatic_comments(self, sprint_id: int, incremental: bool = False) -> List[Tuple[str, str]]:
+        """
+        Finds the bot-generated comments of a sprint: those written by the bot's own
+        Jira account (`config.JIRA_EMAIL`) that `comment_hunter` found JSON in.
+        Comments by anyone else are never returned, even if they contain JSON.
+
+        Args:
+            sprint_id (int): The sprint ID to scan.
+            incremental (bool): Passed on to `comment_hunter`.
+
+        Returns:
+            List[Tuple[str, str]]: (issue key, comment id) of every automatic comment.
+        """
+        bot_user = self.metadata.get_current_user() or {}
+        bot_account_id = bot_user.get("accountId")
+        if not bot_account_id:
+            log.log("Could not identify the bot's Jira account. No comments are treated as automatic.", "error")
+            return []
+
+        automatic_comments = []
+        seen_keys = set()
+        for issue_obj in self.comment_hunter(sprint_id, incremental)["json_found"]:
+            # comment_hunter lists an issue once per comment
+            if issue_obj["key"] in seen_keys:
+                continue
+            seen_keys.add(issue_obj["key"])
+            for comment in issue_obj["comments"]:
+                if not comment.get('id') or (comment.get('author') or {}).get('accountId') != bot_account_id:
+                    continue
+                comment_id = f"{comment['id']}@{comment.get('updated')}"
+                if self.extract_json_from_automatic_jira_comment(str(comment['body']), comment_id=comment_id):
+                    automatic_comments.append((issue_obj["key"], comment['id']))
+
+        return automatic_comments
+
+    def _run_comment_batch(self, action: str, items: list, fn, dry_run: bool, max_workers: int) -> List[Optional[bool]]:
+        if dry_run:
+            for item in items:
+                log.log(f"[dry run] Would {action} comment on {item[0]}: {item[1]}")
+            log.log(f"[dry run] {len(items)} comments would be {action}d")
+            return [None] * len(items)
+
+        results: List[Optional[bool]] = [None] * len(items)
+        progress_step = max(1, len(items) // 10)
+        done = failed = 0
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"jira-comment-{action}") as executor:
+            futures = {executor.submit(fn, item): index for index, item in enumerate(items)}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except requests.exceptions.RequestException as e:
+                    log.log(f"Failed to {action} comment on {items[futures[future]][0]}: {e}", "error")
+                    results[futures[future]] = False
+                done += 1
+                failed += not results[futures[future]]
+                if done % progress_step == 0 or done == len(items):
+                    log.log(f"Comment {action}: {done}/{len(items)} done, {failed} failed")
+
+        return results
    
-    def update_ticket_status(self, issue_key: str, status_name: str) -> None:
+    def update_ticket_status(self, issue_key: str, status_name: str, issue_type: Optional[str] = None) -> bool:
         """
-            Updates the status of a specific Jira issue.
+            Updates the status of a specific Jira issue. The transition id is looked up
+            in the shared `JiraMetadataCache`, per project and issue type, so only the
+            first move to a status in a workflow needs to discover its transitions.
             
             Args:
             issue_key (str): The key of the issue (e.g., "FLORA-1234").
             status_name (str): The legible name of the status we're changing the issue into.
+            issue_type (Optional[str]): The issue's type, if known (saves looking it up).
 
-            To-Do:
-                Check response for error handling and return purposes
-        """
-        status_dict = {
-            "Needs Review": "2",
-            "Waiting for Deploy": "3",
-            "Won't Do": "4",
-            "Blocked": "5",
-            "Needs Validation": "6",
-            "To Do": "11",
-            "In Progress": "21",
-            "Done": "31",
-            "Waiting on further details": "32"
-        }
-        
-        payload = {
-            "transition": {
-                "id": status_dict[status_name]
-            }
-        }
+            Returns:
+                bool: True if the issue was transitioned.
+        """
+        transition_id = self.metadata.get_transition_id(issue_key, status_name, issue_type)
+        if transition_id is None:
+            log.log(f"No transition to '{status_name}' is available for {issue_key}", "error")
+            return False
+
+        url = f"{self.jira_domain}/rest/api/3/issue/{issue_key}/transitions"
+        response = self.session.post(url, json={"transition": {"id": transition_id}})
+        if response.status_code == 400:
+            # The cached id may be stale; rediscover it from this issue
+            refreshed_id = self.metadata.get_transition_id(issue_key, status_name, issue_type, refresh=True)
+            if refreshed_id is None:
+                log.log(f"No transition to '{status_name}' is available for {issue_key}", "error")
+                return False
+            if refreshed_id != transition_id:
+                response = self.session.post(url, json={"transition": {"id": refreshed_id}})
 
-        response = requests.post(f"{self.jira_domain}/rest/api/3/issue/{issue_key}/transitions", headers={"Content-Type": "application/json"}, auth=self.auth, data=json.dumps(payload))
+        if response.status_code != 204:
+            log.log(f"Failed to move {issue_key} to '{status_name}': {response.status_code} - {response.text}", "error")
+            return False
+        return True
         
-    def get_jira_boards():
-        url = f"{config.JIRA_BASE_URL}/rest/agile/1.0/board"
-        response = requests.get(url, auth=self.auth)
-        if response.status_code == 200:
-            boards = response.json().get("values", [])
-            return boards
-        else:
-            print(f"Failed to get boards: {response.text}")
-            return []
+    def update_ticket_statuses(
+        self,
+        issue_keys: List[str],
+        status_name: str,
+        max_workers: int = config.JIRA_TRANSITION_CONCURRENCY
+    ) -> Dict[str, bool]:
+        """
+        Moves many issues to a status. Jira has no bulk transition endpoint, so the
+        transitions run concurrently, at most `max_workers` at a time (the session's
+        rate limiter still applies).
+
+        Args:
+            issue_keys (List[str]): The Jira issue keys.
+            status_name (str): The legible name of the status the issues move into.
+            max_workers (int): Maximum number of transitions in flight.
+
+        Returns:
+            Dict[str, bool]: Whether each issue was transitioned.
+        """
+        if not issue_keys:
+            return {}
+
+        # Look up the issue types in bulk, then discover each workflow's transition once
+        # up front rather than in every worker
+        issue_types = self.metadata.get_issue_types(issue_keys)
+        first_of_type = {}
+        for issue_key in issue_keys:
+            first_of_type.setdefault(issue_types.get(issue_key), issue_key)
+        for issue_type, issue_key in first_of_type.items():
+            if issue_type is not None:
+                try:
+                    self.metadata.get_transition_id(issue_key, status_name, issue_type)
+                except requests.exceptions.RequestException as e:
+                    log.log(f"Failed to discover transitions for {issue_type} issues: {e}", "warning")
+
+        def move(issue_key: str) -> bool:
+            try:
+                return self.update_ticket_status(issue_key, status_name, issue_types.get(issue_key))
+            except requests.exceptions.RequestException as e:
+                log.log(f"Failed to move {issue_key} to '{status_name}': {e}", "error")
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jira-transition") as executor:
+            moved = list(executor.map(move, issue_keys))
+
+        results = dict(zip(issue_keys, moved))
+        failed = [issue_key for issue_key, ok in results.items() if not ok]
+        log.log(f"Moved {len(results) - len(failed)}/{len(results)} issues to '{status_name}'" + (f"; failed: {', '.join(failed)}" if failed else ""))
+        return results
+
+    def move_issues(self, issue_keys: List[str], sprint_id: int, status_name: Optional[str] = None) -> Dict[str, bool]:
+        """
+        Moves many issues into a sprint (e.g. from `BUG_INTAKE_SPRINT_ID` to
+        `BUG_TRIAGE_SPRINT_ID`) and, optionally, to a new status.
+
+        Args:
+            issue_keys (List[str]): The Jira issue keys.
+            sprint_id (int): The ID of the sprint the issues move into.
+            status_name (Optional[str]): The status the issues move into, if any.
+
+        Returns:
+            Dict[str, bool]: Whether each issue was moved (and transitioned).
+        """
+        results = self.add_jira_issues_to_sprint(sprint_id, issue_keys)
+        if status_name:
+            moved = [issue_key for issue_key, ok in results.items() if ok]
+            results.update(self.update_ticket_statuses(moved, status_name))
+        return results
+
+    def get_jira_boards(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Lists every Jira board, served from the metadata cache.
+
+        Args:
+            refresh (bool): Fetch the boards again even if the cached list has not expired.
+
+        Returns:
+            List[Dict[str, Any]]: Board objects (empty if the request failed).
+        """
+        return self.metadata.get_boards(refresh)
+
+    def get_board_sprints(self, board_id: int, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Lists a board's active and future sprints, served from the metadata cache.
+
+        Returns:
+            List[Dict[str, Any]]: Sprint objects (empty if the request failed).
+        """
+        return self.metadata.get_sprints(board_id, refresh)
+
+    def get_assignee_id(self, assignee: str) -> Optional[str]:
+        """
+        Resolves a ticket assignee to a Jira account id. Names configured in
+        `config.JIRA_ASSIGNEE_ID_DICT` win; anything else is matched against the
+        display names of the project's assignable users.
+
+        Args:
+            assignee (str): A `JIRA_ASSIGNEE_ID_DICT` key or a Jira display name.
+
+        Returns:
+            Optional[str]: The account id, or None if the assignee is unknown.
+        """
+        if assignee in config.JIRA_ASSIGNEE_ID_DICT:
+            return config.JIRA_ASSIGNEE_ID_DICT[assignee]
+        return self.metadata.find_account_id(self.project_key, assignee)
         
     def assign_ticket(self, issue_key: str, assignee: str) -> bool:
 
@@ -364,11 +779,10 @@ class Jira_Handler:
         payload = {"accountId": assignee}
         
         try:
-            response = requests.put(
+            response = self.session.put(
                 url, 
                 json=payload, 
-                headers={"Content-Type": "application/json"}, 
-                auth=self.auth
+                headers={"Content-Type": "application/json"}
             )
             
             if response.status_code == 204:
@@ -380,4 +794,13 @@ class Jira_Handler:
                 
         except requests.exceptions.RequestException as e:
             log.log(f"Error assigning ticket: {e}", "error")
-            return False
\ No newline at end of file
+            return False
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns per-host connection pool stats for the shared Jira session.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Requests sent, connections opened and reuse ratio per host.
+        """
+        return self.session.pool_stats()
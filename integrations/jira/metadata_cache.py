@@ -0,0 +1,320 @@
+from threading import Lock
+from typing import Dict, Any, List, Optional, Callable, Iterable
+import json
+import os
+import requests
+import tempfile
+import time
+from integrations.jira.paginator import iter_paginated
+from logger import log
+from config import config
+
+class JiraMetadataCache:
+    """
+    TTL cache for Jira metadata that rarely changes: workflow transitions, boards,
+    sprints, assignable users and the bot's own Jira account. Entries are discovered from Jira on first use,
+    refreshed once they are older than the TTL, and persisted to disk so a restart
+    does not have to fetch them again.
+    """
+
+    def __init__(
+        self,
+        session,
+        jira_domain: str = config.JIRA_BASE_URL,
+        ttl: float = config.JIRA_METADATA_TTL,
+        filepath: Optional[str] = config.JIRA_METADATA_CACHE_FILEPATH
+    ) -> None:
+        """
+        Args:
+            session (JiraSession): Session used to fetch metadata.
+            jira_domain (str): Jira base URL.
+            ttl (float): Seconds before an entry is fetched again.
+            filepath (Optional[str]): JSON file the cache is persisted to, or None for memory only.
+        """
+        self.session = session
+        self.jira_domain = jira_domain
+        self.ttl = ttl
+        self.filepath = filepath
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.lock = Lock()
+        self.file_lock = Lock()
+        self._load()
+
+    def get(self, name: str, loader: Callable[[], Any], refresh: bool = False) -> Any:
+        """
+        Returns a cached entry, loading it if it is missing, expired or `refresh` is set.
+
+        Args:
+            name (str): Cache key.
+            loader (Callable[[], Any]): Fetches the value from Jira. Returning None skips caching.
+            refresh (bool): Ignore the cached value.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        with self.lock:
+            entry = self.entries.get(name)
+        if not refresh and self._is_fresh(entry):
+            return entry["value"]
+
+        value = loader()
+        if value is None:
+            return entry["value"] if entry else None
+
+        with self.lock:
+            self.entries[name] = {"value": value, "fetched_at": time.time()}
+        self._save()
+        return value
+
+    def invalidate(self, name: str) -> None:
+        with self.lock:
+            self.entries.pop(name, None)
+        self._save()
+
+    def get_transition_id(self, issue_key: str, status_name: str, issue_type: Optional[str] = None, refresh: bool = False) -> Optional[str]:
+        """
+        Finds the id of the transition that moves an issue to a status (or has that name).
+        Transition ids are shared by every issue of a workflow, and workflows are assigned
+        per project and issue type, so they are cached under both and only discovered
+        from `issue_key`'s transitions when the status is not known yet.
+
+        Args:
+            issue_key (str): The issue being transitioned (e.g. "SER-123").
+            status_name (str): Target status or transition name (e.g. "In Progress").
+            issue_type (Optional[str]): The issue's type, if known (default: looked up and cached).
+            refresh (bool): Re-discover the transitions even if the status is cached.
+
+        Returns:
+            Optional[str]: The transition id, or None if the workflow has no such transition.
+        """
+        issue_type = issue_type or self.get_issue_type(issue_key)
+        if issue_type is None:
+            # Without the issue type the workflow is unknown, so nothing is cached
+            discovered = self._fetch_transitions(issue_key)
+            return discovered.get(status_name) if discovered else None
+
+        name = f"transitions:{issue_key.rsplit('-', 1)[0]}:{issue_type}"
+        transitions = self._fresh_value(name) or {}
+        if status_name in transitions and not refresh:
+            return transitions[status_name]
+
+        discovered = self._fetch_transitions(issue_key)
+        if discovered is None:
+            # Fall back to a stale entry rather than failing the transition
+            with self.lock:
+                stale = self.entries.get(name, {}).get("value", {})
+            return stale.get(status_name)
+
+        with self.lock:
+            # Transitions of other issues in the workflow are kept until the entry expires
+            entry = self.entries.get(name)
+            transitions = dict(entry["value"] if self._is_fresh(entry) else {}, **discovered)
+            self.entries[name] = {"value": transitions, "fetched_at": time.time()}
+        self._save()
+        return transitions.get(status_name)
+
+    def get_issue_type(self, issue_key: str) -> Optional[str]:
+        """
+        Returns:
+            Optional[str]: The issue's type name, or None if it could not be looked up.
+        """
+        return self.get_issue_types([issue_key]).get(issue_key)
+
+    def get_issue_types(self, issue_keys: Iterable[str], chunk_size: int = 100) -> Dict[str, str]:
+        """
+        Looks up the type of many issues, with one search per `chunk_size` uncached keys.
+
+        Args:
+            issue_keys (Iterable[str]): The Jira issue keys.
+            chunk_size (int): Keys per search.
+
+        Returns:
+            Dict[str, str]: Type name by issue key, for every issue that could be looked up.
+        """
+        issue_keys = list(issue_keys)
+        known = self._fresh_value("issue_types") or {}
+        missing = [issue_key for issue_key in issue_keys if issue_key not in known]
+        if missing:
+            discovered = {}
+            url = f"{self.jira_domain}/rest/api/2/search"
+            for i in range(0, len(missing), chunk_size):
+                chunk = missing[i:i + chunk_size]
+                params = {"jql": f"key in ({', '.join(chunk)})", "fields": "issuetype", "validateQuery": "warn"}
+                try:
+                    for issue in iter_paginated(self.session, url, "issues", params, page_size=chunk_size):
+                        if issue["key"] in chunk:
+                            discovered[issue["key"]] = issue["fields"]["issuetype"]["name"]
+                except requests.exceptions.RequestException as e:
+                    log.log(f"Failed to look up issue types: {e}", "error")
+
+            if discovered:
+                with self.lock:
+                    entry = self.entries.get("issue_types")
+                    if not self._is_fresh(entry):
+                        entry = {"value": {}, "fetched_at": time.time()}
+                    known = dict(entry["value"], **discovered)
+                    self.entries["issue_types"] = {"value": known, "fetched_at": entry["fetched_at"]}
+                self._save()
+
+        return {issue_key: known[issue_key] for issue_key in issue_keys if issue_key in known}
+
+    def get_current_user(self, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Returns:
+            Optional[Dict[str, Any]]: The Jira user the bot authenticates as (from `/myself`),
+            or None if it could not be fetched.
+        """
+        return self.get("myself", self._fetch_current_user, refresh)
+
+    def get_boards(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Returns:
+            List[Dict[str, Any]]: Every Jira board.
+        """
+        url = f"{self.jira_domain}/rest/agile/1.0/board"
+        return self.get("boards", lambda: self._fetch_values(url), refresh) or []
+
+    def get_sprints(self, board_id: int, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Args:
+            board_id (int): The board whose sprints are listed.
+
+        Returns:
+            List[Dict[str, Any]]: The board's active and future sprints.
+        """
+        url = f"{self.jira_domain}/rest/agile/1.0/board/{board_id}/sprint"
+        params = {"state": "active,future"}
+        return self.get(
+            f"sprints:{board_id}",
+            lambda: self._fetch_values(url, params),
+            refresh
+        ) or []
+
+    def get_assignable_users(self, project_key: str, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Args:
+            project_key (str): The project issues are assigned in.
+
+        Returns:
+            List[Dict[str, Any]]: Users that can be assigned issues of the project.
+        """
+        return self.get(f"assignable_users:{project_key}", lambda: self._fetch_assignable_users(project_key), refresh) or []
+
+    def find_account_id(self, project_key: str, display_name: str) -> Optional[str]:
+        """
+        Resolves an assignable user's display name to their account id.
+
+        Returns:
+            Optional[str]: The account id, or None if no assignable user has that name.
+        """
+        for user in self.get_assignable_users(project_key):
+            if user.get("displayName") == display_name:
+                return user.get("accountId")
+        return None
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        return bool(entry) and time.time() - entry["fetched_at"] < self.ttl
+
+    def _fresh_value(self, name: str) -> Any:
+        # The cached value without loading anything, or None if it is missing or expired
+        with self.lock:
+            entry = self.entries.get(name)
+        return entry["value"] if self._is_fresh(entry) else None
+
+    def _fetch_transitions(self, issue_key: str) -> Optional[Dict[str, str]]:
+        response = self.session.get(f"{self.jira_domain}/rest/api/3/issue/{issue_key}/transitions")
+        if response.status_code != 200:
+            log.log(f"Failed to get transitions for {issue_key}: {response.status_code} - {response.text}", "error")
+            return None
+
+        transitions = {}
+        for transition in response.json().get("transitions", []):
+            transitions[transition["name"]] = transition["id"]
+            target_status = transition.get("to", {}).get("name")
+            if target_status:
+                transitions.setdefault(target_status, transition["id"])
+        return transitions
+
+    def _fetch_current_user(self) -> Optional[Dict[str, Any]]:
+        try:
+            response = self.session.get(f"{self.jira_domain}/rest/api/3/myself")
+        except requests.exceptions.RequestException as e:
+            log.log(f"Failed to get the current Jira user: {e}", "error")
+            return None
+        if response.status_code != 200:
+            log.log(f"Failed to get the current Jira user: {response.status_code} - {response.text}", "error")
+            return None
+        user = response.json()
+        return {"accountId": user.get("accountId"), "emailAddress": user.get("emailAddress")}
+
+    def _fetch_values(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[List[Dict[str, Any]]]:
+        # None (keep any stale entry) on failure, rather than caching a truncated list
+        try:
+            return list(iter_paginated(self.session, url, "values", params, page_size=50)) or None
+        except requests.exceptions.RequestException as e:
+            log.log(f"Failed to list {url}: {e}", "error")
+            return None
+
+    def _fetch_assignable_users(self, project_key: str, page_size: int = 100) -> Optional[List[Dict[str, Any]]]:
+        # This endpoint pages with startAt/maxResults but returns a bare list
+        url = f"{self.jira_domain}/rest/api/3/user/assignable/search"
+        users = []
+        while True:
+            try:
+                response = self.session.get(url, params={"project": project_key, "startAt": len(users), "maxResults": page_size})
+            except requests.exceptions.RequestException as e:
+                log.log(f"Failed to get assignable users for {project_key}: {e}", "error")
+                return None
+            if response.status_code != 200:
+                log.log(f"Failed to get assignable users for {project_key}: {response.status_code} - {response.text}", "error")
+                return None
+            page = response.json()
+            users.extend(page)
+            if len(page) < page_size:
+                return users
+
+    def _load(self) -> None:
+        if not self.filepath or not os.path.exists(self.filepath):
+            return
+
+        try:
+            with open(self.filepath, 'r') as cache_file:
+                self.entries = json.load(cache_file)
+        except (OSError, ValueError) as e:
+            log.log(f"Ignoring unreadable Jira metadata cache: {e}", "warning")
+
+    def _save(self) -> None:
+        # A cache that cannot be written is only slower to start, so failures are logged, not raised
+        if not self.filepath:
+            return
+
+        with self.file_lock:
+            with self.lock:
+                data = json.dumps(self.entries)
+            try:
+                with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(self.filepath)), delete=False) as cache_file:
+                    cache_file.write(data)
+                os.replace(cache_file.name, self.filepath)
+            except OSError as e:
+                log.log(f"Failed to save Jira metadata cache: {e}", "warning")
+
+_shared_metadata: Optional[JiraMetadataCache] = None
+_shared_metadata_lock = Lock()
+
+def get_jira_metadata(session) -> JiraMetadataCache:
+    """
+    Returns the process-wide Jira metadata cache, creating it on first use.
+
+    Args:
+        session (JiraSession): Session used to fetch metadata.
+
+    Returns:
+        JiraMetadataCache: The shared metadata cache.
+    """
+    global _shared_metadata
+    if _shared_metadata is None:
+        with _shared_metadata_lock:
+            if _shared_metadata is None:
+                _shared_metadata = JiraMetadataCache(session)
+
+    return _shared_metadata
@@ -0,0 +1,85 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional
+from logger import log
+from config import config
+import requests
+
+class JiraPaginationError(requests.exceptions.RequestException):
+    """Raised when a page of a paginated Jira endpoint cannot be fetched, so a partial result is never mistaken for a complete one."""
+
+def iter_paginated(
+    session,
+    url: str,
+    items_key: str = "issues",
+    params: Optional[Dict[str, Any]] = None,
+    page_size: int = 100,
+    max_workers: int = config.JIRA_PAGINATION_CONCURRENCY
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streams the items of any offset-paginated Jira endpoint (`startAt` / `maxResults`
+    / `total`). Once the first page reports the total, up to `max_workers` of the
+    remaining pages are fetched concurrently; items are still yielded in order.
+    Endpoints that do not report a total are walked one page at a time until `isLast`.
+
+    Args:
+        session (JiraSession): Session used for the requests.
+        url (str): The endpoint URL.
+        items_key (str): Key holding the page's items ("issues", "values", ...).
+        params (Optional[Dict[str, Any]]): Extra query parameters (e.g. jql, fields).
+        page_size (int): Items requested per page. Jira may cap it lower, in which case
+            its own page size is used for the remaining pages.
+        max_workers (int): Maximum number of pages requested at once.
+
+    Yields:
+        Dict[str, Any]: The endpoint's items, in order.
+
+    Raises:
+        JiraPaginationError: If a page is answered with an error, after the items of
+            the pages before it have been yielded.
+        requests.exceptions.RequestException: If a page request fails.
+    """
+    params = dict(params or {})
+
+    def get_page(start: int, size: int) -> Dict[str, Any]:
+        response = session.get(url, params=dict(params, startAt=start, maxResults=size))
+        if response.status_code != 200:
+            log.log(f"Failed to get page of {url} at {start}: {response.status_code} - {response.text}", "error")
+            raise JiraPaginationError(f"Jira returned {response.status_code} for the page of {url} at {start}", response=response)
+        return response.json()
+
+    page = get_page(0, page_size)
+
+    items = page.get(items_key, [])
+    stride = page.get("maxResults") or len(items)
+    total = page.get("total")
+
+    if total is None or not items or not stride:
+        yield from items
+        start = len(items)
+        while items and not page.get("isLast", True):
+            page = get_page(start, stride)
+            items = page.get(items_key, [])
+            yield from items
+            start += len(items)
+        return
+
+    starts = deque(range(len(items), total, stride))
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1), thread_name_prefix="jira-pages") as executor:
+        in_flight = deque()
+        try:
+            while True:
+                # Keep the next pages downloading while the current one is consumed
+                while starts and len(in_flight) < max_workers:
+                    in_flight.append(executor.submit(get_page, starts.popleft(), stride))
+
+                yield from items
+                if not in_flight:
+                    return
+
+                page = in_flight.popleft().result()
+                items = page.get(items_key, [])
+        finally:
+            # Stopped early (failed page or the caller stopped iterating)
+            for future in in_flight:
+                future.cancel()
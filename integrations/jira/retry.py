@@ -0,0 +1,176 @@
+from typing import Dict, Any, Optional
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from threading import Lock
+from urllib3.exceptions import NewConnectionError
+from config import config
+import random
+import requests
+import time
+
+# Statuses worth retrying. 429 and 503 may carry a Retry-After header.
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_AFTER_STATUS_CODES = {429, 503}
+
+# Requests that are safe to repeat. Others (POST) are only retried when Jira cannot
+# have acted on them: a 429, or a connection that was never established.
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+NON_IDEMPOTENT_RETRYABLE_STATUS_CODES = {429}
+
+class RetryPolicy:
+    """
+    Retry/backoff policy shared by every Jira call: jittered exponential backoff,
+    `Retry-After` honoured on 429/503, and no retries on other 4xx responses
+    (validation errors will not succeed on a second attempt). Non-idempotent
+    requests are only retried when Jira cannot have processed them.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = config.API_RETRIES,
+        backoff_base: float = config.JIRA_BACKOFF_BASE,
+        backoff_max: float = config.JIRA_BACKOFF_MAX
+    ) -> None:
+        """
+        Args:
+            max_attempts (int): Attempts in total, including the first one.
+            backoff_base (float): Delay, in seconds, before the first retry.
+            backoff_max (float): Upper bound, in seconds, for any single delay.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def should_retry(self, attempt: int, status_code: Optional[int] = None, idempotent: bool = True) -> bool:
+        """
+        Decides whether a failed attempt is retried.
+
+        Args:
+            attempt (int): Zero-based number of the attempt that just failed.
+            status_code (Optional[int]): Response status, or None if the request raised
+                a connection error or timeout.
+            idempotent (bool): Whether repeating the request is safe. Pass False for a
+                non-idempotent request that may have reached Jira.
+
+        Returns:
+            bool: True if another attempt should be made.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return False
+
+        if status_code is None:
+            return idempotent
+
+        return status_code in (RETRYABLE_STATUS_CODES if idempotent else NON_IDEMPOTENT_RETRYABLE_STATUS_CODES)
+
+    def get_delay(self, attempt: int, status_code: Optional[int] = None, headers: Optional[Dict[str, Any]] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Zero-based number of the attempt that just failed.
+            status_code (Optional[int]): Response status, if there was a response.
+            headers (Optional[Dict[str, Any]]): Response headers, if there was a response.
+
+        Returns:
+            float: The server's Retry-After on 429/503 when present, otherwise a
+            "full jitter" exponential delay.
+        """
+        if status_code in RETRY_AFTER_STATUS_CODES:
+            retry_after = get_retry_after(headers)
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+class TokenBucket:
+    """
+    Thread-safe client-side rate limiter. Tokens refill at `rate` per second up to
+    `capacity`; each request takes one, waiting if none are left.
+    """
+
+    def __init__(self, rate: float = config.JIRA_RATE_LIMIT, capacity: int = config.JIRA_RATE_BURST) -> None:
+        """
+        Args:
+            rate (float): Sustained requests per second. 0 disables limiting.
+            capacity (int): Requests that may be sent in a burst.
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, possibly one that has not refilled yet.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+
+            return -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+def get_retry_after(headers: Optional[Dict[str, Any]]) -> Optional[float]:
+    """
+    Reads the `Retry-After` header, given either in seconds or as an HTTP date.
+
+    Args:
+        headers (Optional[Dict[str, Any]]): Response headers.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or malformed.
+    """
+    value = None
+    for name, header_value in (headers or {}).items():
+        if name.lower() == "retry-after":
+            value = header_value
+            break
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+def request_was_sent(error: Exception) -> bool:
+    """
+    Tells whether a failed `requests` call may have reached the server.
+
+    Args:
+        error (Exception): The exception raised by `requests`.
+
+    Returns:
+        bool: False only if the connection was never established.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return False
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        return not isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+    return True
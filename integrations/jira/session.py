@@ -0,0 +1,178 @@
+from typing import Dict, Any, Optional, Tuple
+from threading import Lock
+from requests.adapters import HTTPAdapter
+from integrations.jira.retry import RetryPolicy, TokenBucket, IDEMPOTENT_METHODS, request_was_sent
+from integrations.jira.circuit_breaker import CircuitBreaker
+from logger import log
+from config import config
+import requests
+import time
+
+class JiraSession:
+    """
+    Thin wrapper around a pooled, keep-alive `requests.Session` shared by every
+    Jira call, so connections (and their TLS handshakes) are reused across
+    requests and threads. Every request passes through a client-side rate limiter,
+    is retried according to a shared `RetryPolicy`, and fails fast through a
+    `CircuitBreaker` while Jira is down.
+    """
+
+    def __init__(
+        self,
+        auth: Tuple[str, str],
+        pool_connections: int = config.JIRA_POOL_CONNECTIONS,
+        pool_maxsize: int = config.JIRA_POOL_MAXSIZE,
+        pool_block: bool = config.JIRA_POOL_BLOCK,
+        timeout: float = config.JIRA_REQUEST_TIMEOUT,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ) -> None:
+        """
+        Args:
+            auth (Tuple[str, str]): Jira email and API token used for basic auth.
+            pool_connections (int): Number of per-host connection pools to keep.
+            pool_maxsize (int): Maximum number of kept-alive connections per host.
+            pool_block (bool): Whether to block when the pool is exhausted instead of
+                opening a throwaway connection.
+            timeout (float): Default timeout, in seconds, for every request.
+            retry_policy (Optional[RetryPolicy]): Retry/backoff policy (default: from config).
+            rate_limiter (Optional[TokenBucket]): Client-side rate limiter (default: from config).
+            circuit_breaker (Optional[CircuitBreaker]): Breaker tripped by Jira outages (default: from config).
+        """
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+    def request(self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs: Any) -> requests.Response:
+        """
+        Sends a request through the shared session, applying the default timeout,
+        the circuit breaker, the rate limiter and the retry policy.
+
+        Args:
+            method (str): HTTP method (e.g. "GET", "POST").
+            url (str): The full Jira API URL.
+            idempotent (Optional[bool]): Whether the request is safe to repeat after it may
+                have reached Jira (default: true for every method but POST).
+            **kwargs: Any keyword accepted by `requests.Session.request`.
+
+        Returns:
+            requests.Response: The last Jira response, which may still be an error once
+            retries are exhausted or the status is not retryable.
+
+        Raises:
+            JiraUnavailableError: If the circuit breaker is open.
+            requests.exceptions.RequestException: If the last attempt failed to connect or timed out.
+        """
+        self.circuit_breaker.before_request()
+        succeeded = False
+        try:
+            if idempotent is None:
+                idempotent = method.upper() in IDEMPOTENT_METHODS
+            response = self._send_with_retries(method, url, idempotent, **kwargs)
+            succeeded = response.status_code < 500
+            return response
+        finally:
+            # Any exception counts as a failure, so a half-open probe never leaves the breaker stuck
+            if succeeded:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+
+    def _send_with_retries(self, method: str, url: str, idempotent: bool, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not self.retry_policy.should_retry(attempt, idempotent=idempotent or not request_was_sent(e)):
+                    raise
+                delay = self.retry_policy.get_delay(attempt)
+                log.log(f"Jira {method} {url} failed ({e}). Retrying in {delay:.2f}s", "warning")
+            else:
+                if not self.retry_policy.should_retry(attempt, response.status_code, idempotent):
+                    return response
+                delay = self.retry_policy.get_delay(attempt, response.status_code, response.headers)
+                log.log(f"Jira {method} {url} returned {response.status_code}. Retrying in {delay:.2f}s", "warning")
+
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Reports connection reuse for every host the session has talked to.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per-host stats keyed by "scheme://host:port", with
+            the number of requests sent, connections opened and the reuse ratio
+            (share of requests served by an already-open connection).
+        """
+        stats = {}
+        pools = self.adapter.poolmanager.pools
+        for pool_key in list(pools.keys()):
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+
+            requests_sent = pool.num_requests
+            connections_opened = pool.num_connections
+            reuse_ratio = 1 - (connections_opened / requests_sent) if requests_sent else 0.0
+            stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "requests": requests_sent,
+                "connections_opened": connections_opened,
+                "idle_connections": idle_connections(pool),
+                "reuse_ratio": round(max(reuse_ratio, 0.0), 3)
+            }
+
+        return stats
+
+    def close(self) -> None:
+        self.session.close()
+
+def idle_connections(pool) -> int:
+    # The pool's queue is pre-filled with None placeholders; only real connections count
+    if not pool.pool:
+        return 0
+    return sum(1 for connection in list(pool.pool.queue) if connection is not None)
+
+_shared_session: Optional[JiraSession] = None
+_shared_session_lock = Lock()
+
+def get_jira_session() -> JiraSession:
+    """
+    Returns the process-wide Jira session, creating it on first use.
+
+    Returns:
+        JiraSession: The shared, thread-safe pooled session.
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = JiraSession(auth=(config.JIRA_EMAIL, config.JIRA_API_TOKEN))
+
+    return _shared_session
@@ -0,0 +1,188 @@
+from threading import Thread, Lock, Event
+from typing import Dict, Any, Optional, Iterable
+import json
+import math
+import os
+import re
+import requests
+import tempfile
+import time
+import traceback
+from logger import log
+from config import config
+
+TRACE_PATTERN = re.compile("trace_.{12}")
+
+class TraceIndex:
+    """
+    In-memory index from trace ids (the `trace_.{12}` in ticket summaries) to Jira
+    issue keys, so finding a trace's ticket does not need a JQL text search.
+
+    The index is warmed with a paged scan of the project, then kept fresh by
+    periodically scanning only the issues updated since the last refresh. A JSON
+    snapshot is saved to `TRACE_INDEX_FILEPATH`, so a restart only has to catch up.
+    A scan that fails part way does not move the refresh watermark, so the next
+    refresh covers the same window again.
+    Lookups that miss the index fall through to `Jira_Handler.search_jira_backlog`.
+    When several issues carry the same trace, the oldest one is kept.
+    """
+
+    def __init__(
+        self,
+        jira_handler,
+        project_key: str = config.JIRA_SERVE_PROJECT_KEY,
+        refresh_interval: float = config.TRACE_INDEX_REFRESH_INTERVAL,
+        snapshot_filepath: Optional[str] = config.TRACE_INDEX_FILEPATH
+    ) -> None:
+        """
+        Args:
+            jira_handler (Jira_Handler): Handler used for the scans and fallback searches.
+            project_key (str): Project whose issues are indexed.
+            refresh_interval (float): Seconds between incremental refreshes.
+            snapshot_filepath (Optional[str]): File the index is saved to and loaded from, or None.
+        """
+        self.jh = jira_handler
+        self.project_key = project_key
+        self.refresh_interval = refresh_interval
+        self.snapshot_filepath = snapshot_filepath
+        self.traces: Dict[str, str] = {}
+        self.last_refresh: Optional[float] = None
+        self.lock = Lock()
+        self.stopped = Event()
+        self.thread = Thread(target=self._run, name="trace-index", daemon=True)
+        self._load_snapshot()
+
+    def start(self) -> None:
+        """Warms the index and keeps refreshing it in a background thread."""
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def lookup(self, trace: str) -> Optional[str]:
+        """
+        Finds the issue key for a trace id.
+
+        Args:
+            trace (str): The trace id (e.g. "trace_0123456789ab").
+
+        Returns:
+            Optional[str]: The issue key, or None if no issue carries the trace.
+        """
+        with self.lock:
+            issue_key = self.traces.get(trace)
+        if issue_key:
+            return issue_key
+
+        issue_key = self.jh.search_jira_backlog(trace)
+        if issue_key:
+            self.add(trace, issue_key)
+        return issue_key
+
+    def lookup_many(self, traces: Iterable[str], chunk_size: int = 50) -> Dict[str, Optional[str]]:
+        """
+        Finds the issue keys for many trace ids. Misses are resolved with one
+        `summary ~ a OR summary ~ b ...` search per `chunk_size` traces.
+
+        Args:
+            traces (Iterable[str]): Trace ids to resolve.
+            chunk_size (int): Traces per fallback search.
+
+        Returns:
+            Dict[str, Optional[str]]: Issue key (or None) for every requested trace.
+        """
+        results = {}
+        with self.lock:
+            for trace in traces:
+                results[trace] = self.traces.get(trace)
+
+        misses = [trace for trace, issue_key in results.items() if issue_key is None]
+        for i in range(0, len(misses), chunk_size):
+            chunk = misses[i:i + chunk_size]
+            summary_terms = " OR ".join(f'summary ~ "{trace}"' for trace in chunk)
+            jql = f"project = {self.project_key} AND ({summary_terms}) ORDER BY created ASC"
+            self._index_issues(self.jh.iter_search_issues(jql, fields=["summary"]))
+            with self.lock:
+                for trace in chunk:
+                    results[trace] = self.traces.get(trace)
+
+        return results
+
+    def add(self, trace: str, issue_key: str) -> None:
+        with self.lock:
+            self.traces.setdefault(trace, issue_key)
+
+    def warm(self) -> int:
+        """
+        Indexes every issue of the project with a paged scan.
+
+        Returns:
+            int: Number of indexed traces.
+        """
+        scan_started = time.time()
+        jql = f"project = {self.project_key} ORDER BY created ASC"
+        self._index_issues(self.jh.iter_search_issues(jql, fields=["summary"]))
+        self.last_refresh = scan_started
+        self._save_snapshot()
+        log.log(f"Trace index warmed with {len(self.traces)} traces")
+        return len(self.traces)
+
+    def refresh(self) -> None:
+        """Indexes the issues created or renamed since the last refresh."""
+        if self.last_refresh is None:
+            self.warm()
+            return
+
+        scan_started = time.time()
+        # Relative JQL dates sidestep the Jira user's timezone; one extra minute covers rounding
+        since = f"-{math.ceil((scan_started - self.last_refresh) / 60) + 1}m"
+        jql = f"project = {self.project_key} AND updated >= {since} ORDER BY created ASC"
+        before = len(self.traces)
+        self._index_issues(self.jh.iter_search_issues(jql, fields=["summary"]))
+        self.last_refresh = scan_started
+        if len(self.traces) != before:
+            self._save_snapshot()
+
+    def _index_issues(self, issues: Iterable[Dict[str, Any]]) -> None:
+        for issue in issues:
+            match = TRACE_PATTERN.search(issue["fields"].get("summary") or "")
+            if match:
+                self.add(match[0], issue["key"])
+
+    def _run(self) -> None:
+        while not self.stopped.is_set():
+            try:
+                self.refresh()
+            except requests.exceptions.RequestException as e:
+                log.log(f"Trace index refresh failed, retrying next interval: {e}", "warning")
+            except Exception:
+                log.log(f"UNHANDLED ERROR REFRESHING TRACE INDEX: {traceback.format_exc()}", "error")
+            self.stopped.wait(self.refresh_interval)
+
+    def _load_snapshot(self) -> None:
+        if not self.snapshot_filepath or not os.path.exists(self.snapshot_filepath):
+            return
+
+        try:
+            with open(self.snapshot_filepath, 'r') as snapshot_file:
+                snapshot = json.load(snapshot_file)
+        except (OSError, ValueError) as e:
+            log.log(f"Ignoring unreadable trace index snapshot: {e}", "warning")
+            return
+
+        if isinstance(snapshot, dict) and snapshot.get("project_key") == self.project_key:
+            self.traces = snapshot["traces"]
+            self.last_refresh = snapshot["last_refresh"]
+
+    def _save_snapshot(self) -> None:
+        if not self.snapshot_filepath:
+            return
+
+        with self.lock:
+            data = json.dumps({"project_key": self.project_key, "traces": self.traces, "last_refresh": self.last_refresh})
+        try:
+            with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(self.snapshot_filepath)), delete=False) as snapshot_file:
+                snapshot_file.write(data)
+            os.replace(snapshot_file.name, self.snapshot_filepath)
+        except OSError as e:
+            log.log(f"Failed to save trace index snapshot: {e}", "warning")
@@ -0,0 +1,53 @@
+from slack_sdk.socket_mode.aiohttp import SocketModeClient
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.errors import SlackApiError
+from logger import log
+from config import config
+
+class AsyncSlackBot:
+
+	def __init__(self) -> None:
+		"""
+		Initializes the AsyncSlackBot instance by setting up an asyncio Slack SocketModeClient.
+		"""
+		self.client = self.initialize_client()
+
+	def initialize_client(self) -> SocketModeClient:
+		"""
+		Initializes and returns an aiohttp-based SocketModeClient for Slack integration.
+
+		Returns:
+			SocketModeClient: A configured asyncio Slack client for socket-based communication.
+		"""
+		client = SocketModeClient(
+			app_token=config.SLACK_APP_TOKEN,
+			web_client=AsyncWebClient(token=config.SLACK_BOT_TOKEN)
+		)
+
+		return client
+
+	async def reply_to_alert(self, channel, ts, content):
+		"""
+		Sends a reply to a specific Slack thread timestamp (ts) in the appropriate channel.
+
+		Args:
+			channel (str): The channel the original message was posted in.
+			ts (str): The thread timestamp to reply to.
+			content (str): The message content to send.
+		"""
+		log.log(f"REPLYING TO CHANNEL: {channel}")
+
+		try:
+			result = await self.client.web_client.chat_postMessage(
+				channel=channel,
+				text=content,
+				thread_ts=ts
+			)
+
+			if result["ok"]:
+				log.log("Reply sent successfuly")
+			else:
+				log.log(f"Issue replying to thread! {str(result)}", "error")
+
+		except SlackApiError as e:
+			log.log(f"Error: {e}", "error")
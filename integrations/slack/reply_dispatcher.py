@@ -0,0 +1,160 @@
+from collections import OrderedDict
+from threading import Thread, Condition
+from typing import Callable, Optional, Tuple, Dict, Any
+from slack_sdk.web import WebClient
+from slack_sdk.errors import SlackApiError
+import time
+import traceback
+from logger import log
+from config import config
+
+class ReplyDispatcher:
+	"""
+	Background sender for Slack thread replies. Replies are sent as soon as they
+	are queued; only after Slack has rate limited (429) a reply are they held for
+	the coalescing window, so replies to the same thread can be merged into a
+	single message. Rate limited replies are retried after Slack's `Retry-After`
+	delay without blocking the caller.
+	"""
+
+	def __init__(
+		self,
+		web_client: WebClient,
+		coalesce_window: float = config.SLACK_REPLY_COALESCE_WINDOW,
+		max_retries: int = config.SLACK_REPLY_MAX_RETRIES,
+		coalesce_period: float = config.SLACK_REPLY_COALESCE_PERIOD
+	) -> None:
+		"""
+		Args:
+			web_client (WebClient): The shared Slack web client used to post replies.
+			coalesce_window (float): Seconds to hold a reply so others for the same thread can join it.
+			max_retries (int): Times a rate limited reply is retried before it is dropped.
+			coalesce_period (float): Seconds after a rate limit during which replies are held for coalescing.
+		"""
+		self.web_client = web_client
+		self.coalesce_window = coalesce_window
+		self.max_retries = max_retries
+		self.coalesce_period = coalesce_period
+		self.pending: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+		self.condition = Condition()
+		self.rate_limited_until = 0.0
+		self.last_rate_limited_at = float("-inf")
+		self.thread = Thread(target=self._run, name="slack-replies", daemon=True)
+
+	def start(self) -> None:
+		"""Starts the background sender thread."""
+		self.thread.start()
+
+	def enqueue(self, channel: str, ts: str, content: str, on_sent: Optional[Callable[[bool], None]] = None) -> None:
+		"""
+		Queues a thread reply. Returns immediately.
+
+		Args:
+			channel (str): The channel the original message was posted in.
+			ts (str): The thread timestamp to reply to.
+			content (str): The message content to send.
+			on_sent (Callable[[bool], None], optional): Called with the outcome once the reply is sent or dropped.
+		"""
+		with self.condition:
+			reply = self.pending.get((channel, ts))
+			if reply is None:
+				now = time.monotonic()
+				hold = self.coalesce_window if now - self.last_rate_limited_at < self.coalesce_period else 0.0
+				reply = {"contents": [], "callbacks": [], "due": now + hold, "attempts": 0}
+				self.pending[(channel, ts)] = reply
+
+			reply["contents"].append(content)
+			if on_sent:
+				reply["callbacks"].append(on_sent)
+			self.condition.notify()
+
+	def _run(self) -> None:
+		while True:
+			with self.condition:
+				key, reply = self._wait_for_due_reply()
+
+			try:
+				self._send(key, reply)
+			except Exception:
+				log.log(f"UNHANDLED ERROR SENDING SLACK REPLY: {traceback.format_exc()}", "error")
+
+	def _wait_for_due_reply(self) -> Tuple[Tuple[str, str], Dict[str, Any]]:
+		while True:
+			now = time.monotonic()
+			timeout = None
+			if now < self.rate_limited_until:
+				timeout = self.rate_limited_until - now
+			elif self.pending:
+				key, reply = min(self.pending.items(), key=lambda item: item[1]["due"])
+				if reply["due"] <= now:
+					del self.pending[key]
+					return key, reply
+				timeout = reply["due"] - now
+
+			self.condition.wait(timeout)
+
+	def _send(self, key: Tuple[str, str], reply: Dict[str, Any]) -> None:
+		channel, ts = key
+		try:
+			result = self.web_client.chat_postMessage(
+				channel=channel,
+				text="\n".join(reply["contents"]),
+				thread_ts=ts
+			)
+			sent = bool(result["ok"])
+			if sent:
+				log.log("Reply sent successfuly")
+			else:
+				log.log(f"Issue replying to thread! {str(result)}", "error")
+
+		except SlackApiError as e:
+			if e.response.status_code == 429 and reply["attempts"] < self.max_retries:
+				self._defer(key, reply, get_retry_after(e.response.headers))
+				return
+
+			sent = False
+			log.log(f"Error replying to thread: {e}", "error")
+
+		for callback in reply["callbacks"]:
+			try:
+				callback(sent)
+			except Exception:
+				log.log(f"UNHANDLED ERROR IN REPLY CALLBACK: {traceback.format_exc()}", "error")
+
+	def _defer(self, key: Tuple[str, str], reply: Dict[str, Any], retry_after: float) -> None:
+		log.log(f"Slack rate limit hit. Retrying reply in {retry_after}s", "warning")
+		with self.condition:
+			self.last_rate_limited_at = time.monotonic()
+			self.rate_limited_until = self.last_rate_limited_at + retry_after
+			reply["attempts"] += 1
+			reply["due"] = self.rate_limited_until
+
+			# Merge with anything queued for the same thread while this reply was in flight
+			newer = self.pending.pop(key, None)
+			if newer:
+				reply["contents"].extend(newer["contents"])
+				reply["callbacks"].extend(newer["callbacks"])
+			self.pending[key] = reply
+			self.condition.notify()
+
+def get_retry_after(headers: Dict[str, Any], default: float = 1.0) -> float:
+	"""
+	Reads the `Retry-After` header (in seconds) from a Slack response.
+
+	Args:
+		headers (Dict[str, Any]): Response headers.
+		default (float): Delay used when the header is missing or malformed.
+
+	Returns:
+		float: Seconds to wait before retrying.
+	"""
+	for name, value in (headers or {}).items():
+		if name.lower() == "retry-after":
+			if isinstance(value, list):
+				value = value[0] if value else default
+			try:
+				return float(value)
+			except (TypeError, ValueError):
+				return default
+
+	return default
@@ -2,7 +2,8 @@ from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.web import WebClient
 from slack_sdk.socket_mode.response import SocketModeResponse
 from slack_sdk.socket_mode.request import SocketModeRequest
-from slack_sdk.errors import SlackApiError
+from integrations.slack.reply_dispatcher import ReplyDispatcher
+from typing import Callable, Optional
 # from typing import List, Dict, Any
 from logger import log
 from config import config
@@ -11,9 +12,13 @@ class SlackBot:
 	
 	def __init__(self) -> None:
 		"""
-		Initializes the SlackBot instance by setting up a Slack SocketModeClient.
+		Initializes the SlackBot instance by setting up a Slack SocketModeClient and
+		the background reply dispatcher, which shares the client's WebClient.
 		"""
 		self.client = self.initialize_client()
+		self.web_client = self.client.web_client
+		self.replies = ReplyDispatcher(self.web_client)
+		self.replies.start()
 		
 	def initialize_client(self) -> SocketModeClient:
 		"""
@@ -47,30 +52,19 @@ class SlackBot:
 	
 		log("INCOMING PAYLOAD", req.payload)
 
-	def reply_to_alert(self, channel, ts, content):
+	def reply_to_alert(self, channel, ts, content, on_sent: Optional[Callable[[bool], None]] = None):
 		"""
-		Sends a reply to a specific Slack thread timestamp (ts) in the appropriate channel.
+		Queues a reply to a specific Slack thread timestamp (ts) in the appropriate channel.
+		Replies are sent in the background through the shared WebClient, coalescing
+		replies to the same thread and honoring Slack's rate limits.
 
 		Args:
+			channel (str): The channel the original message was posted in.
 			ts (str): The thread timestamp to reply to.
 			content (str): The message content to send.
+			on_sent (Callable[[bool], None], optional): Called with the outcome once the reply is sent.
 		"""
 		
-		print(f"REPLYING TO CHANNEL: {channel}")
+		log.log(f"REPLYING TO CHANNEL: {channel}", "debug")
 
-		client = WebClient(token=config.SLACK_BOT_TOKEN)
-
-		try:
-			result = client.chat_postMessage(
-				channel=channel,
-				text=content,
-				thread_ts=ts
-			)
-	
-			if result["ok"]:
-				print("Reply sent successfuly")
-			else:
-				print(f"Issue replying to thread! {str(result)}", "error")
-		
-		except SlackApiError as e:
-			print(f"Error: {e}")
\ No newline at end of file
+		self.replies.enqueue(channel=channel, ts=ts, content=content, on_sent=on_sent)
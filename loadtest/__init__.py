@@ -0,0 +1 @@
+# This indicates that /loadtest is a module.
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Jira REST endpoints the bot uses, for load testing
+without touching Atlassian.
+
+Every response can be delayed, and a configurable share of requests fail with
+500 or are rate limited with 429 + Retry-After, so retry and backoff behaviour
+can be exercised too.
+
+Usage:
+    python -m loadtest.fake_jira --port 8765 --latency-ms 150 --jitter-ms 50 --error-rate 0.01 --rate-limit-rate 0.02
+
+Then point the bot (or the load generator) at it with JIRA_BASE_URL=http://localhost:8765
+
+Searches understand the JQL the bot sends: `project`, `key`, `status`, `sprint`
+and `updated` comparisons, `summary ~`, `in (...)`, `is EMPTY`, AND / OR and
+parentheses (ORDER BY is ignored; results are in creation order). Anything else
+is rejected with 400, as Jira rejects invalid JQL.
+
+"""
+
+import re
+import json
+import time
+import calendar
+import random
+import argparse
+import itertools
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+TRANSITIONS = [
+    {"id": "2", "name": "Needs Review"},
+    {"id": "3", "name": "Waiting for Deploy"},
+    {"id": "4", "name": "Won't Do"},
+    {"id": "5", "name": "Blocked"},
+    {"id": "6", "name": "Needs Validation"},
+    {"id": "11", "name": "To Do"},
+    {"id": "21", "name": "In Progress"},
+    {"id": "31", "name": "Done"},
+    {"id": "32", "name": "Waiting on further details"}
+]
+
+# The account every request is authenticated as
+FAKE_USER = {"accountId": "fake-account-1", "displayName": "Fake User", "emailAddress": "bot@example.com"}
+
+class FakeJira:
+    """In-memory Jira state shared by all request handler threads."""
+
+    def __init__(self, project_key="SER", latency_ms=0, jitter_ms=0, error_rate=0.0, rate_limit_rate=0.0, retry_after=1, reject_create_fields=()):
+        self.project_key = project_key
+        self.reject_create_fields = set(reject_create_fields)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self.issue_ids = itertools.count(10000)
+        self.comment_ids = itertools.count(50000)
+        self.issues = {}
+        self.sprints = {}
+        self.stats = {"requests": 0, "errors": 0, "rate_limited": 0}
+
+    def create_issue(self, fields, sprint_id=None):
+        with self.lock:
+            issue_id = next(self.issue_ids)
+            key = f"{self.project_key}-{issue_id}"
+            self.issues[key] = {
+                "id": str(issue_id),
+                "key": key,
+                "fields": {
+                    "summary": fields.get("summary", ""),
+                    "description": fields.get("description"),
+                    "issuetype": fields.get("issuetype") or {"name": "Task"},
+                    "assignee": fields.get("assignee"),
+                    "labels": fields.get("labels", []),
+                    "status": {"name": "To Do"},
+                    "updated": jira_timestamp(),
+                    "comment": {"comments": []}
+                }
+            }
+            if sprint_id is not None:
+                self.sprints.setdefault(str(sprint_id), []).append(key)
+        return {"id": str(issue_id), "key": key, "self": f"/rest/api/3/issue/{issue_id}"}
+
+    def seed_sprint(self, sprint_id, size):
+        for i in range(size):
+            self.create_issue({"summary": f"Auto Generated trace_{i:012d} Ticket", "issuetype": {"name": "Task"}}, sprint_id=sprint_id)
+
+    def sprint_ids(self, key):
+        return {sprint_id for sprint_id, keys in self.sprints.items() if key in keys}
+
+class FakeJiraRequestHandler(BaseHTTPRequestHandler):
+    jira: FakeJira = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.route("GET")
+
+    def do_POST(self):
+        self.route("POST")
+
+    def do_PUT(self):
+        self.route("PUT")
+
+    def do_DELETE(self):
+        self.route("DELETE")
+
+    def route(self, method):
+        jira = self.jira
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+        with jira.lock:
+            jira.stats["requests"] += 1
+
+        delay = jira.latency_ms + random.uniform(-jira.jitter_ms, jira.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        roll = random.random()
+        if roll < jira.rate_limit_rate:
+            with jira.lock:
+                jira.stats["rate_limited"] += 1
+            return self.respond(429, {"errorMessages": ["Rate limit exceeded"]}, {"Retry-After": str(jira.retry_after)})
+        if roll < jira.rate_limit_rate + jira.error_rate:
+            with jira.lock:
+                jira.stats["errors"] += 1
+            return self.respond(500, {"errorMessages": ["Injected failure"]})
+
+        for pattern, route_method, handler in ROUTES:
+            match = re.fullmatch(pattern, url.path)
+            if match and route_method == method:
+                status, payload = handler(jira, body, query, *match.groups())
+                return self.respond(status, payload)
+
+        self.respond(404, {"errorMessages": [f"No fake route for {method} {url.path}"]})
+
+    def respond(self, status, payload=None, headers=None):
+        data = json.dumps(payload).encode() if payload is not None and status != 204 else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+def page(items, query, key="issues"):
+    start = int(query.get("startAt", ["0"])[0])
+    max_results = int(query.get("maxResults", ["50"])[0])
+    return 200, {"startAt": start, "maxResults": max_results, "total": len(items), key: items[start:start + max_results]}
+
+def project(issues, query):
+    """Keep only the requested `fields` of each issue, like Jira does."""
+    if "fields" not in query:
+        return issues
+    names = query["fields"][0].split(",")
+    return [dict(issue, fields={name: issue["fields"][name] for name in names if name in issue["fields"]}) for issue in issues]
+
+def create_issue(jira, body, query):
+    fields = body.get("fields", {})
+    rejected = {name: f"Field '{name}' cannot be set." for name in fields if name in jira.reject_create_fields}
+    if rejected:
+        return 400, {"errorMessages": [], "errors": rejected}
+    return 201, jira.create_issue(fields)
+
+def bulk_create_issues(jira, body, query):
+    issues, errors = [], []
+    for index, update in enumerate(body.get("issueUpdates", [])):
+        status, result = create_issue(jira, update, query)
+        if status == 201:
+            issues.append(result)
+        else:
+            errors.append({"status": status, "elementErrors": result, "failedElementNumber": index})
+    return (400 if errors else 201), {"issues": issues, "errors": errors}
+
+def assign_issue(jira, body, query, key):
+    with jira.lock:
+        if key not in jira.issues:
+            return 404, {"errorMessages": ["Issue does not exist"]}
+        jira.issues[key]["fields"]["assignee"] = {"accountId": body.get("accountId")}
+        jira.issues[key]["fields"]["updated"] = jira_timestamp()
+    return 204, None
+
+def get_transitions(jira, body, query, key):
+    return 200, {"transitions": [dict(t, to={"name": t["name"]}) for t in TRANSITIONS]}
+
+def transition_issue(jira, body, query, key):
+    names = {t["id"]: t["name"] for t in TRANSITIONS}
+    transition_id = body.get("transition", {}).get("id")
+    with jira.lock:
+        if key not in jira.issues or transition_id not in names:
+            return 400, {"errorMessages": ["Invalid transition"]}
+        jira.issues[key]["fields"]["status"] = {"name": names[transition_id]}
+        jira.issues[key]["fields"]["updated"] = jira_timestamp()
+    return 204, None
+
+def add_comment(jira, body, query, key):
+    with jira.lock:
+        if key not in jira.issues:
+            return 404, {"errorMessages": ["Issue does not exist"]}
+        comment = {"id": str(next(jira.comment_ids)), "body": body.get("body"), "author": FAKE_USER}
+        jira.issues[key]["fields"]["comment"]["comments"].append(comment)
+        jira.issues[key]["fields"]["updated"] = jira_timestamp()
+    return 201, comment
+
+def delete_comment(jira, body, query, key, comment_id):
+    with jira.lock:
+        comments = jira.issues.get(key, {}).get("fields", {}).get("comment", {}).get("comments", [])
+        remaining = [c for c in comments if c["id"] != comment_id]
+        if len(remaining) == len(comments):
+            return 404, {"errorMessages": ["Comment does not exist"]}
+        jira.issues[key]["fields"]["comment"]["comments"] = remaining
+    return 204, None
+
+def search(jira, body, query):
+    try:
+        matches = parse_jql(query.get("jql", [""])[0])
+    except JqlError as e:
+        return 400, {"errorMessages": [str(e)]}
+    with jira.lock:
+        issues = [issue for issue in jira.issues.values() if matches(jira, issue)]
+    return page(project(issues, query), query)
+
+def sprint_issues(jira, body, query, sprint_id):
+    with jira.lock:
+        issues = [jira.issues[key] for key in jira.sprints.get(sprint_id, []) if key in jira.issues]
+    return page(project(issues, query), query)
+
+def list_boards(jira, body, query):
+    boards = [{"id": 1, "name": f"{jira.project_key} board", "type": "scrum"}]
+    return page(boards, query, key="values")
+
+def list_sprints(jira, body, query, board_id):
+    with jira.lock:
+        sprints = [{"id": int(sprint_id), "name": f"Sprint {sprint_id}", "state": "active"} for sprint_id in jira.sprints]
+    return page(sprints, query, key="values")
+
+def myself(jira, body, query):
+    return 200, FAKE_USER
+
+def assignable_users(jira, body, query):
+    users = [FAKE_USER]
+    start_at = int(query.get("startAt", ["0"])[0])
+    max_results = int(query.get("maxResults", ["50"])[0])
+    return 200, users[start_at:start_at + max_results]
+
+def move_to_sprint(jira, body, query, sprint_id):
+    with jira.lock:
+        sprint = jira.sprints.setdefault(sprint_id, [])
+        for key in body.get("issues", []):
+            for keys in jira.sprints.values():
+                if key in keys:
+                    keys.remove(key)
+            sprint.append(key)
+    return 204, None
+
+def jira_timestamp(at=None):
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime(at))
+
+class JqlError(ValueError):
+    """JQL the fake does not understand."""
+
+JQL_TOKEN = re.compile(r'\s*(?:"((?:[^"\\]|\\.)*)"|(!=|>=|<=|[=~<>(),])|([^\s"=!~<>(),]+))')
+
+def tokenize_jql(jql):
+    tokens, position = [], 0
+    jql = jql.strip()
+    while position < len(jql):
+        match = JQL_TOKEN.match(jql, position)
+        if not match or match.end() == position:
+            raise JqlError(f"Cannot parse JQL at: {jql[position:]}")
+        quoted, operator, word = match.groups()
+        if quoted is not None:
+            tokens.append(("value", quoted.replace('\\"', '"')))
+        elif operator:
+            tokens.append(("op", operator))
+        else:
+            tokens.append(("word", word))
+        position = match.end()
+    return tokens
+
+def parse_jql(jql):
+    """
+    Compile the supported JQL subset into a predicate.
+
+    Returns:
+        Callable[[FakeJira, dict], bool]: True for issues the query matches.
+    """
+    tokens = tokenize_jql(jql)
+    # ORDER BY only sorts; issues are already listed in creation order
+    for index in range(len(tokens) - 1):
+        if [token[1].lower() for token in tokens[index:index + 2]] == ["order", "by"]:
+            tokens = tokens[:index]
+            break
+    if not tokens:
+        return lambda jira, issue: True
+
+    position = 0
+
+    def peek(value=None):
+        if position >= len(tokens):
+            return None
+        token = tokens[position]
+        if value is not None and token[1].lower() != value:
+            return None
+        return token
+
+    def take(value=None):
+        nonlocal position
+        token = peek(value)
+        if token is None:
+            expected = f"'{value}'" if value else "more JQL"
+            raise JqlError(f"Expected {expected} in: {jql}")
+        position += 1
+        return token[1]
+
+    def expression():
+        clauses = [conjunction()]
+        while peek("or"):
+            take("or")
+            clauses.append(conjunction())
+        return lambda jira, issue: any(clause(jira, issue) for clause in clauses)
+
+    def conjunction():
+        clauses = [factor()]
+        while peek("and"):
+            take("and")
+            clauses.append(factor())
+        return lambda jira, issue: all(clause(jira, issue) for clause in clauses)
+
+    def factor():
+        if peek("("):
+            take("(")
+            inner = expression()
+            take(")")
+            return inner
+        return clause()
+
+    def clause():
+        field = take().lower()
+        if field not in JQL_FIELDS:
+            raise JqlError(f"Field '{field}' is not supported by the fake")
+        get = JQL_FIELDS[field]
+
+        if peek("is"):
+            take("is")
+            negate = bool(peek("not")) and bool(take("not"))
+            take("empty")
+            return lambda jira, issue: (not get(jira, issue)) != negate
+
+        if peek("in"):
+            take("in")
+            take("(")
+            values = [take().lower()]
+            while peek(","):
+                take(",")
+                values.append(take().lower())
+            take(")")
+            return lambda jira, issue: bool(as_set(get(jira, issue)) & set(values))
+
+        operator = take()
+        value = take()
+        if operator == "~":
+            return lambda jira, issue: value.lower() in (get(jira, issue) or "").lower()
+        if operator == "=":
+            return lambda jira, issue: value.lower() in as_set(get(jira, issue))
+        if operator == "!=":
+            return lambda jira, issue: value.lower() not in as_set(get(jira, issue))
+        if operator in (">=", ">", "<=", "<") and field == "updated":
+            bound = jql_time(value)
+            compare = {">=": float.__ge__, ">": float.__gt__, "<=": float.__le__, "<": float.__lt__}[operator]
+            return lambda jira, issue: compare(float(get(jira, issue)), float(bound))
+        raise JqlError(f"Operator '{operator}' is not supported for '{field}'")
+
+    predicate = expression()
+    if position != len(tokens):
+        raise JqlError(f"Unexpected '{tokens[position][1]}' in: {jql}")
+    return predicate
+
+def as_set(value):
+    if isinstance(value, (set, list, tuple)):
+        return {str(item).lower() for item in value}
+    return {str(value).lower()} if value else set()
+
+def jql_time(value):
+    """Seconds since the epoch for a relative (`-5m`, `-2h`, `-1d`) or absolute (`2024-01-31 12:00`) JQL date."""
+    match = re.fullmatch(r"-(\d+)([mhdw])", value)
+    if match:
+        unit = {"m": 60, "h": 3600, "d": 86400, "w": 604800}[match[2]]
+        return time.time() - int(match[1]) * unit
+    for date_format in ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d"):
+        try:
+            return calendar.timegm(time.strptime(value, date_format))
+        except ValueError:
+            pass
+    raise JqlError(f"Date '{value}' is not supported by the fake")
+
+JQL_FIELDS = {
+    "project": lambda jira, issue: issue["key"].rsplit("-", 1)[0],
+    "key": lambda jira, issue: issue["key"],
+    "status": lambda jira, issue: issue["fields"]["status"]["name"],
+    "summary": lambda jira, issue: issue["fields"]["summary"],
+    "sprint": lambda jira, issue: jira.sprint_ids(issue["key"]),
+    "updated": lambda jira, issue: calendar.timegm(time.strptime(issue["fields"]["updated"][:19], "%Y-%m-%dT%H:%M:%S")),
+}
+
+ROUTES = [
+    (r"/rest/api/3/issue", "POST", create_issue),
+    (r"/rest/api/3/issue/bulk", "POST", bulk_create_issues),
+    (r"/rest/api/3/issue/([^/]+)/assignee", "PUT", assign_issue),
+    (r"/rest/api/3/issue/([^/]+)/transitions", "GET", get_transitions),
+    (r"/rest/api/3/issue/([^/]+)/transitions", "POST", transition_issue),
+    (r"/rest/api/3/issue/([^/]+)/comment", "POST", add_comment),
+    (r"/rest/api/3/issue/([^/]+)/comment/([^/]+)", "DELETE", delete_comment),
+    (r"/rest/api/2/search", "GET", search),
+    (r"/rest/api/3/myself", "GET", myself),
+    (r"/rest/api/3/user/assignable/search", "GET", assignable_users),
+    (r"/rest/agile/1.0/board", "GET", list_boards),
+    (r"/rest/agile/1.0/board/([^/]+)/sprint", "GET", list_sprints),
+    (r"/rest/agile/1.0/sprint/([^/]+)/issue", "GET", sprint_issues),
+    (r"/rest/agile/1.0/sprint/([^/]+)/issue", "POST", move_to_sprint),
+]
+
+def serve(jira, host="127.0.0.1", port=8765):
+    """
+    Create (but do not start) an HTTP server for the given fake Jira state.
+
+    Returns:
+        ThreadingHTTPServer: Call `serve_forever()` on it, or run it in a thread.
+    """
+    handler = type("BoundFakeJiraRequestHandler", (FakeJiraRequestHandler,), {"jira": jira})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def main():
+    """Main function to run the fake Jira server."""
+    parser = argparse.ArgumentParser(description="Local fake Jira REST server for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Added delay per request")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random +/- variation of the delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--reject-create-field", action="append", default=[], metavar="FIELD",
+                        help="Reject issue creation with 400 when this field is set (repeatable)")
+    parser.add_argument("--seed-sprint", action="append", default=[], metavar="SPRINT_ID:SIZE",
+                        help="Pre-populate a sprint with SIZE issues (repeatable)")
+    args = parser.parse_args()
+
+    jira = FakeJira(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        reject_create_fields=args.reject_create_field
+    )
+    for seed in args.seed_sprint:
+        sprint_id, size = seed.split(":")
+        jira.seed_sprint(sprint_id, int(size))
+
+    server = serve(jira, args.host, args.port)
+    print(f"Fake Jira listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\nServed: {jira.stats}")
+
+if __name__ == "__main__":
+    main()
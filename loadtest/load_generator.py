@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Load generator for the Slack -> Jira ticket path.
+
+Replays the recorded Slack payloads from `benchmarks/corpus/` through the same
+steps `Reporter.process_slack_event` runs for a ticket (create with assignee)
+from many threads at once, and reports throughput and tail latency. Point it at
+the local fake Jira server to load test without touching Atlassian.
+
+Usage:
+    python -m loadtest.fake_jira --latency-ms 150 --jitter-ms 50 &
+    python -m loadtest.load_generator --jira-url http://127.0.0.1:8765 --events 2000 --concurrency 32
+
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+TICKET_CHANNELS = ["serve-ai-idea", "serve-ai-issue", "serve-ai-thumbs-up-down"]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test the Slack -> Jira ticket path")
+    parser.add_argument("--jira-url", help="Overrides JIRA_BASE_URL (e.g. the fake Jira server)")
+    parser.add_argument("--events", type=int, default=1000, help="Total events to replay (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Events processed at once (default: 16)")
+    parser.add_argument("--target", choices=["handler", "reporter"], default="handler",
+                        help="Drive Jira_Handler directly, or Reporter.submit_jira_ticket (default: handler)")
+    parser.add_argument("--no-assign", action="store_true", help="Create tickets without an assignee")
+    return parser.parse_args()
+
+def load_ticket_corpus(formatter, corpus_dir):
+    """
+    Parse the recorded payloads once up front so only the Jira path is measured.
+
+    Returns:
+        list: Parsed feedback contents that produce a ticket.
+    """
+    contents = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for channel in TICKET_CHANNELS:
+            with open(os.path.join(corpus_dir, f"{channel}.json"), "r") as corpus_file:
+                for payload in json.load(corpus_file):
+                    content = formatter.parse_slack_payload(channel, payload)
+                    if content.get("ticket_type"):
+                        contents.append(content)
+    return contents
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def main():
+    """Main function to run the load generator."""
+    args = parse_args()
+    if args.jira_url:
+        # Must be set before `config` is imported
+        os.environ["JIRA_BASE_URL"] = args.jira_url
+
+    from config import config
+    from helpers.formatter import Formatter
+    from app.models.JiraTicket import JiraTicket
+    from app.reporter import TICKET_ASSIGNEES
+    from integrations.jira.jira_handler import Jira_Handler
+    from integrations.jira.circuit_breaker import JiraUnavailableError
+
+    corpus_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "corpus")
+    contents = load_ticket_corpus(Formatter, corpus_dir)
+
+    if args.target == "reporter":
+        from app.reporter import Reporter
+        reporter = Reporter()
+        jh = reporter.jh
+        submit = reporter.submit_jira_ticket
+    else:
+        jh = Jira_Handler()
+        def submit(payload, assignee_id=None):
+            ticket_payload, ticket_url = JiraTicket.format_ser_jira_ticket(assignee_id=assignee_id, **payload)
+            issue_key, rejected_fields = jh.create_jira_ticket(ticket_payload, ticket_url)
+            assigned = bool(issue_key and assignee_id)
+            if issue_key and "assignee" in rejected_fields:
+                assigned = jh.assign_ticket(issue_key, assignee_id)
+            return issue_key, assigned
+
+    latencies = []
+    failures = {"create": 0, "assign": 0, "unavailable": 0}
+    lock = threading.Lock()
+
+    def process(i):
+        content = contents[i % len(contents)]
+        assignee_id = None if args.no_assign else config.JIRA_ASSIGNEE_ID_DICT[TICKET_ASSIGNEES[content["ticket_type"]]]
+        started = time.perf_counter()
+        try:
+            issue_key, assigned = submit(content, assignee_id)
+        except JiraUnavailableError:
+            issue_key, assigned = None, False
+            with lock:
+                failures["unavailable"] += 1
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            if not issue_key:
+                failures["create"] += 1
+            elif assignee_id and not assigned:
+                failures["assign"] += 1
+
+    print(f"Replaying {args.events} events against {config.JIRA_BASE_URL} with concurrency {args.concurrency}...")
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            list(executor.map(process, range(args.events)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"\n=== Load Test Summary ===")
+    print(f"Events:        {args.events} in {elapsed:.2f}s ({args.events / elapsed:.1f} events/s)")
+    print(f"Latency p50:   {percentile(latencies, 0.50) * 1000:.1f} ms")
+    print(f"Latency p95:   {percentile(latencies, 0.95) * 1000:.1f} ms")
+    print(f"Latency p99:   {percentile(latencies, 0.99) * 1000:.1f} ms")
+    print(f"Latency max:   {latencies[-1] * 1000:.1f} ms")
+    print(f"Failures:      {failures['create']} create ({failures['unavailable']} Jira unavailable), {failures['assign']} assign")
+    print(f"Pool stats:    {jh.get_pool_stats()}")
+
+    sys.exit(1 if failures["create"] or failures["assign"] else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,129 @@
 #!/usr/bin/env python3
 
-from typing import Literal
-import logging
+from typing import Literal, Union, Callable
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+
+# Logging is configured before (and independently of) config.config, which requires the app's secrets
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FILEPATH = os.getenv("LOG_FILEPATH", "./docs/app.log")
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+
+LOG_LEVELS = {
+	"debug": logging.DEBUG,
+	"info": logging.INFO,
+	"warning": logging.WARNING,
+	"error": logging.ERROR,
+	"critical": logging.CRITICAL
+}
 
 def format_log_output(message):
 	now = datetime.now()
 	formatted_time = now.strftime("%Y-%m-%d %H:%M:%S")
 	message = str(message).replace("\n", f"\n{formatted_time} - ")
 	output = f"{formatted_time} - {message}"
-	
+
 	return output
 
-def log(message: str, log_level: Literal["debug", "info", "warning", "error", "critical"] = "info", console_output: bool = True) -> None:
+class LazyMessage:
+	"""Defers building a log message until a handler formats the record."""
+
+	def __init__(self, build: Callable[[], str]) -> None:
+		self.build = build
+
+	def __str__(self) -> str:
+		return str(self.build())
+
+class DeferredQueueHandler(QueueHandler):
+	"""
+	Queues records without formatting them, so message formatting happens on the
+	listener thread. Only exception tracebacks are rendered up front, while the
+	exception is still being handled.
 	"""
-	Logs events to both the console and a log file.
+
+	def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+		if record.exc_info and not record.exc_text:
+			record.exc_text = logging.Formatter().formatException(record.exc_info)
+		record.exc_info = None
+		return record
+
+class JsonFormatter(logging.Formatter):
+	"""Formats records as one JSON object per line."""
+
+	def format(self, record: logging.LogRecord) -> str:
+		entry = {
+			"time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+			"level": record.levelname.lower(),
+			"logger": record.name,
+			"thread": record.threadName,
+			"message": record.getMessage()
+		}
+		if record.exc_text:
+			entry["exception"] = record.exc_text
+		return json.dumps(entry, default=str)
+
+class ConsoleFormatter(logging.Formatter):
+	"""Formats records like the bot's console output: every line prefixed with the time."""
+
+	def format(self, record: logging.LogRecord) -> str:
+		formatted_time = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+		message = record.getMessage()
+		if record.exc_text:
+			message = f"{message}\n{record.exc_text}"
+		return f"{formatted_time} - " + message.replace("\n", f"\n{formatted_time} - ")
+
+def log(message: Union[str, Callable[[], str]], log_level: Literal["debug", "info", "warning", "error", "critical"] = "info", console_output: bool = True) -> None:
+	"""
+	Logs events to both the console and a log file. Records are queued and written
+	by a background thread, so callers never wait on the console or the disk.
 
 	Args:
-		message (str): The message to be logged and printed to the console.
+		message (str | Callable[[], str]): The message to be logged and printed to the console.
+		A callable is only called if the level is enabled, for messages that are expensive to build.
 		log_level (str, optional): The severity level of the log. Defaults to "info".
 		Possible values: "debug", "info", "warning", "error", "critical".
+		console_output (bool, optional): Also print the message to the console. Defaults to True.
 	"""
-	
-	output = format_log_output(message)
-	
-	if console_output:
-		print(output)
-	
-	logging_levels = {
-		"debug": logging.debug,
-		"info": logging.info,
-		"warning": logging.warning,
-		"error": logging.error,
-		"critical": logging.critical
-	}
-	
-	logging_levels[log_level](output)
-			
+	level = LOG_LEVELS[log_level]
+	if not _logger.isEnabledFor(level):
+		return
+
+	if callable(message):
+		message = LazyMessage(message)
+	_logger.log(level, message, extra={"console_output": console_output})
+
 def log_exception(message: str) -> None:
-		logging.exception(message)
-	
-# Configure logging
-logging.basicConfig(
-	filename="./docs/app.log",
-	level=logging.DEBUG,  # Log level (DEBUG logs everything)
-	format="%(asctime)s - %(levelname)s - %(message)s",
-	datefmt="%m-%d-%Y %H:%M:%S",
-)
+		_logger.exception(message, extra={"console_output": False})
+
+def flush() -> None:
+	"""Writes out every queued record and stops the listener. Called at exit."""
+	_listener.stop()
+
+# Configure logging: every record (the bot's and its libraries') goes through one queue
+if os.path.dirname(LOG_FILEPATH):
+	os.makedirs(os.path.dirname(LOG_FILEPATH), exist_ok=True)
+
+_file_handler = RotatingFileHandler(LOG_FILEPATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
+_file_handler.setFormatter(JsonFormatter())
+
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(ConsoleFormatter())
+_console_handler.addFilter(lambda record: getattr(record, "console_output", False))
+
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener = QueueListener(_queue, _file_handler, _console_handler, respect_handler_level=True)
+_listener.start()
+atexit.register(flush)
 
+_root_logger = logging.getLogger()
+_root_logger.setLevel(LOG_LEVEL)
+_root_logger.addHandler(DeferredQueueHandler(_queue))
 
+_logger = logging.getLogger("slackbot")
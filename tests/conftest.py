@@ -0,0 +1,83 @@
+import os
+import tempfile
+import pytest
+
+# `config` refuses to import without these. The tests never talk to any service,
+# so placeholders are enough when no .env is present.
+for _name in [
+    "SLACK_BOT_TOKEN", "SLACK_APP_TOKEN", "SLACK_CHANNEL_ID", "BOT_TESTING_SLACK_CHANNEL_ID",
+    "JIRA_EMAIL", "JIRA_API_TOKEN", "JIRA_BASE_URL", "JIRA_SERVE_PROJECT_KEY",
+    "OPEN_AI_API_KEY", "LANGWATCH_API_KEY", "QDRANT_API_KEY", "QDRANT_CLUSTER_URL"
+]:
+    os.environ.setdefault(_name, "test")
+os.environ["JIRA_BASE_URL"] = "https://jira.test"
+
+os.environ.setdefault("LOG_FILEPATH", os.path.join(tempfile.gettempdir(), "slack-jira-bot-tests.log"))
+
+JIRA_URL = "https://jira.test"
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+        self.text = str(body)
+
+    def json(self):
+        if self.body is None:
+            raise ValueError("No JSON body")
+        return self.body
+
+class FakeJiraSession:
+    """
+    Stands in for `JiraSession`. Requests are answered by handlers registered per
+    method and URL path; a handler gets the request's keyword arguments and returns
+    a `FakeResponse` or raises. Every request is recorded in `calls`.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.calls = []
+
+    def route(self, method, path, handler):
+        self.handlers[(method, path)] = handler
+
+    def request(self, method, url, **kwargs):
+        path = url[len(JIRA_URL):] if url.startswith(JIRA_URL) else url
+        self.calls.append((method, path, kwargs))
+        handler = self.handlers.get((method, path))
+        if handler is None:
+            return FakeResponse(404, {"errorMessages": [f"No route for {method} {path}"]})
+        return handler(**kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+@pytest.fixture
+def jira_session():
+    return FakeJiraSession()
+
+@pytest.fixture
+def fake_jira():
+    """A `loadtest.fake_jira` server on a free local port. Yields (FakeJira, base URL)."""
+    import threading
+    from loadtest.fake_jira import FakeJira, serve
+
+    jira = FakeJira()
+    server = serve(jira, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield jira, f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,122 @@
+from concurrent.futures import Future
+import pytest
+import requests
+from conftest import FakeResponse
+from integrations.jira.bulk_creator import JiraBulkIssueCreator
+from integrations.jira.circuit_breaker import JiraUnavailableError
+
+BULK_PATH = "/rest/api/3/issue/bulk"
+CREATE_URL = "https://jira.test/rest/api/3/issue"
+
+class FakeJiraHandler:
+    def __init__(self, session):
+        self.session = session
+        self.created = []
+
+    def create_jira_ticket(self, payload, url):
+        self.created.append(payload)
+        return f"SER-{len(self.created)}", []
+
+def make_batch(size):
+    return [({"fields": {"summary": f"Feedback {n}"}}, CREATE_URL, Future()) for n in range(size)]
+
+def results(batch):
+    return [future.result(timeout=0) for _, _, future in batch]
+
+def raise_error(error):
+    def handler(**kwargs):
+        raise error
+    return handler
+
+def test_bulk_response_resolves_each_future(jira_session):
+    jira_session.route("POST", BULK_PATH, lambda **kwargs: FakeResponse(201, {"issues": [{"key": "SER-1"}, {"key": "SER-2"}]}))
+    batch = make_batch(2)
+
+    JiraBulkIssueCreator(FakeJiraHandler(jira_session)).create(batch)
+
+    assert results(batch) == [("SER-1", []), ("SER-2", [])]
+
+def test_failed_elements_are_created_individually(jira_session):
+    jira_session.route("POST", BULK_PATH, lambda **kwargs: FakeResponse(400, {
+        "issues": [{"key": "SER-7"}],
+        "errors": [{"failedElementNumber": 0, "elementErrors": {}}]
+    }))
+    handler = FakeJiraHandler(jira_session)
+    batch = make_batch(2)
+
+    JiraBulkIssueCreator(handler).create(batch)
+
+    assert results(batch) == [("SER-1", []), ("SER-7", [])]
+    assert handler.created == [batch[0][0]]
+
+def test_unsent_bulk_request_is_parked(jira_session):
+    jira_session.route("POST", BULK_PATH, raise_error(JiraUnavailableError("Jira circuit breaker is open")))
+    batch = make_batch(2)
+
+    JiraBulkIssueCreator(FakeJiraHandler(jira_session)).create(batch)
+
+    for _, _, future in batch:
+        with pytest.raises(JiraUnavailableError):
+            future.result(timeout=0)
+
+@pytest.mark.parametrize("route", [
+    raise_error(requests.exceptions.ReadTimeout("read timed out")),
+    lambda **kwargs: FakeResponse(500, {"errorMessages": ["Internal error"]})
+])
+def test_bulk_request_that_may_have_succeeded_is_not_retried(jira_session, route):
+    jira_session.route("POST", BULK_PATH, route)
+    handler = FakeJiraHandler(jira_session)
+    batch = make_batch(2)
+
+    JiraBulkIssueCreator(handler).create(batch)
+
+    assert results(batch) == [(None, []), (None, [])]
+    assert handler.created == []
+
+class RecordingBulkCreator(JiraBulkIssueCreator):
+    """Records each batch instead of calling Jira, resolving every Future with a key."""
+
+    def __init__(self, **kwargs):
+        super().__init__(FakeJiraHandler(None), **kwargs)
+        self.batches = []
+
+    def create(self, batch):
+        self.batches.append(len(batch))
+        for index, (_, _, future) in enumerate(batch):
+            future.set_result((f"SER-{len(self.batches)}-{index}", []))
+
+def submit_many(creator, count):
+    futures = [creator.submit({"fields": {}}, CREATE_URL) for _ in range(count)]
+    return [future.result(timeout=5) for future in futures]
+
+def test_batch_is_sent_once_every_worker_has_joined():
+    creator = RecordingBulkCreator(window=30, max_issues=50, max_waiters=4)
+    creator.start()
+
+    assert len(submit_many(creator, 4)) == 4
+    assert creator.batches == [4]
+
+def test_partial_batch_is_sent_when_the_window_ends():
+    creator = RecordingBulkCreator(window=0.05, max_issues=50, max_waiters=4)
+    creator.start()
+
+    assert len(submit_many(creator, 2)) == 2
+    assert creator.batches == [2]
+
+def test_batches_never_exceed_max_issues():
+    creator = RecordingBulkCreator(window=0.05, max_issues=3, max_waiters=10)
+    creator.start()
+
+    submit_many(creator, 7)
+
+    assert creator.batches == [3, 3, 1]
+
+def test_unexpected_error_resolves_the_batch_as_failed():
+    class BrokenBulkCreator(JiraBulkIssueCreator):
+        def create(self, batch):
+            raise RuntimeError("unexpected")
+
+    creator = BrokenBulkCreator(FakeJiraHandler(None), window=0)
+    creator.start()
+
+    assert creator.submit({"fields": {}}, CREATE_URL).result(timeout=5) == (None, [])
@@ -0,0 +1,90 @@
+import pytest
+import requests
+from integrations.jira.circuit_breaker import CircuitBreaker, JiraUnavailableError
+from integrations.jira.retry import RetryPolicy, TokenBucket
+from integrations.jira.session import JiraSession
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+def allow_probe(breaker):
+    breaker.opened_at -= breaker.reset_timeout
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.before_request()
+    assert breaker.is_closed()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(JiraUnavailableError):
+        breaker.before_request()
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.is_closed()
+
+def test_single_probe_after_reset_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    open_breaker(breaker)
+    allow_probe(breaker)
+
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(JiraUnavailableError):
+        breaker.before_request()
+
+def test_successful_probe_closes():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    open_breaker(breaker)
+    allow_probe(breaker)
+
+    breaker.before_request()
+    breaker.record_success()
+
+    assert breaker.is_closed()
+    breaker.before_request()
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    open_breaker(breaker)
+    allow_probe(breaker)
+
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(JiraUnavailableError):
+        breaker.before_request()
+
+def test_unavailable_error_is_a_request_exception():
+    assert issubclass(JiraUnavailableError, requests.exceptions.RequestException)
+
+def test_probe_that_raises_unexpectedly_reopens_the_breaker(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    session = JiraSession(
+        auth=("bot@example.com", "token"),
+        retry_policy=RetryPolicy(max_attempts=1),
+        rate_limiter=TokenBucket(rate=0),
+        circuit_breaker=breaker
+    )
+    open_breaker(breaker)
+    allow_probe(breaker)
+
+    def broken_request(*args, **kwargs):
+        raise TypeError("unexpected")
+
+    monkeypatch.setattr(session.session, "request", broken_request)
+
+    with pytest.raises(TypeError):
+        session.get("https://jira.test/rest/api/3/myself")
+    assert breaker.state == CircuitBreaker.OPEN
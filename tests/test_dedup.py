@@ -0,0 +1,76 @@
+from app import dedup
+from app.dedup import EventDeduplicator, event_dedup_keys
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+def test_keys_cover_event_id_and_message():
+    slack_event = {"event_id": "Ev1", "event": {"channel": "C1", "ts": "1.5"}}
+
+    assert event_dedup_keys(slack_event) == ["event:Ev1", "message:C1:1.5"]
+    assert event_dedup_keys({"event": {}}) == []
+
+def test_redelivery_is_a_duplicate():
+    deduplicator = EventDeduplicator(filepath=None)
+
+    assert not deduplicator.is_duplicate(["event:Ev1", "message:C1:1.5"])
+    assert deduplicator.is_duplicate(["event:Ev1", "message:C1:1.5"])
+    # The same message under a new event id
+    assert deduplicator.is_duplicate(["event:Ev2", "message:C1:1.5"])
+
+def test_events_without_keys_are_never_duplicates():
+    deduplicator = EventDeduplicator(filepath=None)
+
+    assert not deduplicator.is_duplicate([])
+    assert not deduplicator.is_duplicate([])
+
+def test_was_seen_does_not_remember():
+    deduplicator = EventDeduplicator(filepath=None)
+
+    assert not deduplicator.was_seen(["event:Ev1"])
+    assert not deduplicator.is_duplicate(["event:Ev1"])
+    assert deduplicator.was_seen(["event:Ev1"])
+
+def test_keys_expire_after_the_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(dedup.time, "time", clock.time)
+    deduplicator = EventDeduplicator(ttl=60, filepath=None)
+
+    deduplicator.is_duplicate(["event:Ev1"])
+    clock.now += 59
+    assert deduplicator.was_seen(["event:Ev1"])
+
+    clock.now += 61
+    assert not deduplicator.is_duplicate(["event:Ev1"])
+
+def test_least_recently_seen_keys_are_evicted_first():
+    deduplicator = EventDeduplicator(max_size=2, filepath=None)
+
+    deduplicator.is_duplicate(["event:a"])
+    deduplicator.is_duplicate(["event:b"])
+    deduplicator.is_duplicate(["event:a"])
+    deduplicator.is_duplicate(["event:c"])
+
+    assert len(deduplicator) == 2
+    assert deduplicator.was_seen(["event:a"])
+    assert not deduplicator.was_seen(["event:b"])
+
+def test_seen_keys_survive_a_restart(tmp_path):
+    filepath = str(tmp_path / "seen_events.db")
+    EventDeduplicator(filepath=filepath).is_duplicate(["event:Ev1"])
+
+    assert EventDeduplicator(filepath=filepath).is_duplicate(["event:Ev1"])
+
+def test_expired_keys_are_not_loaded_after_a_restart(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(dedup.time, "time", clock.time)
+    filepath = str(tmp_path / "seen_events.db")
+    EventDeduplicator(ttl=60, filepath=filepath).is_duplicate(["event:Ev1"])
+
+    clock.now += 120
+
+    assert len(EventDeduplicator(ttl=60, filepath=filepath)) == 0
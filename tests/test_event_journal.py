@@ -0,0 +1,98 @@
+import json
+import os
+import pytest
+from app import event_journal
+from app.event_journal import EventJournal, EventJournalError
+
+def make_journal(path, **kwargs):
+    return EventJournal(filepath=str(path), commit_interval=0, **kwargs)
+
+def reopen(journal):
+    journal._commit()
+    journal.journal_file.close()
+    return make_journal(journal.filepath)
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+def test_pending_lists_only_incomplete_events(tmp_path):
+    journal = make_journal(tmp_path / "journal.jsonl")
+    journal.record("a", "received", payload={"n": 1})
+    journal.record("a", "parsed")
+    journal.record("a", "jira_created", data={"issue_key": "SER-1"})
+    journal.record("b", "received", payload={"n": 2})
+    journal.record("b", "replied")
+    journal.record("c", "received", payload={"n": 3})
+    journal.record("c", "failed")
+
+    journal = reopen(journal)
+
+    pending = journal.pending()
+    assert [event["id"] for event in pending] == ["a"]
+    assert pending[0]["state"] == "jira_created"
+    assert pending[0]["payload"] == {"n": 1}
+    assert pending[0]["data"] == {"issue_key": "SER-1"}
+
+def test_events_without_payload_are_not_pending(tmp_path):
+    journal = make_journal(tmp_path / "journal.jsonl")
+    journal.record("a", "parsed")
+
+    assert journal.get("a")["state"] == "parsed"
+    assert journal.pending() == []
+
+def test_torn_last_line_is_skipped(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    path.write_text(
+        json.dumps({"id": "a", "state": "received", "payload": {"n": 1}}) + "\n"
+        + '{"id": "b", "state": "rec'
+    )
+
+    journal = make_journal(path)
+
+    assert [event["id"] for event in journal.pending()] == ["a"]
+
+def test_compaction_drops_completed_events(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = make_journal(path, compact_bytes=1)
+    journal.record("a", "received", payload={"n": 1})
+    journal.record("b", "received", payload={"n": 2})
+    journal.record("b", "done")
+
+    journal._commit()
+
+    records = read_records(path)
+    assert [record["id"] for record in records] == ["a"]
+    assert records[0]["payload"] == {"n": 1}
+
+    journal.record("a", "replied")
+    assert reopen(journal).pending() == []
+
+def test_durable_record_times_out_without_a_writer(tmp_path):
+    journal = make_journal(tmp_path / "journal.jsonl", durable_timeout=0.05)
+
+    with pytest.raises(EventJournalError):
+        journal.record("a", "received", payload={"n": 1}, durable=True)
+
+def test_failed_fsync_raises_to_durable_writer_and_is_retried(tmp_path, monkeypatch):
+    path = tmp_path / "journal.jsonl"
+    journal = make_journal(path, durable_timeout=5)
+    real_fsync = os.fsync
+    failures = []
+
+    def failing_fsync(fd):
+        if not failures:
+            failures.append(fd)
+            raise OSError(28, "No space left on device")
+        real_fsync(fd)
+
+    monkeypatch.setattr(event_journal.os, "fsync", failing_fsync)
+    journal.start()
+
+    with pytest.raises(EventJournalError):
+        journal.record("a", "received", payload={"n": 1}, durable=True)
+
+    # The background writer retries the failed record ahead of newer ones
+    journal.record("b", "received", payload={"n": 2}, durable=True)
+
+    assert [record["id"] for record in read_records(path)] == ["a", "b"]
+    assert journal.committed == journal.appended
@@ -0,0 +1,66 @@
+import pytest
+from config import config
+from integrations.jira.issue_cache import IssueCache
+from integrations.jira.jira_handler import Jira_Handler
+from integrations.jira.metadata_cache import JiraMetadataCache
+from integrations.jira.retry import RetryPolicy, TokenBucket
+from integrations.jira.session import JiraSession
+from loadtest.fake_jira import FakeJira, JqlError, parse_jql
+
+@pytest.fixture
+def handler(fake_jira, monkeypatch):
+    """A Jira_Handler talking to the fake Jira server, with a sprint of three seeded issues."""
+    jira, url = fake_jira
+    jira.seed_sprint("7", 3)
+    monkeypatch.setattr(config, "JIRA_BASE_URL", url)
+
+    handler = Jira_Handler.__new__(Jira_Handler)
+    handler.jira_domain = url
+    handler.project_key = jira.project_key
+    handler.session = JiraSession(auth=("bot@example.com", "token"), retry_policy=RetryPolicy(max_attempts=1), rate_limiter=TokenBucket(rate=0))
+    handler.metadata = JiraMetadataCache(handler.session, jira_domain=url, filepath=None)
+    handler.comment_json_cache = {}
+    handler.issue_cache = None
+    handler.trace_index = None
+    return handler
+
+def matching_keys(jira, jql):
+    matches = parse_jql(jql)
+    return [key for key, issue in jira.issues.items() if matches(jira, issue)]
+
+def test_jql_subset():
+    jira = FakeJira()
+    jira.seed_sprint("7", 2)
+    jira.create_issue({"summary": "Loose trace_zzzzzzzzzzzz issue"})
+
+    assert matching_keys(jira, 'summary ~ "trace_000000000001"') == ["SER-10001"]
+    assert matching_keys(jira, "sprint = 7 AND updated >= -5m ORDER BY created ASC") == ["SER-10000", "SER-10001"]
+    assert matching_keys(jira, "project in (SER) AND (sprint != 7 OR sprint is EMPTY)") == ["SER-10002"]
+    assert matching_keys(jira, "key in (SER-10000, SER-10002)") == ["SER-10000", "SER-10002"]
+    assert matching_keys(jira, 'status in ("Done", "Won\'t do")') == []
+    assert matching_keys(jira, "updated >= -5m AND updated < -1m") == []
+
+def test_unsupported_jql_is_rejected():
+    with pytest.raises(JqlError):
+        parse_jql("assignee = currentUser()")
+
+def test_backlog_search_only_finds_matching_traces(handler):
+    assert handler.search_jira_backlog("trace_000000000002") == "SER-10002"
+    assert handler.search_jira_backlog("trace_ffffffffffff") is None
+
+def test_issue_types_are_looked_up(handler):
+    assert handler.metadata.get_issue_types(["SER-10000", "SER-10001"]) == {"SER-10000": "Task", "SER-10001": "Task"}
+
+def test_incremental_comment_scan_only_fetches_changes(handler, fake_jira, tmp_path):
+    jira, _ = fake_jira
+    handler.issue_cache = IssueCache(str(tmp_path / "issues.db"))
+
+    assert len(handler.comment_hunter(7, incremental=True)["no_comment_found"]) == 3
+
+    # Moved to another sprint
+    with jira.lock:
+        jira.sprints["7"].remove("SER-10002")
+        jira.sprints.setdefault("8", []).append("SER-10002")
+
+    result = handler.comment_hunter(7, incremental=True)
+    assert sorted(issue["key"] for issue in result["no_comment_found"]) == ["SER-10000", "SER-10001"]
@@ -0,0 +1,58 @@
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from conftest import FakeResponse
+from integrations.jira.circuit_breaker import JiraUnavailableError
+from integrations.jira.jira_handler import Jira_Handler
+
+CREATE_PATH = "/rest/api/3/issue"
+CREATE_URL = "https://jira.test" + CREATE_PATH
+PAYLOAD = {"fields": {"summary": "Feedback"}}
+
+def make_handler(session):
+    handler = Jira_Handler.__new__(Jira_Handler)
+    handler.jira_domain = "https://jira.test"
+    handler.session = session
+    return handler
+
+def raise_error(error):
+    def handler(**kwargs):
+        raise error
+    return handler
+
+def connection_refused():
+    # Shaped like the error requests raises when the TCP connection is refused
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, CREATE_URL, reason=reason))
+
+def test_created_issue_key_is_returned(jira_session):
+    jira_session.route("POST", CREATE_PATH, lambda **kwargs: FakeResponse(201, {"key": "SER-1"}))
+
+    assert make_handler(jira_session).create_jira_ticket(PAYLOAD, CREATE_URL) == ("SER-1", [])
+
+@pytest.mark.parametrize("error", [
+    JiraUnavailableError("Jira circuit breaker is open"),
+    requests.exceptions.ConnectTimeout("connect timed out"),
+    connection_refused()
+])
+def test_request_that_never_reached_jira_is_parked(jira_session, error):
+    jira_session.route("POST", CREATE_PATH, raise_error(error))
+
+    with pytest.raises(JiraUnavailableError):
+        make_handler(jira_session).create_jira_ticket(PAYLOAD, CREATE_URL)
+
+def test_rate_limited_create_is_parked(jira_session):
+    jira_session.route("POST", CREATE_PATH, lambda **kwargs: FakeResponse(429, {}))
+
+    with pytest.raises(JiraUnavailableError):
+        make_handler(jira_session).create_jira_ticket(PAYLOAD, CREATE_URL)
+
+@pytest.mark.parametrize("route", [
+    raise_error(requests.exceptions.ReadTimeout("read timed out")),
+    lambda **kwargs: FakeResponse(502, {"errorMessages": ["Bad gateway"]})
+])
+def test_create_that_may_have_succeeded_is_not_parked(jira_session, route):
+    jira_session.route("POST", CREATE_PATH, route)
+
+    assert make_handler(jira_session).create_jira_ticket(PAYLOAD, CREATE_URL) == (None, [])
+    assert len(jira_session.calls) == 1
@@ -0,0 +1,27 @@
+import pytest
+from helpers.formatter import Formatter
+from logger import log
+
+BOT_TESTING_EVENT = {"event": {"text": "hello"}}
+
+@pytest.fixture
+def info_level(monkeypatch):
+    monkeypatch.setattr(log._logger, "level", log.LOG_LEVELS["info"])
+    monkeypatch.setattr(log._logger.manager, "disable", 0)
+    log._logger.manager._clear_cache()
+    yield
+    log._logger.manager._clear_cache()
+
+def test_lazy_message_is_not_built_below_the_level(info_level):
+    built = []
+
+    log.log(lambda: built.append(1) or "payload dump", "debug")
+
+    assert built == []
+
+def test_parsing_prints_nothing(capsys, info_level):
+    assert Formatter.parse_slack_payload("bot-testing", BOT_TESTING_EVENT).endswith("hello")
+    assert Formatter.sanitize_string("“quoted”") == '"quoted"'
+    assert Formatter.parse_slack_payload("unknown-channel", BOT_TESTING_EVENT) is None
+
+    assert "hello" not in capsys.readouterr().out
@@ -0,0 +1,116 @@
+import json
+from conftest import FakeResponse
+from integrations.jira.metadata_cache import JiraMetadataCache
+
+TRANSITIONS_PATH = "/rest/api/3/issue/{}/transitions"
+TRANSITIONS = {
+    "transitions": [
+        {"id": "11", "name": "Start work", "to": {"name": "In Progress"}},
+        {"id": "21", "name": "Done", "to": {"name": "Done"}}
+    ]
+}
+
+def serve_transitions(jira_session, *issue_keys, status_code=200):
+    for issue_key in issue_keys:
+        jira_session.route("GET", TRANSITIONS_PATH.format(issue_key), lambda **kwargs: FakeResponse(status_code, TRANSITIONS))
+
+def serve_issue_types(jira_session, issue_types):
+    def search(params=None, **kwargs):
+        issues = [{"key": key, "fields": {"issuetype": {"name": name}}} for key, name in issue_types.items() if key in params["jql"]]
+        return FakeResponse(200, {"issues": issues, "total": len(issues), "maxResults": params["maxResults"]})
+
+    jira_session.route("GET", "/rest/api/2/search", search)
+
+def make_cache(path, session, ttl=3600):
+    return JiraMetadataCache(session, jira_domain="https://jira.test", ttl=ttl, filepath=str(path) if path else None)
+
+def test_transitions_are_cached_by_status_and_name(tmp_path, jira_session):
+    serve_transitions(jira_session, "SER-1")
+    cache = make_cache(tmp_path / "metadata.json", jira_session)
+
+    assert cache.get_transition_id("SER-1", "In Progress", issue_type="Task") == "11"
+    assert cache.get_transition_id("SER-2", "Start work", issue_type="Task") == "11"
+    assert cache.get_transition_id("SER-3", "Done", issue_type="Task") == "21"
+    assert len(jira_session.calls) == 1
+
+def test_transitions_are_kept_per_issue_type(tmp_path, jira_session):
+    serve_transitions(jira_session, "SER-1", "SER-2")
+    cache = make_cache(tmp_path / "metadata.json", jira_session)
+
+    cache.get_transition_id("SER-1", "Done", issue_type="Task")
+    cache.get_transition_id("SER-2", "Done", issue_type="Bug")
+
+    assert len(jira_session.calls) == 2
+
+def test_issue_type_is_looked_up_once(tmp_path, jira_session):
+    serve_transitions(jira_session, "SER-1", "SER-2")
+    serve_issue_types(jira_session, {"SER-1": "Task", "SER-2": "Task"})
+    cache = make_cache(tmp_path / "metadata.json", jira_session)
+
+    assert cache.get_issue_types(["SER-1", "SER-2"]) == {"SER-1": "Task", "SER-2": "Task"}
+    assert cache.get_transition_id("SER-2", "Done") == "21"
+    assert [path for _, path, _ in jira_session.calls] == ["/rest/api/2/search", "/rest/api/3/issue/SER-2/transitions"]
+
+def test_failed_discovery_caches_nothing(tmp_path, jira_session):
+    path = tmp_path / "metadata.json"
+    serve_transitions(jira_session, "SER-1", status_code=503)
+    cache = make_cache(path, jira_session)
+
+    assert cache.get_transition_id("SER-1", "Done", issue_type="Task") is None
+    assert not path.exists() or "transitions:SER:Task" not in json.loads(path.read_text())
+
+    serve_transitions(jira_session, "SER-1")
+    assert cache.get_transition_id("SER-1", "Done", issue_type="Task") == "21"
+
+def test_unknown_issue_types_cache_nothing(tmp_path, jira_session):
+    path = tmp_path / "metadata.json"
+    serve_issue_types(jira_session, {})
+    cache = make_cache(path, jira_session)
+
+    assert cache.get_issue_types(["SER-404"]) == {}
+    assert not path.exists()
+
+def test_entries_survive_a_restart(tmp_path, jira_session):
+    path = tmp_path / "metadata.json"
+    serve_transitions(jira_session, "SER-1")
+    make_cache(path, jira_session).get_transition_id("SER-1", "Done", issue_type="Task")
+    jira_session.calls.clear()
+
+    cache = make_cache(path, jira_session)
+
+    assert cache.get_transition_id("SER-9", "Done", issue_type="Task") == "21"
+    assert jira_session.calls == []
+    assert "transitions:SER:Task" in json.loads(path.read_text())
+
+def test_expired_entries_are_fetched_again(tmp_path, jira_session):
+    cache = make_cache(tmp_path / "metadata.json", jira_session, ttl=0)
+    loads = []
+
+    cache.get("boards", lambda: loads.append(1) or ["board"])
+    cache.get("boards", lambda: loads.append(1) or ["board"])
+
+    assert len(loads) == 2
+
+def test_failed_load_keeps_the_stale_entry(tmp_path, jira_session):
+    cache = make_cache(tmp_path / "metadata.json", jira_session, ttl=0)
+    cache.get("boards", lambda: ["board"])
+
+    assert cache.get("boards", lambda: None) == ["board"]
+
+def test_unreadable_cache_file_is_ignored(tmp_path, jira_session):
+    path = tmp_path / "metadata.json"
+    path.write_text('{"transitions:SER:Task": {"val')
+    serve_transitions(jira_session, "SER-1")
+
+    cache = make_cache(path, jira_session)
+
+    assert cache.entries == {}
+    assert cache.get_transition_id("SER-1", "Done", issue_type="Task") == "21"
+    assert json.loads(path.read_text())["transitions:SER:Task"]["value"]["Done"] == "21"
+
+def test_unset_filepath_keeps_memory_only(tmp_path, jira_session):
+    serve_transitions(jira_session, "SER-1")
+    cache = make_cache(None, jira_session)
+
+    assert cache.get_transition_id("SER-1", "Done", issue_type="Task") == "21"
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,88 @@
+import pytest
+from conftest import FakeResponse
+from integrations.jira.paginator import iter_paginated, JiraPaginationError
+
+SEARCH_PATH = "/rest/api/2/search"
+URL = "https://jira.test" + SEARCH_PATH
+
+def serve_issues(jira_session, total, max_page=100, fail_at=(), report_total=True):
+    """Serves `total` numbered issues, at most `max_page` per page, failing the pages starting at `fail_at`."""
+
+    def search(params=None, **kwargs):
+        start, size = params["startAt"], min(params["maxResults"], max_page)
+        if start in fail_at:
+            return FakeResponse(500, {"errorMessages": ["boom"]})
+
+        body = {"issues": [{"key": f"SER-{n}"} for n in range(start, min(start + size, total))], "maxResults": size}
+        if report_total:
+            body["total"] = total
+        else:
+            body["isLast"] = start + size >= total
+        return FakeResponse(200, body)
+
+    jira_session.route("GET", SEARCH_PATH, search)
+
+def requested_starts(jira_session):
+    return [kwargs["params"]["startAt"] for _, _, kwargs in jira_session.calls]
+
+def keys(items):
+    return [item["key"] for item in items]
+
+def test_yields_every_page_in_order(jira_session):
+    serve_issues(jira_session, total=95)
+
+    items = list(iter_paginated(jira_session, URL, page_size=10, max_workers=4))
+
+    assert keys(items) == [f"SER-{n}" for n in range(95)]
+    assert sorted(requested_starts(jira_session)) == list(range(0, 95, 10))
+
+def test_passes_query_parameters_through(jira_session):
+    serve_issues(jira_session, total=5)
+
+    list(iter_paginated(jira_session, URL, params={"jql": "project = SER"}))
+
+    assert jira_session.calls[0][2]["params"]["jql"] == "project = SER"
+
+def test_uses_jiras_page_size_when_capped(jira_session):
+    serve_issues(jira_session, total=25, max_page=5)
+
+    items = list(iter_paginated(jira_session, URL, page_size=100))
+
+    assert keys(items) == [f"SER-{n}" for n in range(25)]
+    assert sorted(requested_starts(jira_session)) == list(range(0, 25, 5))
+
+def test_walks_pages_without_total_until_last(jira_session):
+    serve_issues(jira_session, total=25, report_total=False)
+
+    items = list(iter_paginated(jira_session, URL, page_size=10))
+
+    assert keys(items) == [f"SER-{n}" for n in range(25)]
+    assert requested_starts(jira_session) == [0, 10, 20]
+
+def test_empty_result_is_one_request(jira_session):
+    serve_issues(jira_session, total=0)
+
+    assert list(iter_paginated(jira_session, URL)) == []
+    assert requested_starts(jira_session) == [0]
+
+def test_failed_first_page_raises(jira_session):
+    serve_issues(jira_session, total=10, fail_at=[0])
+
+    with pytest.raises(JiraPaginationError):
+        list(iter_paginated(jira_session, URL))
+
+def test_failed_page_raises_after_earlier_items(jira_session):
+    serve_issues(jira_session, total=50, fail_at=[30])
+    items = []
+
+    with pytest.raises(JiraPaginationError):
+        for item in iter_paginated(jira_session, URL, page_size=10, max_workers=2):
+            items.append(item)
+
+    assert keys(items) == [f"SER-{n}" for n in range(30)]
+
+def test_failed_page_without_total_raises(jira_session):
+    serve_issues(jira_session, total=30, fail_at=[10], report_total=False)
+
+    with pytest.raises(JiraPaginationError):
+        list(iter_paginated(jira_session, URL, page_size=10))
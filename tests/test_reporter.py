@@ -0,0 +1,94 @@
+from app import reporter
+from app.dedup import EventDeduplicator
+from app.event_journal import EventJournal, EventJournalError
+from app.reporter import Reporter
+
+SLACK_EVENT = {"event_id": "Ev1", "event": {"channel": "C1", "ts": "1700000000.000100"}}
+
+class FakeRequest:
+    envelope_id = "envelope"
+    retry_attempt = 0
+    retry_reason = None
+    payload = SLACK_EVENT
+
+class FakeClient:
+    def __init__(self):
+        self.acks = []
+
+    def send_socket_mode_response(self, response):
+        self.acks.append(response.envelope_id)
+
+class FakePipeline:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, payload, wait=False):
+        self.submitted.append(payload)
+
+class BrokenJournal:
+    def record(self, *args, **kwargs):
+        raise EventJournalError("disk full")
+
+def make_reporter(journal):
+    # Only the parts the listener and the journal bookkeeping touch
+    instance = Reporter.__new__(Reporter)
+    instance.deduplicator = EventDeduplicator(filepath=None)
+    instance.journal = journal
+    instance.pipeline = FakePipeline()
+    return instance
+
+def test_unjournaled_event_is_not_acknowledged_or_remembered(tmp_path):
+    instance = make_reporter(BrokenJournal())
+    client = FakeClient()
+
+    instance.slackbot_listener(client, FakeRequest())
+
+    assert client.acks == []
+    assert instance.pipeline.submitted == []
+    assert len(instance.deduplicator) == 0
+
+def test_journaled_event_is_acknowledged_and_queued_once(tmp_path):
+    journal = EventJournal(filepath=str(tmp_path / "journal.jsonl"), commit_interval=0)
+    journal.start()
+    instance = make_reporter(journal)
+    client = FakeClient()
+
+    instance.slackbot_listener(client, FakeRequest())
+    instance.slackbot_listener(client, FakeRequest())
+
+    assert client.acks == ["envelope", "envelope"]
+    assert instance.pipeline.submitted == [SLACK_EVENT]
+    assert journal.get("event:Ev1")["state"] == "received"
+
+def test_replay_does_not_redo_journaled_assignment(tmp_path, monkeypatch):
+    journal = EventJournal(filepath=str(tmp_path / "journal.jsonl"), commit_interval=0)
+    journal.record("event:Ev1", "received", payload=SLACK_EVENT)
+    journal.record("event:Ev1", "jira_created", data={"issue_key": "SER-1", "rejected_fields": ["assignee"]})
+    journal.record("event:Ev1", "assigned", data={"assigned": True})
+
+    instance = make_reporter(journal)
+    replies = []
+
+    class FakeJiraHandler:
+        def get_assignee_id(self, assignee):
+            return "account-1"
+
+        def assign_ticket(self, issue_key, assignee_id):
+            raise AssertionError("assignment was redone on replay")
+
+    class FakeSlackBot:
+        def reply_to_alert(self, channel, ts, content, on_sent=None):
+            replies.append(content)
+
+    instance.jh = FakeJiraHandler()
+    instance.slackbot = FakeSlackBot()
+    instance.bulk_creator = None
+    monkeypatch.setattr(reporter, "parse_slack_event", lambda formatter, event: {
+        "channel": "serve-ai-issue", "ts": event["event"]["ts"], "content": {"ticket_type": "Bug"}
+    })
+    instance.formatter = None
+
+    instance.process_slack_event(SLACK_EVENT)
+
+    assert journal.get("event:Ev1")["state"] == "assigned"
+    assert replies and "SER-1" in replies[0]
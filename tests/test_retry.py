@@ -0,0 +1,128 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from conftest import FakeResponse
+from integrations.jira import session as jira_session_module
+from integrations.jira.circuit_breaker import CircuitBreaker
+from integrations.jira.retry import RetryPolicy, TokenBucket, get_retry_after, request_was_sent
+from integrations.jira.session import JiraSession
+
+URL = "https://jira.test/rest/api/3/issue"
+
+def connection_refused():
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, URL, reason=reason))
+
+@pytest.fixture
+def scripted_session(monkeypatch):
+    """A JiraSession whose attempts return (or raise) the given outcomes in order, without sleeping."""
+    monkeypatch.setattr(jira_session_module.time, "sleep", lambda seconds: None)
+
+    def make(*outcomes):
+        session = JiraSession(
+            auth=("bot@example.com", "token"),
+            retry_policy=RetryPolicy(max_attempts=3),
+            rate_limiter=TokenBucket(rate=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=100)
+        )
+        remaining = list(outcomes)
+        session.attempts = 0
+
+        def request(method, url, **kwargs):
+            session.attempts += 1
+            outcome = remaining.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        session.session.request = request
+        return session
+
+    return make
+
+def test_max_attempts_counts_the_first_attempt():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry(0, 503)
+    assert policy.should_retry(1, 503)
+    assert not policy.should_retry(2, 503)
+
+def test_other_client_errors_are_not_retried():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert not policy.should_retry(0, 400)
+    assert not policy.should_retry(0, 404)
+    assert policy.should_retry(0, 429)
+
+def test_non_idempotent_requests_retry_only_rate_limits():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry(0, 429, idempotent=False)
+    assert not policy.should_retry(0, 500, idempotent=False)
+    assert not policy.should_retry(0, None, idempotent=False)
+
+def test_delay_honours_retry_after_up_to_the_maximum():
+    policy = RetryPolicy(backoff_base=1, backoff_max=10)
+
+    assert policy.get_delay(0, 429, {"Retry-After": "4"}) == 4
+    assert policy.get_delay(0, 503, {"retry-after": "60"}) == 10
+    assert 0 <= policy.get_delay(3, 500, {"Retry-After": "4"}) <= 8
+
+def test_retry_after_accepts_http_dates():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert 25 <= get_retry_after({"Retry-After": format_datetime(retry_at, usegmt=True)}) <= 30
+    assert get_retry_after({"Retry-After": "soon"}) is None
+    assert get_retry_after({}) is None
+
+def test_request_was_sent_only_false_for_unestablished_connections():
+    assert not request_was_sent(connection_refused())
+    assert not request_was_sent(requests.exceptions.ConnectTimeout())
+    assert request_was_sent(requests.exceptions.ReadTimeout())
+    assert request_was_sent(requests.exceptions.ConnectionError("Connection reset by peer"))
+
+def test_token_bucket_makes_callers_wait_once_the_burst_is_spent():
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+
+def test_get_is_retried_after_a_read_timeout(scripted_session):
+    session = scripted_session(requests.exceptions.ReadTimeout(), FakeResponse(502), FakeResponse(200, {}))
+
+    assert session.get(URL).status_code == 200
+    assert session.attempts == 3
+
+def test_post_is_not_retried_after_a_read_timeout(scripted_session):
+    session = scripted_session(requests.exceptions.ReadTimeout(), FakeResponse(201, {}))
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        session.post(URL, json={})
+    assert session.attempts == 1
+
+def test_post_is_not_retried_after_a_server_error(scripted_session):
+    session = scripted_session(FakeResponse(500), FakeResponse(201, {}))
+
+    assert session.post(URL, json={}).status_code == 500
+    assert session.attempts == 1
+
+def test_post_is_retried_when_it_never_reached_jira(scripted_session):
+    session = scripted_session(connection_refused(), FakeResponse(429, headers={"Retry-After": "1"}), FakeResponse(201, {}))
+
+    assert session.post(URL, json={}).status_code == 201
+    assert session.attempts == 3
+
+def test_idempotent_post_opts_into_full_retries(scripted_session):
+    session = scripted_session(FakeResponse(503), FakeResponse(204))
+
+    assert session.request("POST", URL, idempotent=True, json={}).status_code == 204
+    assert session.attempts == 2
+
+def test_last_response_is_returned_when_attempts_run_out(scripted_session):
+    session = scripted_session(FakeResponse(503), FakeResponse(503), FakeResponse(503), FakeResponse(200, {}))
+
+    assert session.get(URL).status_code == 503
+    assert session.attempts == 3
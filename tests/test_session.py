@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from integrations.jira import session as jira_session_module
+from integrations.jira.jira_handler import Jira_Handler
+from integrations.jira.retry import RetryPolicy, TokenBucket
+from integrations.jira.session import JiraSession, get_jira_session
+
+def make_session(**kwargs):
+    return JiraSession(
+        auth=("bot@example.com", "token"),
+        retry_policy=RetryPolicy(max_attempts=1),
+        rate_limiter=TokenBucket(rate=0),
+        **kwargs
+    )
+
+def test_sequential_requests_reuse_one_connection(fake_jira):
+    _, url = fake_jira
+    session = make_session()
+
+    for _ in range(20):
+        assert session.get(f"{url}/rest/api/3/myself").status_code == 200
+
+    (stats,) = session.pool_stats().values()
+    assert stats["requests"] == 20
+    assert stats["connections_opened"] == 1
+    assert stats["reuse_ratio"] == 0.95
+    assert stats["idle_connections"] == 1
+
+def test_blocking_pool_caps_concurrent_connections(fake_jira):
+    _, url = fake_jira
+    session = make_session(pool_maxsize=2, pool_block=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = list(executor.map(lambda _: session.get(f"{url}/rest/api/3/myself").status_code, range(40)))
+
+    assert statuses == [200] * 40
+    (stats,) = session.pool_stats().values()
+    assert stats["requests"] == 40
+    assert stats["connections_opened"] <= 2
+
+def test_pool_stats_are_keyed_per_host(fake_jira):
+    _, url = fake_jira
+    session = make_session()
+    assert session.pool_stats() == {}
+
+    session.get(f"{url}/rest/api/3/myself")
+
+    assert list(session.pool_stats()) == [url]
+
+def test_handlers_share_the_process_wide_session(monkeypatch):
+    monkeypatch.setattr(jira_session_module, "_shared_session", None)
+
+    first = get_jira_session()
+    assert get_jira_session() is first
+
+    handler = Jira_Handler.__new__(Jira_Handler)
+    handler.session = first
+    assert handler.get_pool_stats() == first.pool_stats()
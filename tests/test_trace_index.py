@@ -0,0 +1,72 @@
+import json
+import pytest
+from integrations.jira.paginator import JiraPaginationError
+from integrations.jira.trace_index import TraceIndex
+
+TRACE_A = "trace_aaaaaaaaaaaa"
+TRACE_B = "trace_bbbbbbbbbbbb"
+
+class FakeJiraHandler:
+    """Answers trace index scans from a list of issues, optionally failing after `fail_after` issues."""
+
+    def __init__(self, issues, fail_after=None):
+        self.issues = issues
+        self.fail_after = fail_after
+        self.searches = []
+        self.backlog_searches = []
+
+    def iter_search_issues(self, jql, fields=None):
+        self.searches.append(jql)
+        for index, issue in enumerate(self.issues):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise JiraPaginationError("Jira returned 500 for a page")
+            yield issue
+
+    def search_jira_backlog(self, search_term):
+        self.backlog_searches.append(search_term)
+        return None
+
+def issue(key, summary):
+    return {"key": key, "fields": {"summary": summary}}
+
+def make_index(handler, path):
+    return TraceIndex(handler, project_key="SER", refresh_interval=60, snapshot_filepath=str(path))
+
+def test_warm_indexes_the_oldest_issue_per_trace(tmp_path):
+    handler = FakeJiraHandler([issue("SER-1", f"Error {TRACE_A}"), issue("SER-2", "No trace"), issue("SER-3", f"Again {TRACE_A}")])
+    index = make_index(handler, tmp_path / "trace_index.json")
+
+    assert index.warm() == 1
+    assert index.lookup(TRACE_A) == "SER-1"
+    assert handler.backlog_searches == []
+
+def test_snapshot_lets_a_restart_catch_up_incrementally(tmp_path):
+    path = tmp_path / "trace_index.json"
+    make_index(FakeJiraHandler([issue("SER-1", TRACE_A)]), path).warm()
+
+    handler = FakeJiraHandler([issue("SER-2", TRACE_B)])
+    index = make_index(handler, path)
+    index.refresh()
+
+    assert "updated >=" in handler.searches[0]
+    assert index.lookup(TRACE_A) == "SER-1"
+    assert index.lookup(TRACE_B) == "SER-2"
+    assert json.loads(path.read_text())["traces"] == {TRACE_A: "SER-1", TRACE_B: "SER-2"}
+
+def test_failed_scan_keeps_the_watermark(tmp_path):
+    index = make_index(FakeJiraHandler([issue("SER-1", TRACE_A)]), tmp_path / "trace_index.json")
+    index.warm()
+    watermark = index.last_refresh
+
+    index.jh = FakeJiraHandler([issue("SER-2", TRACE_B), issue("SER-3", "x")], fail_after=1)
+    with pytest.raises(JiraPaginationError):
+        index.refresh()
+
+    assert index.last_refresh == watermark
+
+def test_misses_fall_back_to_a_search(tmp_path):
+    handler = FakeJiraHandler([])
+    index = make_index(handler, tmp_path / "trace_index.json")
+
+    assert index.lookup(TRACE_A) is None
+    assert handler.backlog_searches == [TRACE_A]